@@ -3,6 +3,9 @@
 from openai import AsyncOpenAI
 
 from korean_config import logger, OPENAI_API_KEY
+import tts_cache
+
+TTS_MODEL: str = 'gpt-4o-mini-tts'
 
 # Initialize AsyncOpenAI client
 client = AsyncOpenAI(api_key=OPENAI_API_KEY)
@@ -12,7 +15,8 @@ async def generate_tts(text: str, voice: str = 'nova', korean_accent: bool = Fal
     """
     Generate TTS audio from text using OpenAI.
 
-    Uses the gpt-4o-mini-tts model for faster generation.
+    Uses the gpt-4o-mini-tts model for faster generation. Audio is cached by
+    model, voice, accent and text, so repeated exercises cost no API call.
 
     Args:
         text: Text to convert to speech
@@ -25,12 +29,12 @@ async def generate_tts(text: str, voice: str = 'nova', korean_accent: bool = Fal
     Raises:
         RuntimeError: If TTS generation fails
     """
-    try:
-        # Prepend accent instruction to text if requested
-        tts_text = f"[Speak very slowly with a Korean accent] {text}" if korean_accent else text
+    # Prepend accent instruction to text if requested
+    tts_text = f"[Speak very slowly with a Korean accent] {text}" if korean_accent else text
 
+    async def synthesize() -> bytes:
         response = await client.audio.speech.create(
-            model='gpt-4o-mini-tts',
+            model=TTS_MODEL,
             voice=voice,
             input=tts_text
         )
@@ -38,6 +42,10 @@ async def generate_tts(text: str, voice: str = 'nova', korean_accent: bool = Fal
         # response.content is the audio bytes
         return response.content
 
+    try:
+        key = tts_cache.make_key(TTS_MODEL, voice, korean_accent, text)
+        return await tts_cache.cached(key, synthesize)
+
     except Exception as e:
         logger.exception(f'Error generating TTS for text "{text[:50]}...": {e}')
         raise RuntimeError(f'Failed to generate audio: {e}')
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Benchmark: local Revised Romanization throughput in syllables per second."""
+
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import hangul
+
+SENTENCES: tuple[str, ...] = (
+    '안녕하세요, 만나서 반갑습니다.',
+    '저는 학교에 갑니다.',
+    '한국어를 공부하는 것이 재미있어요.',
+    '설날에 가족들과 같이 떡국을 먹었어요.',
+    '독립문 앞에서 친구를 기다리고 있었는데 비가 많이 왔습니다.',
+    '읽고 싶은 책이 없어서 도서관에 가지 않았어요.',
+)
+ROUNDS: int = 2000
+
+
+def main() -> None:
+    syllables = sum(1 for s in SENTENCES for c in s if hangul.is_syllable(c)) * ROUNDS
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for sentence in SENTENCES:
+            hangul.romanize(sentence)
+    elapsed = time.perf_counter() - start
+
+    for sentence in SENTENCES:
+        print(f'{sentence} -> {hangul.romanize(sentence)}')
+    print(f'\n{syllables:,} syllables in {elapsed:.3f}s '
+          f'({syllables / elapsed:,.0f} syllables/sec)')
+
+
+if __name__ == '__main__':
+    main()
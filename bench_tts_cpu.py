@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CPU cost per concurrent voice stream, FFmpeg PCM path vs Opus passthrough.
+
+Plays the same utterance through both paths the way discord.py's player
+thread consumes them, without the 20 ms pacing, on several threads at once:
+
+- mp3: FFmpegPCMAudio decodes to PCM, then discord.py encodes each frame to Opus
+- opus: OggOpusSource hands the packets over as they are
+
+Needs FFmpeg and libopus. Produce the inputs once with OpenAI TTS, e.g.
+response_format='mp3' and response_format='opus' for the same text.
+
+Usage:
+    python bench_tts_cpu.py speech.mp3 speech.opus [streams]
+"""
+
+import io
+import os
+import resource
+import sys
+import threading
+import time
+
+sys.path.insert(0, '.')
+
+import discord
+from discord.opus import Encoder
+
+from ogg_opus import OggOpusSource
+
+FFMPEG_PATH: str = os.getenv('FFMPEG_PATH') or 'ffmpeg'
+STREAMS: int = 4
+
+
+def _play_pcm(path: str, frames: list[int]) -> None:
+    source = discord.FFmpegPCMAudio(path, executable=FFMPEG_PATH)
+    encoder = Encoder()
+    count = 0
+    try:
+        while data := source.read():
+            encoder.encode(data, Encoder.SAMPLES_PER_FRAME)
+            count += 1
+    finally:
+        source.cleanup()
+    frames.append(count)
+
+
+def _play_opus(data: bytes, frames: list[int]) -> None:
+    source = OggOpusSource(io.BytesIO(data))
+    count = 0
+    while source.read():
+        count += 1
+    frames.append(count)
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _measure(label: str, target, arg, streams: int) -> None:
+    frames: list[int] = []
+    threads = [threading.Thread(target=target, args=(arg, frames)) for _ in range(streams)]
+
+    cpu_start, wall_start = _cpu_seconds(), time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu, wall = _cpu_seconds() - cpu_start, time.perf_counter() - wall_start
+
+    audio_seconds = sum(frames) * 0.02
+    print(
+        f'{label:>5}: {streams} streams, {audio_seconds:.1f}s of audio, '
+        f'{cpu:.3f}s CPU ({wall:.3f}s wall), '
+        f'{cpu / audio_seconds * 100:.3f}% of a core per playing stream'
+    )
+
+
+def main() -> None:
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    mp3_path, opus_path = sys.argv[1], sys.argv[2]
+    streams = int(sys.argv[3]) if len(sys.argv) > 3 else STREAMS
+
+    if not discord.opus.is_loaded() and not discord.opus._load_default():
+        sys.exit('libopus not found; the mp3 path needs it to encode PCM')
+    with open(opus_path, 'rb') as f:
+        opus_data = f.read()
+
+    _measure('mp3', _play_pcm, mp3_path, streams)
+    _measure('opus', _play_opus, opus_data, streams)
+
+
+if __name__ == '__main__':
+    main()
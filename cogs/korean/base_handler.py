@@ -1,6 +1,10 @@
 """Base handler class for Korean exercise channels."""
 
+import asyncio
+import random
+import time
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 import discord
 import aiohttp
 
@@ -14,8 +18,27 @@ from korean_state import (
     set_exercise,
     clear_exercise,
     clear_active_deck,
+    is_turn_queue_full,
+    user_turn,
+    run_tracked,
+    interrupt_session,
+    get_session_epoch,
 )
 
+# Keywords that are never treated as a deck name or an answer
+RESERVED_KEYWORDS: tuple[str, ...] = ('stop', 'skip', 'list', 'all')
+# Keywords that act on the session regardless of which exercise is pending
+SESSION_KEYWORDS: tuple[str, ...] = ('stop', 'list', 'all')
+# Keywords that abandon in-flight generation/grading (deck changes do too)
+INTERRUPT_KEYWORDS: tuple[str, ...] = ('stop', 'skip', 'all')
+# Words sampled from the active deck for each exercise
+MAX_EXERCISE_WORDS: int = 15
+# Minimum seconds between edits of a grade embed that is still streaming
+STREAM_EDIT_INTERVAL: float = 1.0
+
+# A prepared exercise and the optional file posted alongside it
+PreparedExercise = tuple[dict, discord.File | None]
+
 
 class ExerciseHandler(ABC):
     """Base class for exercise channel handlers."""
@@ -91,7 +114,93 @@ class ExerciseHandler(ABC):
 
     async def handle(self, message: discord.Message) -> None:
         """
-        Handle messages in exercise channel.
+        Handle messages in exercise channel, one message per user at a time.
+
+        A message is tied to the exercise that was pending when it arrived.
+        If an earlier message from the same user grades or replaces that
+        exercise first, the follow-up is coalesced into that turn instead of
+        being graded against (or generating) a second exercise. Messages
+        dropped this way, or because too many are queued, get a reply saying
+        they were not graded.
+
+        'stop', 'skip' and deck changes cancel the user's in-flight generation
+        or grading and drop any messages still queued behind it, even when
+        the queue is full.
+
+        Args:
+            message: Discord message
+        """
+        user_id = message.author.id
+        text = message.content.strip()
+        text_lower = text.lower()
+
+        deck_name = None
+        if text_lower not in RESERVED_KEYWORDS:
+            deck_name = anki_db.resolve_deck_name(text)
+
+        interrupted = False
+        if text_lower in INTERRUPT_KEYWORDS or deck_name:
+            interrupted = interrupt_session(user_id)
+
+        # Keywords and deck changes are never dropped, so 'stop' works on a full queue
+        if text_lower not in RESERVED_KEYWORDS and not deck_name and is_turn_queue_full(user_id):
+            logger.info(f'Dropped message {message.id}: user {user_id} has too many pending messages')
+            await self._reply_not_graded(
+                message, 'still working on your earlier messages. Send it again once they are answered.'
+            )
+            return
+
+        epoch_at_arrival = get_session_epoch(user_id)
+        exercise_at_arrival = get_exercise(user_id)
+        async with user_turn(user_id):
+            if get_session_epoch(user_id) != epoch_at_arrival:
+                logger.info(f'Dropped message {message.id} from user {user_id}: session was interrupted')
+                await self._reply_not_graded(message, 'the session was stopped, skipped or changed deck first.')
+                return
+
+            if (
+                text_lower not in SESSION_KEYWORDS
+                and not deck_name
+                and get_exercise(user_id) is not exercise_at_arrival
+            ):
+                logger.info(f'Coalesced follow-up message {message.id} from user {user_id}')
+                await self._reply_not_graded(
+                    message, 'an earlier message already answered that exercise. Answer the current one instead.'
+                )
+                return
+
+            await run_tracked(
+                user_id,
+                self._handle_turn(message, deck_name, interrupted)
+            )
+
+    async def _reply_not_graded(self, message: discord.Message, reason: str) -> None:
+        """
+        Tell the user a message was dropped without being graded.
+
+        Args:
+            message: The dropped message
+            reason: Why, as the end of a sentence starting 'Not graded: '
+        """
+        try:
+            await message.reply(
+                embed=discord.Embed(
+                    description=f'⏭️ Not graded: {reason}',
+                    color=discord.Color.light_grey()
+                ),
+                mention_author=False
+            )
+        except discord.HTTPException as e:
+            logger.warning(f'Could not reply to dropped message {message.id}: {e}')
+
+    async def _handle_turn(
+        self,
+        message: discord.Message,
+        deck_name: str | None,
+        interrupted: bool
+    ) -> None:
+        """
+        Handle a single message in exercise channel.
 
         Common flow for all exercise types:
         1. Check reserved keywords (stop, skip, list, all)
@@ -99,6 +208,11 @@ class ExerciseHandler(ABC):
         3. If no active deck, prompt for deck selection
         4. If exercise pending, grade response
         5. If no exercise, generate new one
+
+        Args:
+            message: Discord message
+            deck_name: Canonical deck name if the message names a deck
+            interrupted: True if this message cancelled in-flight work
         """
         user_id = message.author.id
         text = message.content.strip()
@@ -122,6 +236,9 @@ class ExerciseHandler(ABC):
             if exercise:
                 await self.post_skip_reveal(message.channel, exercise)
                 await self.generate_and_post_exercise(message, user_id)
+            elif interrupted:
+                # The exercise being generated was abandoned; start over
+                await self.generate_and_post_exercise(message, user_id)
             return
 
         if text_lower == 'list':
@@ -132,9 +249,8 @@ class ExerciseHandler(ABC):
             await self._handle_all(message, user_id)
             return
 
-        # 2. Try deck name resolution
+        # 2. Deck name (resolved in handle)
         try:
-            deck_name = anki_db.resolve_deck_name(text)
             if deck_name:
                 set_active_deck(user_id, deck_name)
                 clear_exercise(user_id)
@@ -291,18 +407,120 @@ class ExerciseHandler(ABC):
                 )
             )
 
-    # Abstract methods that subclasses must implement
+    # Exercise generation and grading flow
+
+    def _load_words(self, active_deck: str) -> list[dict]:
+        """
+        Load words for an exercise from the active deck.
+
+        Args:
+            active_deck: Active deck name ('All' for every deck)
+
+        Returns:
+            At most MAX_EXERCISE_WORDS randomly sampled word dicts
+        """
+        if active_deck == 'All':
+            words = anki_db.get_all_words()
+        else:
+            words = anki_db.get_words_in_deck(active_deck)
+
+        if len(words) > MAX_EXERCISE_WORDS:
+            words = random.sample(words, MAX_EXERCISE_WORDS)
+        return words
+
+    async def _prepare_exercise(self, active_deck: str) -> PreparedExercise | None:
+        """
+        Generate an exercise and its attachment without storing or posting it.
+
+        Args:
+            active_deck: Active deck name
+
+        Returns:
+            Prepared exercise, or None if the deck has no words
+        """
+        words = self._load_words(active_deck)
+        if not words:
+            return None
+
+        exercise = await self.generate_exercise(words)
+        exercise['type'] = self.exercise_type
+        exercise['deck'] = active_deck
+        attachment = await self.prepare_attachment(exercise)
+        return exercise, attachment
+
+    def _start_generation(self, user_id: int) -> asyncio.Task:
+        """
+        Start generating the user's next exercise in the background.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Task resolving to the prepared exercise
+        """
+        return asyncio.create_task(self._prepare_exercise(get_active_deck(user_id)))
+
+    async def _post_generated_exercise(
+        self,
+        message: discord.Message,
+        user_id: int,
+        generation: asyncio.Task
+    ) -> None:
+        """
+        Wait for a generation task, then store and post its exercise.
+
+        Args:
+            message: Discord message that triggered the exercise
+            user_id: Discord user ID
+            generation: Task from _start_generation
+        """
+        try:
+            async with message.channel.typing():
+                prepared = await generation
+
+            if prepared is None:
+                await message.channel.send(
+                    embed=discord.Embed(
+                        title='❌ Empty Deck',
+                        description=f'Deck **{get_active_deck(user_id)}** has no words.',
+                        color=discord.Color.red()
+                    )
+                )
+                return
+
+            exercise, attachment = prepared
+            set_exercise(user_id, exercise)
+            await self.post_exercise(message.channel, exercise, attachment)
+            logger.info(f'Generated {self.exercise_type} exercise for user {user_id} in deck {exercise["deck"]}')
+
+        except Exception as e:
+            logger.exception(f'Error generating {self.exercise_type} exercise: {e}')
+            await message.channel.send(
+                embed=discord.Embed(
+                    title='❌ Generation Failed',
+                    description='Could not generate exercise. Try again.',
+                    color=discord.Color.red()
+                )
+            )
 
-    @abstractmethod
     async def generate_and_post_exercise(
         self,
         message: discord.Message,
         user_id: int
     ) -> None:
-        """Generate and post exercise. Must be implemented by subclass."""
-        pass
+        """
+        Generate and post a new exercise.
+
+        Args:
+            message: Discord message that triggered the exercise
+            user_id: Discord user ID
+        """
+        await self._post_generated_exercise(
+            message,
+            user_id,
+            self._start_generation(user_id)
+        )
 
-    @abstractmethod
     async def grade_and_continue(
         self,
         message: discord.Message,
@@ -310,7 +528,182 @@ class ExerciseHandler(ABC):
         exercise: dict,
         student_answer: str
     ) -> None:
-        """Grade response and generate next exercise. Must be implemented by subclass."""
+        """
+        Grade a response and post the next exercise.
+
+        The next exercise does not depend on the grade, so it is generated
+        concurrently with grading. The grade is still posted first. If grading
+        fails (or the turn is cancelled) the pending generation is cancelled.
+
+        Args:
+            message: Discord message containing the answer
+            user_id: Discord user ID
+            exercise: Pending exercise dict
+            student_answer: Student's answer text
+        """
+        next_exercise = self._start_generation(user_id)
+        try:
+            result = await self.post_grade(message, user_id, exercise, student_answer)
+            logger.info(f'Graded {self.exercise_type} for user {user_id}: score {result.get("score", 0)}')
+
+        except Exception as e:
+            next_exercise.cancel()
+            logger.exception(f'Error grading {self.exercise_type}: {e}')
+            await message.channel.send(
+                embed=discord.Embed(
+                    title='❌ Grading Failed',
+                    description='Could not grade response. Try again.',
+                    color=discord.Color.red()
+                )
+            )
+            return
+
+        except BaseException:
+            next_exercise.cancel()
+            raise
+
+        await self._post_generated_exercise(message, user_id, next_exercise)
+
+    async def post_grade(
+        self,
+        message: discord.Message,
+        user_id: int,
+        exercise: dict,
+        student_answer: str
+    ) -> dict:
+        """
+        Grade a response, clear the pending exercise and post the grade.
+
+        Override to post the grade differently (e.g. streamed).
+
+        Args:
+            message: Discord message containing the answer
+            user_id: Discord user ID
+            exercise: Pending exercise dict
+            student_answer: Student's answer text
+
+        Returns:
+            Grade result dict
+        """
+        async with message.channel.typing():
+            result = await self.grade_response(exercise, student_answer)
+
+        clear_exercise(user_id)
+        await message.channel.send(
+            embed=self.build_grade_embed(exercise, student_answer, result)
+        )
+        return result
+
+    async def post_streamed_grade(
+        self,
+        message: discord.Message,
+        user_id: int,
+        exercise: dict,
+        student_answer: str,
+        updates: AsyncIterator[dict]
+    ) -> dict:
+        """
+        Post a grade as it streams in, editing the embed as it grows.
+
+        The embed is posted as soon as the score is known and then edited at
+        most once per STREAM_EDIT_INTERVAL; the final grade is always shown.
+
+        Args:
+            message: Discord message containing the answer
+            user_id: Discord user ID
+            exercise: Pending exercise dict
+            student_answer: Student's answer text
+            updates: Partial grade dicts, the last one complete
+
+        Returns:
+            Final grade result dict
+        """
+        result: dict = {}
+        sent: discord.Message | None = None
+        shown: dict | None = None
+        last_edit = 0.0
+
+        async with message.channel.typing():
+            async for result in updates:
+                if 'score' not in result:
+                    continue
+                if sent is not None and time.monotonic() - last_edit < STREAM_EDIT_INTERVAL:
+                    continue
+                embed = self.build_grade_embed(exercise, student_answer, result)
+                if sent is None:
+                    sent = await message.channel.send(embed=embed)
+                elif embed.to_dict() != shown:
+                    await sent.edit(embed=embed)
+                shown = embed.to_dict()
+                last_edit = time.monotonic()
+
+        clear_exercise(user_id)
+        embed = self.build_grade_embed(exercise, student_answer, result)
+        if sent is None:
+            await message.channel.send(embed=embed)
+        elif embed.to_dict() != shown:
+            await sent.edit(embed=embed)
+        return result
+
+    @staticmethod
+    def score_color(score: int) -> discord.Color:
+        """
+        Pick the grade embed color for a score.
+
+        Args:
+            score: Score out of 100
+
+        Returns:
+            Green for 80+, orange for 50+, red otherwise
+        """
+        if score >= 80:
+            return discord.Color.green()
+        elif score >= 50:
+            return discord.Color.orange()
+        return discord.Color.red()
+
+    async def prepare_attachment(self, exercise: dict) -> discord.File | None:
+        """
+        Prepare a file to post with the exercise (e.g. TTS audio).
+
+        Args:
+            exercise: Generated exercise dict
+
+        Returns:
+            File to attach, or None. Default: no attachment.
+        """
+        return None
+
+    # Abstract methods that subclasses must implement
+
+    @abstractmethod
+    async def generate_exercise(self, words: list[dict]) -> dict:
+        """Generate exercise content from sampled words. Must be implemented by subclass."""
+        pass
+
+    @abstractmethod
+    async def post_exercise(
+        self,
+        channel: discord.TextChannel,
+        exercise: dict,
+        attachment: discord.File | None
+    ) -> None:
+        """Post exercise embed. Must be implemented by subclass."""
+        pass
+
+    @abstractmethod
+    async def grade_response(self, exercise: dict, student_answer: str) -> dict:
+        """Grade a student answer. Must be implemented by subclass."""
+        pass
+
+    @abstractmethod
+    def build_grade_embed(
+        self,
+        exercise: dict,
+        student_answer: str,
+        result: dict
+    ) -> discord.Embed:
+        """Build the grade result embed. Must be implemented by subclass."""
         pass
 
     @abstractmethod
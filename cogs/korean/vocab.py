@@ -4,6 +4,7 @@ import discord
 
 from korean_config import logger
 import gpt
+import korean_state
 
 
 async def handle(message: discord.Message) -> None:
@@ -17,7 +18,7 @@ async def handle(message: discord.Message) -> None:
         return
 
     try:
-        async with message.channel.typing():
+        async with korean_state.work_slot(), message.channel.typing():
             vocab_list = await gpt.generate_vocab_list(message.content)
 
         if not vocab_list:
@@ -14,8 +14,38 @@ load_dotenv(dotenv_path=Path(__file__).parent / '.env')
 # ============================================================================
 
 BOT_MENTION_ID: str = '<@1064717164579393577>'
-MAX_MESSAGE_HISTORY: int = 500
+MAX_MESSAGE_HISTORY: int = 500  # Messages kept per channel for !summarize and !check
 MAX_CONTEXT_MESSAGES: int = 10
+MAX_CONCURRENT_SPENCERBOT_TASKS: int = 4  # In-flight SpencerBot pipelines
+CONVERSATION_TOKEN_BUDGET: int = 4000  # Chat history tokens sent with each GPT chat request
+CONVERSATION_SUMMARY_WORDS: int = 200  # Target length of a conversation's rolling summary
+SUMMARY_CHUNK_TOKENS: int = 3000  # Thread tokens summarized per request by !summarize
+MAX_CONCURRENT_SUMMARY_CHUNKS: int = 4  # Chunk summaries in flight per !summarize
+SUMMARY_CACHE_SIZE: int = 256  # Chunk summaries kept for re-summarizing growing threads
+
+
+def _parse_channel_limits(raw: str) -> dict[int, int]:
+    """
+    Parse per-channel history limits from 'channel_id:limit,channel_id:limit'.
+
+    Args:
+        raw: Comma-separated pairs (empty for none)
+
+    Returns:
+        Mapping of channel ID to message limit
+    """
+    limits = {}
+    for pair in filter(None, (part.strip() for part in raw.split(','))):
+        try:
+            channel_id, limit = pair.split(':')
+            limits[int(channel_id)] = int(limit)
+        except ValueError:
+            raise ValueError(f'Invalid CHANNEL_HISTORY_LIMITS entry: {pair!r}')
+    return limits
+
+
+# Per-channel overrides of MAX_MESSAGE_HISTORY
+CHANNEL_HISTORY_LIMITS: dict[int, int] = _parse_channel_limits(os.getenv('CHANNEL_HISTORY_LIMITS', ''))
 
 # API Keys and Tokens
 DISCORD_TOKEN: str = os.getenv('DISCORD_TOKEN', '')
@@ -53,6 +83,42 @@ REACTION_THINKING: str = "🤔"
 
 DOMINOS_TRACKER_FILE: str = 'dominos.txt'
 
+# ============================================================================
+# MESSAGE STORE
+# ============================================================================
+
+MESSAGE_STORE_PATH: str = os.getenv('MESSAGE_STORE_PATH', 'messages.db')  # SQLite file
+MESSAGE_STORE_BATCH_SIZE: int = 100  # Messages written per transaction
+MESSAGE_STORE_FLUSH_INTERVAL: float = 1.0  # Seconds a message may wait before being written
+MESSAGE_RETENTION_DAYS: int = 90  # Stored messages older than this are deleted
+MESSAGE_STORE_CHANNEL_LIMIT: int = 50_000  # Stored messages kept per channel
+MAX_STORED_THREAD_MESSAGES: int = 2000  # Messages read back for one !summarize
+
+# ============================================================================
+# VOICE PLAYBACK
+# ============================================================================
+
+VOICE_QUEUE_DEPTH: int = 4  # Clips waiting per guild behind the one playing
+VOICE_QUEUE_DROP_POLICY: str = 'oldest'  # Drop the 'oldest' waiting clip or the 'newest' when full
+TTS_DEBOUNCE_WINDOW: float = 0.8  # Seconds of quiet before a user's messages are spoken
+TTS_DEBOUNCE_MAX_DELAY: float = 3.0  # Longest a message waits to be merged with later ones
+TTS_DEBOUNCE_MAX_CHARS: int = 400  # Longest merged utterance
+VOICE_IDLE_TIMEOUT: float = float(os.getenv('VOICE_IDLE_TIMEOUT', '600'))  # Seconds without playback before leaving voice
+
+# ============================================================================
+# TTS CACHE
+# ============================================================================
+
+# 'opus' plays OpenAI's Ogg Opus packets as is; 'mp3' decodes and re-encodes through FFmpeg
+TTS_FORMAT: str = os.getenv('TTS_FORMAT', 'opus')
+TTS_FIRST_CHUNK_CHARS: int = 100  # Long texts are spoken in chunks; a short first one starts playback sooner
+TTS_CHUNK_CHARS: int = 300  # Longest later chunk (whole sentences where possible)
+TTS_MAX_CONCURRENT_SYNTHESES: int = 3  # Speech requests streaming at once
+TTS_PREBUFFER_BYTES: int = 8 * 1024  # Streamed audio buffered before playback starts, so the player's clock isn't stalled
+TTS_CACHE_DIR: str = os.getenv('TTS_CACHE_DIR', 'tts_cache')  # Synthesized speech files, named by content hash
+TTS_CACHE_MAX_BYTES: int = 200 * 1024 * 1024  # Disk budget; least recently used files are evicted
+TTS_CACHE_MEMORY_BYTES: int = 16 * 1024 * 1024  # Audio also kept in memory for instant replay
+
 # ============================================================================
 # TIME PERIODS (SECONDS)
 # ============================================================================
@@ -0,0 +1,154 @@
+"""Token-budgeted GPT chat history with rolling summarization for SpencerBot."""
+
+import asyncio
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+import oai
+from config import logger, CONVERSATION_TOKEN_BUDGET, CONVERSATION_SUMMARY_WORDS
+
+# Tokens per message for role and formatting overhead
+MESSAGE_OVERHEAD_TOKENS: int = 4
+# Share of the budget kept verbatim after older turns are summarized
+KEEP_RATIO: float = 0.5
+SUMMARY_MODEL: str = 'gpt-5-mini'
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text without calling a tokenizer.
+
+    English averages about four characters per token; Hangul, CJK and other
+    non-ASCII characters are counted as a token each, which errs high.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return math.ceil((len(text) - non_ascii) / 4) + non_ascii
+
+
+@dataclass
+class Conversation:
+    """
+    GPT chat history for one channel, kept within a token budget.
+
+    When the turns outgrow CONVERSATION_TOKEN_BUDGET, the oldest are folded
+    into a rolling summary by a background task; until it finishes they are
+    still sent (trimmed to the budget), so no request waits for it.
+
+    Attributes:
+        summary: Summary of turns that are no longer kept verbatim
+        turns: Recent user/assistant messages, oldest first
+    """
+    summary: str = ''
+    turns: list[dict[str, str]] = field(default_factory=list)
+    _turn_tokens: list[int] = field(default_factory=list, repr=False)
+    _summarizing: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def add(self, role: str, content: str) -> None:
+        """
+        Append a turn and start summarizing if the budget is exceeded.
+
+        Args:
+            role: 'user' or 'assistant'
+            content: Message text
+        """
+        self.turns.append({'role': role, 'content': content})
+        self._turn_tokens.append(estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS)
+        self._maybe_summarize()
+
+    def messages(self) -> list[dict[str, str]]:
+        """
+        Build the messages to send: the summary, then as many recent turns
+        as fit in the budget (always at least the latest one).
+
+        Returns:
+            Chat messages for the completion request
+        """
+        budget = CONVERSATION_TOKEN_BUDGET
+        prefix = []
+        if self.summary:
+            prefix.append({
+                'role': 'system',
+                'content': f'Summary of the earlier conversation: {self.summary}',
+            })
+            budget -= estimate_tokens(self.summary) + MESSAGE_OVERHEAD_TOKENS
+
+        start = len(self.turns)
+        while start > 0:
+            cost = self._turn_tokens[start - 1]
+            if cost > budget and start < len(self.turns):
+                break
+            budget -= cost
+            start -= 1
+        return prefix + self.turns[start:]
+
+    def token_count(self) -> int:
+        """
+        Estimate the tokens held verbatim.
+
+        Returns:
+            Token estimate of all turns
+        """
+        return sum(self._turn_tokens)
+
+    def _maybe_summarize(self) -> None:
+        """Fold the oldest turns into the summary in the background if over budget."""
+        if self._summarizing is not None or self.token_count() <= CONVERSATION_TOKEN_BUDGET:
+            return
+
+        # Keep the newest turn, plus older ones while they fit in KEEP_RATIO of the budget
+        split = len(self.turns) - 1
+        keep_tokens = self._turn_tokens[split]
+        keep_budget = CONVERSATION_TOKEN_BUDGET * KEEP_RATIO
+        while split > 0 and keep_tokens + self._turn_tokens[split - 1] <= keep_budget:
+            keep_tokens += self._turn_tokens[split - 1]
+            split -= 1
+        if split == 0:
+            return
+
+        self._summarizing = asyncio.create_task(self._summarize(split))
+        self._summarizing.add_done_callback(self._summary_done)
+
+    async def _summarize(self, count: int) -> None:
+        """
+        Replace the oldest turns with an updated summary.
+
+        Args:
+            count: Number of oldest turns to fold in
+        """
+        transcript = '\n'.join(f'{t["role"]}: {t["content"]}' for t in self.turns[:count])
+        try:
+            self.summary = await oai.call_gpt_async(
+                [{
+                    'role': 'user',
+                    'content': (
+                        f'Earlier summary: {self.summary or "(none)"}\n\n'
+                        f'Conversation to add:\n{transcript}'
+                    ),
+                }],
+                preface=(
+                    'Update the summary of a chat between users and an assistant. '
+                    f'Keep names, facts, decisions and open questions. At most '
+                    f'{CONVERSATION_SUMMARY_WORDS} words. Reply with the summary only.'
+                ),
+                model=SUMMARY_MODEL,
+            )
+        except Exception as e:
+            # Dropping the turns keeps the history bounded even if summarizing keeps failing
+            logger.warning(f'Conversation summary failed, dropping {count} old turns: {e}')
+
+        # Turns are only ever appended, so the oldest count are still the ones summarized
+        del self.turns[:count]
+        del self._turn_tokens[:count]
+
+    def _summary_done(self, task: asyncio.Task) -> None:
+        """Clear the finished task and continue if still over budget."""
+        self._summarizing = None
+        if not task.cancelled():
+            self._maybe_summarize()
@@ -1,22 +1,21 @@
 """Discord API utility functions for SpencerBot."""
 
-import asyncio
-import os
-from pathlib import Path
-from typing import Optional, Callable, Union
+import re
+import time
+from typing import AsyncIterator, Awaitable, Optional, Callable, Union
 
 import discord
 from discord.ext import commands
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv(dotenv_path=Path(__file__).parent / '.env')
+import voice
 
 # Constants
-FFMPEG_PATH: Optional[str] = os.getenv('FFMPEG_PATH')
 MAX_MESSAGE_LENGTH: int = 2000
 CHUNK_SIZE: int = 1999  # Leave room for safety margin
-VOICE_CONNECTION_DELAY: float = 0.5  # Seconds to wait after connecting
+STREAM_EDIT_INTERVAL: float = 1.0  # Seconds between edits of a streaming reply
+
+# End of the first sentence of a streamed reply
+_SENTENCE_END = re.compile(r'[.!?](?:\s|$)|\n')
 
 
 # ============================================================================
@@ -39,6 +38,79 @@ async def reply(message: discord.Message, content: Union[str, discord.File]) ->
         await message.channel.send(file=content)
 
 
+def _split_for_rollover(text: str) -> tuple[str, str]:
+    """
+    Split text that has outgrown one Discord message.
+
+    Prefers the last line break, then the last space, in the second half of
+    the first CHUNK_SIZE characters, so words are not cut in two.
+
+    Args:
+        text: Text longer than CHUNK_SIZE
+
+    Returns:
+        (head to send now, remainder for the next message)
+    """
+    window = text[:CHUNK_SIZE]
+    cut = max(window.rfind('\n'), window.rfind(' '))
+    if cut < CHUNK_SIZE // 2:
+        cut = CHUNK_SIZE
+    return text[:cut], text[cut:].lstrip()
+
+
+async def stream_reply(message: discord.Message, chunks: AsyncIterator[str]) -> str:
+    """
+    Reply with text that is still being generated.
+
+    The reply is posted once the first sentence is complete and then edited
+    at most once per STREAM_EDIT_INTERVAL. When it outgrows the 2000-char
+    limit it is finished and the rest continues in a new message.
+
+    Args:
+        message: Discord message to reply to
+        chunks: Text pieces in order
+
+    Returns:
+        The complete reply text
+    """
+    pieces: list[str] = []
+    current = ''  # Text of the message being streamed
+    shown = ''  # Text currently visible in that message
+    sent: Optional[discord.Message] = None
+    posted_any = False
+    last_edit = 0.0
+
+    async for chunk in chunks:
+        pieces.append(chunk)
+        current += chunk
+
+        while len(current) > CHUNK_SIZE:
+            head, current = _split_for_rollover(current)
+            if sent is None:
+                await message.channel.send(head)
+            elif head != shown:
+                await sent.edit(content=head)
+            sent, shown, posted_any = None, '', True
+
+        if not current.strip():
+            continue
+        if sent is None:
+            if posted_any or _SENTENCE_END.search(current):
+                sent = await message.channel.send(current)
+                shown, posted_any, last_edit = current, True, time.monotonic()
+        elif current != shown and time.monotonic() - last_edit >= STREAM_EDIT_INTERVAL:
+            await sent.edit(content=current)
+            shown, last_edit = current, time.monotonic()
+
+    if current.strip():
+        if sent is None:
+            await message.channel.send(current)
+        elif current != shown:
+            await sent.edit(content=current)
+
+    return ''.join(pieces).strip()
+
+
 async def react(message: discord.Message, emoji: str) -> None:
     """
     Add a reaction to a message.
@@ -54,50 +126,39 @@ async def react(message: discord.Message, emoji: str) -> None:
 # VOICE UTILITIES
 # ============================================================================
 
-async def speak(ctx: commands.Context, bot: commands.Bot, audio_path: str) -> None:
+async def speak(
+    ctx: commands.Context,
+    *parts: Callable[[], Awaitable[voice.AudioInput]]
+) -> bool:
     """
-    Join voice channel and play audio file.
+    Queue audio to play in the author's voice channel.
 
-    Automatically connects to the user's voice channel, switches channels if needed,
-    and plays the specified audio file using FFmpeg.
+    Clips play in order per guild (see voice.GuildPlayer); the audio starts
+    preparing immediately, so it is ready by the time earlier clips finish.
 
     Args:
         ctx: Command context containing author and guild info
-        bot: Bot instance with voice client access
-        audio_path: Path to audio file to play
+        *parts: Coroutine functions returning a file path or file-like audio
+            stream, played back to back as one clip
 
     Returns:
-        None if user is not in a voice channel
+        False if the author is not in a voice channel or the queue dropped the clip
     """
     if ctx.author.voice is None:
-        return
-
-    voice_channel = ctx.author.voice.channel
-    voice_client = discord.utils.get(bot.voice_clients, guild=ctx.guild)
+        return False
 
-    # Handle existing connection
-    if voice_client:
-        if voice_client.channel != voice_channel:
-            await voice_client.move_to(voice_channel)
+    return voice.player_for(ctx.guild).enqueue(ctx.author.voice.channel, *parts)
 
-        if voice_client.is_playing():
-            voice_client.stop()
-    else:
-        # Clean up any stale connections
-        stale_clients = [vc for vc in bot.voice_clients if vc.guild == ctx.guild]
-        for vc in stale_clients:
-            await vc.disconnect(force=True)
 
-        # Connect to voice channel
-        voice_client = await voice_channel.connect(self_deaf=True, timeout=30.0)
-        await asyncio.sleep(VOICE_CONNECTION_DELAY)
+def stop_playback(guild: Optional[discord.Guild]) -> None:
+    """
+    Stop playback and drop queued clips, staying in the voice channel.
 
-    # Play audio file
-    audio_source = discord.FFmpegPCMAudio(
-        source=audio_path,
-        executable=FFMPEG_PATH
-    )
-    voice_client.play(audio_source)
+    Args:
+        guild: Guild to stop playback in (None outside a guild)
+    """
+    if guild is not None:
+        voice.player_for(guild).clear()
 
 
 async def disconnect(ctx: commands.Context, bot: commands.Bot) -> None:
@@ -115,6 +176,7 @@ async def disconnect(ctx: commands.Context, bot: commands.Bot) -> None:
     voice_client = discord.utils.get(bot.voice_clients, guild=ctx.guild)
 
     if voice_client:
+        voice.player_for(ctx.guild).close()
         await voice_client.disconnect()
         await ctx.send("Disconnected from the voice channel.")
     else:
@@ -1,12 +1,15 @@
 """Event handlers for SpencerBot and Korean Language Learning Bot."""
 
 import asyncio
+from typing import Optional
+
 import discord
 from discord.ext import commands
 
 from config import (
     logger,
     BOT_MENTION_ID,
+    MAX_CONCURRENT_SPENCERBOT_TASKS,
     REACTION_PIZZA,
     REACTION_CRY,
     REACTION_SPEAKER,
@@ -14,13 +17,15 @@ from config import (
     REACTION_CHECKMARK,
     REACTION_THINKING,
 )
-from state import BotState
+from state import BotState, MessageDict
+import stage_timings
 from utils import build_message
 from handlers import (
     cmd_dominos,
     cmd_relapse,
     cmd_toggle_speak,
     cmd_speak,
+    cmd_stop,
     cmd_leave,
     cmd_summarize,
     cmd_fact_check,
@@ -44,6 +49,7 @@ from korean_config import (
     ANKIWEB_PASS,
     ANKI_PROFILE,
 )
+import korean_state
 import anki_manager
 from cogs.korean import (
     vocab,
@@ -81,99 +87,149 @@ def setup_events(bot: commands.Bot, bot_state: BotState) -> None:
 
     @bot.event
     async def on_ready() -> None:
-        """Log bot readiness."""
+        """Seed the member name cache and log bot readiness."""
+        bot_state.member_names.update(
+            (member.id, member.name) for member in bot.get_all_members()
+        )
+        logger.info(f'Cached names for {len(bot_state.member_names)} members')
         logger.info('Korean Language Learning Bot active')
         logger.info(f'Korean bot restricted to guild ID: {ALLOWED_GUILD_ID}')
 
     @bot.event
-    async def on_message(message: discord.Message) -> None:
+    async def on_member_join(member: discord.Member) -> None:
+        """Cache a new member's name for mention resolution."""
+        bot_state.member_names[member.id] = member.name
+
+    @bot.event
+    async def on_member_update(before: discord.Member, after: discord.Member) -> None:
+        """Keep the cached name current."""
+        bot_state.member_names[after.id] = after.name
+
+    @bot.event
+    async def on_user_update(before: discord.User, after: discord.User) -> None:
+        """Keep the cached name current after a username change."""
+        if after.id in bot_state.member_names:
+            bot_state.member_names[after.id] = after.name
+
+    # Each pipeline gets its own concurrency limit so a slow SpencerBot request
+    # (GPT chat, TTS) never delays Korean exercise grading and vice versa; the
+    # Korean limit is korean_state.work_slot, taken around the work itself
+    spencerbot_slots = asyncio.Semaphore(MAX_CONCURRENT_SPENCERBOT_TASKS)
+    pipeline_tasks: set[asyncio.Task] = set()
+
+    def dispatch(coro, name: str) -> None:
         """
-        Main message handler for both SpencerBot and Korean Language Learning Bot.
+        Run a message pipeline as an independent task.
+
+        Keeps a reference to the task until it finishes so it is not garbage
+        collected mid-flight.
+
+        Args:
+            coro: Pipeline coroutine to run
+            name: Task name for debugging
+        """
+        task = asyncio.create_task(coro, name=name)
+        pipeline_tasks.add(task)
+        task.add_done_callback(pipeline_tasks.discard)
+
+    async def handle_spencerbot(
+        message: discord.Message,
+        new_message: MessageDict,
+        mentioned: bool,
+        speaks: bool
+    ) -> None:
+        """
+        SpencerBot pipeline: TTS and mention commands.
+
+        The command context is only built when TTS or a voice command needs it.
 
         Args:
             message: Discord message object
+            new_message: The message as recorded in history
+            mentioned: Whether the message starts with the bot mention
+            speaks: Whether the author has TTS enabled
         """
-        # Ignore own messages
-        if message.author == bot.user:
-            return
+        ctx: Optional[commands.Context] = None
+
+        async def context() -> commands.Context:
+            """Build the command context on first use."""
+            nonlocal ctx
+            if ctx is None:
+                with stage_timings.timed('context'):
+                    ctx = await bot.get_context(message)
+            return ctx
 
-        # ============================================================================
-        # SPENCERBOT MESSAGE HANDLING
-        # ============================================================================
         try:
-            ctx = await bot.get_context(message)
             text = message.content.replace(BOT_MENTION_ID, '').strip()
 
-            # Build and store message
-            new_message = build_message(ctx, message, text)
-            bot_state.all_messages.append(new_message)
+            # Only the expensive stages (TTS, commands, GPT chat) are limited
+            async with spencerbot_slots:
+                # Parse command
+                if ' ' in text:
+                    input_cmd, input_text = text.split(' ', 1)
+                else:
+                    input_cmd, input_text = text, None
 
-            # Parse command
-            if ' ' in text:
-                input_cmd, input_text = text.split(' ', 1)
-            else:
-                input_cmd, input_text = text, None
-
-            # Handle TTS for enabled users
-            if bot_state.is_tts_enabled(message.author.id):
-                await cmd_speak(message, ctx, bot, text)
-
-            # Process SpencerBot commands if mentioned
-            if message.content.startswith(BOT_MENTION_ID):
-                # Helper for command routing
-                async def send_command(
-                    cmd_name: str,
-                    reaction: str,
-                    fn
-                ) -> bool:
-                    """Route command to handler with reaction."""
-                    return await command(message, input_cmd, cmd_name, reaction, fn)
-
-                # Command routing
-                command_list = [
-                    await send_command('dominos', REACTION_PIZZA, cmd_dominos),
-                    await send_command('relapse', REACTION_CRY, cmd_relapse),
-                    await send_command(
-                        'st',
-                        REACTION_SPEAKER,
-                        lambda: cmd_toggle_speak(
+                # Handle TTS for enabled users
+                if speaks:
+                    await cmd_speak(message, await context(), bot, text, bot_state)
+
+                # Process SpencerBot commands if mentioned
+                if mentioned:
+                    # Helper for command routing
+                    async def send_command(
+                        cmd_name: str,
+                        reaction: str,
+                        fn
+                    ) -> bool:
+                        """Route command to handler with reaction."""
+                        return await command(message, input_cmd, cmd_name, reaction, fn)
+
+                    async def toggle_speak() -> str:
+                        """Toggle TTS for the author."""
+                        return await cmd_toggle_speak(
                             message.author.id,
                             bot_state,
-                            ctx,
+                            await context(),
                             bot
                         )
-                    ),
-                    await send_command(
-                        'l',
-                        REACTION_SPEAKER,
-                        lambda: cmd_leave(ctx, bot)
-                    ),
-                    await send_command(
-                        'stop',
-                        REACTION_SPEAKER,
-                        lambda: cmd_leave(ctx, bot)
-                    ),
-                    await send_command(
-                        'summarize',
-                        REACTION_CLIPBOARD,
-                        lambda: cmd_summarize(new_message, bot_state)
-                    ),
-                    await send_command(
-                        'check',
-                        REACTION_CHECKMARK,
-                        lambda: cmd_fact_check(new_message, bot_state)
-                    ),
-                ]
-
-                # Default to GPT chat if no command matched
-                if not any(command_list):
-                    await command(
-                        message,
-                        text,
-                        None,
-                        REACTION_THINKING,
-                        lambda: cmd_gpt_chat(bot_state, text)
-                    )
+
+                    async def leave() -> None:
+                        """Leave the voice channel."""
+                        await cmd_leave(await context(), bot)
+
+                    # Command routing
+                    command_list = [
+                        await send_command('dominos', REACTION_PIZZA, cmd_dominos),
+                        await send_command('relapse', REACTION_CRY, cmd_relapse),
+                        await send_command('st', REACTION_SPEAKER, toggle_speak),
+                        await send_command('l', REACTION_SPEAKER, leave),
+                        await send_command(
+                            'stop',
+                            REACTION_SPEAKER,
+                            lambda: cmd_stop(message.guild)
+                        ),
+                        await send_command(
+                            'summarize',
+                            REACTION_CLIPBOARD,
+                            lambda: cmd_summarize(new_message, bot_state)
+                        ),
+                        await send_command(
+                            'check',
+                            REACTION_CHECKMARK,
+                            lambda: cmd_fact_check(new_message, bot_state)
+                        ),
+                    ]
+
+                    # Default to GPT chat if no command matched
+                    if not any(command_list):
+                        await command(
+                            message,
+                            text,
+                            None,
+                            REACTION_THINKING,
+                            lambda: cmd_gpt_chat(bot_state, text, message)
+                        )
 
         except discord.DiscordException as e:
             logger.error(f"Discord API error in on_message: {e}")
@@ -181,14 +237,17 @@ def setup_events(bot: commands.Bot, bot_state: BotState) -> None:
             logger.exception(
                 f"Unexpected error processing message {message.id}: {e}"
             )
+        finally:
+            if ctx is None:
+                stage_timings.skip('context')
 
-        # ============================================================================
-        # KOREAN BOT MESSAGE HANDLING
-        # ============================================================================
-        # Only process Korean bot in allowed guild
-        if message.guild is None or message.guild.id != ALLOWED_GUILD_ID:
-            return
+    async def handle_korean(message: discord.Message) -> None:
+        """
+        Korean bot pipeline: !sync and exercise channel routing.
 
+        Args:
+            message: Discord message object
+        """
         try:
             # Check for !sync command
             if message.content.strip().lower() == '!sync':
@@ -197,13 +256,14 @@ def setup_events(bot: commands.Bot, bot_state: BotState) -> None:
 
                 # Run sync in executor to avoid blocking
                 loop = asyncio.get_event_loop()
-                success, sync_message = await loop.run_in_executor(
-                    None,
-                    anki_manager.sync_to_ankiweb,
-                    ANKI_PROFILE,
-                    ANKIWEB_USER,
-                    ANKIWEB_PASS
-                )
+                async with korean_state.work_slot():
+                    success, sync_message = await loop.run_in_executor(
+                        None,
+                        anki_manager.sync_to_ankiweb,
+                        ANKI_PROFILE,
+                        ANKIWEB_USER,
+                        ANKIWEB_PASS
+                    )
 
                 if success:
                     await message.channel.send(f'✅ {sync_message}')
@@ -213,7 +273,8 @@ def setup_events(bot: commands.Bot, bot_state: BotState) -> None:
                     logger.error(f'AnkiWeb sync failed for user {message.author.id}: {sync_message}')
                 return
 
-            # Route to Korean learning channel handlers
+            # Route to Korean learning channel handlers; exercise handlers take
+            # a work slot only once it is the user's turn
             handler = korean_channel_map.get(message.channel.id)
             if handler:
                 await handler(message)
@@ -244,6 +305,55 @@ def setup_events(bot: commands.Bot, bot_state: BotState) -> None:
             except Exception:
                 pass
 
+    @bot.event
+    async def on_message(message: discord.Message) -> None:
+        """
+        Main message handler for both SpencerBot and Korean Language Learning Bot.
+
+        Every message is recorded in history first, in arrival order. A cheap
+        pre-filter then decides which pipelines the message needs and
+        dispatches them as independent tasks so neither waits on the other.
+        Messages that neither mention the bot nor are spoken skip the
+        SpencerBot pipeline (slot, context) entirely.
+
+        Args:
+            message: Discord message object
+        """
+        # Ignore own messages
+        if message.author == bot.user:
+            return
+
+        with stage_timings.timed('prefilter'):
+            mentioned = message.content.startswith(BOT_MENTION_ID)
+            speaks = bot_state.is_tts_enabled(message.author.id)
+            korean = (
+                message.guild is not None
+                and message.guild.id == ALLOWED_GUILD_ID
+                and (
+                    message.channel.id in korean_channel_map
+                    or message.content.strip().lower() == '!sync'
+                )
+            )
+
+        # Store every message, Korean exercise channels included, so summarize
+        # and fact-check see the whole conversation
+        with stage_timings.timed('history'):
+            text = message.content.replace(BOT_MENTION_ID, '').strip()
+            new_message = build_message(message, text, bot_state.member_names)
+            bot_state.history.append(new_message)
+            bot_state.message_store.record(new_message)
+
+        if mentioned or speaks:
+            dispatch(
+                handle_spencerbot(message, new_message, mentioned, speaks),
+                f'spencerbot-{message.id}'
+            )
+        else:
+            stage_timings.skip('context')
+
+        if korean:
+            dispatch(handle_korean(message), f'korean-{message.id}')
+
     @bot.tree.command(
         name='sync',
         description='Sync your local Anki collection to AnkiWeb.'
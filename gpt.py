@@ -2,9 +2,16 @@
 
 import json
 import re
+import time
+from typing import AsyncIterator
 from openai import AsyncOpenAI
 
-from korean_config import logger, OPENAI_API_KEY
+from korean_config import logger, OPENAI_API_KEY, ESCALATION_CONFIDENCE, LONG_ANSWER_CHARS
+import grade_cache
+import grading
+import hangul
+import model_tiers
+from partial_json import PartialJsonParser
 
 # Initialize AsyncOpenAI client
 client = AsyncOpenAI(api_key=OPENAI_API_KEY)
@@ -29,6 +36,196 @@ def _strip_markdown(text: str) -> str:
     ).strip()
 
 
+_CONFIDENCE_INSTRUCTION: str = (
+    ' Start the JSON object with a confidence field (0-1): how certain you are'
+    ' that this grade is right.'
+)
+
+
+async def _complete(function: str, messages: list[dict], model: str, json_mode: bool = True) -> str:
+    """
+    Run one chat completion and record its latency and usage.
+
+    Args:
+        function: Calling function name (for stats)
+        messages: Chat messages
+        model: Model name
+        json_mode: Request a JSON object response
+
+    Returns:
+        Message content
+    """
+    kwargs = {'response_format': {'type': 'json_object'}} if json_mode else {}
+    start = time.perf_counter()
+    response = await client.chat.completions.create(model=model, messages=messages, **kwargs)
+    model_tiers.record(function, model, time.perf_counter() - start, response.usage)
+    return response.choices[0].message.content
+
+
+async def _complete_routed(function: str, messages: list[dict], json_mode: bool = True) -> str:
+    """
+    Run a completion on the model routed for function, without escalation.
+
+    Args:
+        function: Calling function name (key into MODEL_ROUTES)
+        messages: Chat messages
+        json_mode: Request a JSON object response
+
+    Returns:
+        Message content
+    """
+    model = model_tiers.model_for(model_tiers.route(function))
+    return await _complete(function, messages, model, json_mode)
+
+
+def _with_confidence(messages: list[dict]) -> list[dict]:
+    """Ask for a confidence field in the system message (the first message)."""
+    return [
+        {**messages[0], 'content': messages[0]['content'] + _CONFIDENCE_INSTRUCTION},
+        *messages[1:],
+    ]
+
+
+def _read_confidence(result: dict) -> float:
+    """Return the confidence field of a fast-tier result (0 if missing or invalid)."""
+    try:
+        return float(result.get('confidence', 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _pop_confidence(result: dict) -> float:
+    """Remove and return the confidence field of a fast-tier result (0 if missing or invalid)."""
+    confidence = _read_confidence(result)
+    result.pop('confidence', None)
+    return confidence
+
+
+async def _complete_json(function: str, messages: list[dict], answer: str | None = None) -> dict:
+    """
+    Run a JSON completion, routing between the fast and large tiers.
+
+    Graders (calls with an answer) routed to the fast tier ask the fast model
+    for a confidence field and are re-graded on the large model when it is
+    below ESCALATION_CONFIDENCE. Answers longer than LONG_ANSWER_CHARS go
+    straight to the large model.
+
+    Args:
+        function: Calling function name (key into MODEL_ROUTES)
+        messages: Chat messages; the first must be the system message
+        answer: Student answer for graders, None for generation
+
+    Returns:
+        Parsed JSON (without the confidence field)
+    """
+    if model_tiers.route(function) != model_tiers.FAST or answer is None:
+        return json.loads(_strip_markdown(await _complete_routed(function, messages)))
+
+    if len(answer) <= LONG_ANSWER_CHARS:
+        content = await _complete(
+            function, _with_confidence(messages), model_tiers.model_for(model_tiers.FAST)
+        )
+        result = json.loads(_strip_markdown(content))
+        confidence = _pop_confidence(result)
+        if confidence >= ESCALATION_CONFIDENCE:
+            return result
+        logger.info(f'{function}: fast tier confidence {confidence:.2f}, escalating')
+
+    content = await _complete(function, messages, model_tiers.model_for(model_tiers.LARGE))
+    return json.loads(_strip_markdown(content))
+
+
+async def _stream_completion(function: str, messages: list[dict], model: str) -> AsyncIterator[dict]:
+    """
+    Stream one JSON completion on model, yielding the parsed object as it grows.
+
+    The HTTP stream is closed when the consumer stops early or is cancelled.
+
+    Args:
+        function: Calling function name (for stats)
+        messages: Chat messages
+        model: Model name
+
+    Yields:
+        Partial objects (only when they change); the last one is complete
+    """
+    start = time.perf_counter()
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        response_format={'type': 'json_object'},
+        stream=True,
+        stream_options={'include_usage': True},
+    )
+
+    parser = PartialJsonParser()
+    usage = None
+    last = None
+    try:
+        async for chunk in stream:
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            partial = parser.feed(chunk.choices[0].delta.content)
+            if partial is not None and partial != last:
+                last = partial
+                yield partial
+    finally:
+        await stream.close()
+
+    model_tiers.record(function, model, time.perf_counter() - start, usage)
+    result = json.loads(_strip_markdown(parser.text))
+    if result != last:
+        yield result
+
+
+async def _stream_json(
+    function: str,
+    messages: list[dict],
+    answer: str | None = None
+) -> AsyncIterator[dict]:
+    """
+    Stream a JSON completion, yielding the parsed object as it grows.
+
+    Routed like _complete_json. Short answers on the fast tier stream from
+    the fast model, but nothing is yielded until its confidence (asked for
+    as the first field) reaches ESCALATION_CONFIDENCE; an unsure grade is
+    never shown and the large model's grade is streamed instead.
+
+    Args:
+        function: Calling function name (key into MODEL_ROUTES)
+        messages: Chat messages; the first must be the system message
+        answer: Student answer for graders
+
+    Yields:
+        Partial objects (only when they change); the last one is complete
+    """
+    tier = model_tiers.route(function)
+    if tier == model_tiers.FAST and answer is not None and len(answer) <= LONG_ANSWER_CHARS:
+        result: dict = {}
+        last = None
+        confident = False
+        async for result in _stream_completion(
+            function, _with_confidence(messages), model_tiers.model_for(model_tiers.FAST)
+        ):
+            confident = confident or _read_confidence(result) >= ESCALATION_CONFIDENCE
+            if not confident:
+                continue
+            partial = {key: value for key, value in result.items() if key != 'confidence'}
+            if partial != last:
+                last = partial
+                yield partial
+        confidence = _pop_confidence(result)
+        if confidence >= ESCALATION_CONFIDENCE:
+            return
+        logger.info(f'{function}: fast tier confidence {confidence:.2f}, escalating')
+
+    model = model_tiers.model_for(model_tiers.LARGE if tier == model_tiers.FAST else tier)
+    async for partial in _stream_completion(function, messages, model):
+        yield partial
+
+
 async def generate_vocab_list(raw_words: str) -> list[dict]:
     """
     Generate formatted vocabulary list from raw Korean words.
@@ -40,13 +237,12 @@ async def generate_vocab_list(raw_words: str) -> list[dict]:
 
     Returns:
         List of vocab dicts with korean, romanization, english, part_of_speech,
-        example_korean, example_english
+        example_korean, example_english. Romanization is generated locally.
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        content = await _complete_routed(
+            'generate_vocab_list',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -71,7 +267,7 @@ async def generate_vocab_list(raw_words: str) -> list[dict]:
                         '- No slashes between multiple definitions\n'
                         '- Keep translations concise\n'
                         '- Bold the Korean term in output\n\n'
-                        'Return a JSON array with objects containing: korean, romanization, english, '
+                        'Return a JSON array with objects containing: korean, english, '
                         'part_of_speech, example_korean, example_english. Return ONLY the JSON array, '
                         'no markdown or additional text.'
                     )
@@ -80,10 +276,8 @@ async def generate_vocab_list(raw_words: str) -> list[dict]:
                     'role': 'user',
                     'content': f'Generate vocab list for these words:\n{raw_words}'
                 }
-            ]
+            ],
         )
-
-        content = response.choices[0].message.content
         content = _strip_markdown(content)
 
         # Try to parse as array directly, or wrap in array
@@ -94,7 +288,13 @@ async def generate_vocab_list(raw_words: str) -> list[dict]:
         except json.JSONDecodeError:
             vocab_list = []
 
-        return vocab_list if isinstance(vocab_list, list) else []
+        if not isinstance(vocab_list, list):
+            return []
+
+        for word in vocab_list:
+            if isinstance(word, dict):
+                word['romanization'] = hangul.romanize(word.get('korean', '').replace('*', ''))
+        return vocab_list
 
     except Exception as e:
         logger.exception(f'Error generating vocab list: {e}')
@@ -135,10 +335,9 @@ async def generate_translation_exercise(
             for w in selected_words
         )
 
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_translation_exercise',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -161,18 +360,15 @@ async def generate_translation_exercise(
                         f'{words_with_defs}. Output sentences must NOT include the word labels or definitions.'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating translation exercise: {e}')
         raise RuntimeError(f'Failed to generate translation exercise: {e}')
 
 
+@grade_cache.cached_grade('translation')
 async def grade_translation(
     prompt: str,
     answer: str,
@@ -192,10 +388,9 @@ async def grade_translation(
         Dict with correct (bool), score (0-100), feedback, corrected (null if correct)
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'grade_translation',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -213,13 +408,10 @@ async def grade_translation(
                         f'Correct answer: {answer}\nStudent answer: {student}'
                     )
                 }
-            ]
+            ],
+            answer=student,
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error grading translation: {e}')
         raise RuntimeError(f'Failed to grade translation: {e}')
@@ -239,10 +431,9 @@ async def generate_audio_exercise(words: list[dict]) -> dict:
         import random
         selected_word = random.choice(words)
         
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_audio_exercise',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -259,18 +450,15 @@ async def generate_audio_exercise(words: list[dict]) -> dict:
                         f'{selected_word["korean"]} ({selected_word.get("english", "")})'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating audio exercise: {e}')
         raise RuntimeError(f'Failed to generate audio exercise: {e}')
 
 
+@grade_cache.cached_grade('audio')
 async def grade_audio_response(
     korean: str,
     english: str,
@@ -279,7 +467,8 @@ async def grade_audio_response(
     """
     Grade an audio listening response.
 
-    Student may respond with meaning or romanization.
+    Student may respond with meaning or romanization. Exact Hangul or
+    romanized transcriptions are accepted locally without an API call.
 
     Args:
         korean: Korean text that was played
@@ -289,11 +478,14 @@ async def grade_audio_response(
     Returns:
         Dict with correct (bool), score (0-100), feedback, corrected (null if correct)
     """
+    local = grading.grade_audio_locally(korean, student)
+    if local is not None:
+        return local
+
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'grade_audio_response',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -311,13 +503,10 @@ async def grade_audio_response(
                         f'Student answered: {student}'
                     )
                 }
-            ]
+            ],
+            answer=student,
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error grading audio response: {e}')
         raise RuntimeError(f'Failed to grade audio response: {e}')
@@ -337,10 +526,9 @@ async def generate_dictation_exercise(words: list[dict]) -> dict:
         import random
         selected_word = random.choice(words)
         
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_dictation_exercise',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -357,59 +545,63 @@ async def generate_dictation_exercise(words: list[dict]) -> dict:
                         f'{selected_word["korean"]} ({selected_word.get("english", "")})'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating dictation exercise: {e}')
         raise RuntimeError(f'Failed to generate dictation exercise: {e}')
 
 
-async def grade_dictation(correct: str, student: str) -> dict:
+async def grade_dictation(correct: str, student: str, explain: bool = True) -> dict:
     """
     Grade a dictation response.
 
-    Strip punctuation before comparing. Character-by-character diff.
+    Grading is local and deterministic (see grading.grade_dictation): punctuation
+    is stripped and the answer is diffed jamo by jamo. GPT is only asked for a
+    short English explanation when the answer is wrong.
 
     Args:
         correct: Correct Korean text
         student: Student's transcription
+        explain: If True, ask GPT to explain mistakes in English
 
     Returns:
         Dict with correct (bool), score (0-100), feedback, diff, corrected
     """
+    result = grading.grade_dictation(correct, student)
+    if result['correct'] or not explain:
+        return result
+
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        feedback = await _complete_routed(
+            'grade_dictation',
+            [
                 {
                     'role': 'system',
                     'content': (
-                        'Grade a Korean dictation. '
-                        'Return JSON with: correct (bool), score (0-100), feedback, diff, corrected. '
-                        'Provide all feedback in English. '
-                        'Return ONLY JSON, no markdown in JSON values.'
+                        'You are a Korean language teacher. A student made mistakes in a dictation. '
+                        'In at most two sentences of English, explain what they got wrong '
+                        '(e.g. batchim, vowel, sound change). Plain text only, no markdown.'
                     )
                 },
                 {
                     'role': 'user',
-                    'content': f'Correct: {correct}\nStudent: {student}'
+                    'content': (
+                        f'Correct: {correct}\nStudent: {student}\n'
+                        f'Diff ([student→correct], [+missing], [-extra]): {result["diff"]}'
+                    )
                 }
-            ]
+            ],
+            json_mode=False,
         )
-
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
+        result['feedback'] = feedback.strip()
 
     except Exception as e:
-        logger.exception(f'Error grading dictation: {e}')
-        raise RuntimeError(f'Failed to grade dictation: {e}')
+        # The local grade stands on its own; feedback is a nice-to-have
+        logger.warning(f'Dictation feedback unavailable: {e}')
+
+    return result
 
 
 async def generate_cloze_exercise(words: list[dict]) -> dict:
@@ -425,10 +617,9 @@ async def generate_cloze_exercise(words: list[dict]) -> dict:
         Dict with paragraph, blanks (list of dicts), full_paragraph, words_used
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_cloze_exercise',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -446,40 +637,34 @@ async def generate_cloze_exercise(words: list[dict]) -> dict:
                         f'{", ".join(w["korean"] for w in words[:5])}'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating cloze exercise: {e}')
         raise RuntimeError(f'Failed to generate cloze exercise: {e}')
 
 
-async def grade_cloze(blanks: list[dict], student_answers: str) -> dict:
+async def _grade_cloze_submission(blanks: list[dict], student_answers: str) -> dict:
     """
-    Grade cloze responses.
-
-    Parse answers in order, comma or newline separated.
+    Grade a whole cloze submission with GPT, letting it parse the answers.
 
     Args:
         blanks: List of blank dicts from exercise
-        student_answers: Student's comma or newline separated answers
+        student_answers: Student's answers in any format
 
     Returns:
         Dict with results (list), score (0-100), feedback
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'grade_cloze',
+            [
                 {
                     'role': 'system',
                     'content': (
                         'Grade cloze (fill-in-the-blank) responses. Parse answers in order. '
+                        'Mark an answer correct if it is an acceptable conjugation, form or synonym in context. '
                         'Return JSON with: results (list of {position, correct (bool), student, answer}), '
                         'score (0-100), feedback. '
                         'Provide all feedback in English. '
@@ -489,20 +674,96 @@ async def grade_cloze(blanks: list[dict], student_answers: str) -> dict:
                 {
                     'role': 'user',
                     'content': (
-                        f'Blanks: {json.dumps(blanks)}\nStudent answers: {student_answers}'
+                        f'Blanks: {json.dumps(blanks, ensure_ascii=False)}\nStudent answers: {student_answers}'
                     )
                 }
-            ]
+            ],
+            answer=student_answers,
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
+    except Exception as e:
+        logger.exception(f'Error grading cloze: {e}')
+        raise RuntimeError(f'Failed to grade cloze: {e}')
+
+
+async def grade_cloze(blanks: list[dict], student_answers: str) -> dict:
+    """
+    Grade cloze responses.
+
+    Parse answers in order, separated or numbered. Exact matches are
+    graded locally (see grading.grade_cloze); only blanks where the student's
+    answer differs are sent to GPT to judge conjugation and synonyms, so a
+    fully correct submission needs no API call. If the answers cannot be
+    matched to the blanks locally, GPT parses and grades the whole submission.
+
+    Args:
+        blanks: List of blank dicts from exercise
+        student_answers: Student's separated or numbered answers
+
+    Returns:
+        Dict with results (list), score (0-100), feedback
+    """
+    result = grading.grade_cloze(blanks, student_answers)
+    if result is None:
+        return await _grade_cloze_submission(blanks, student_answers)
+
+    unresolved = [r for r in result['results'] if not r['correct']]
+    if not unresolved:
+        return result
+
+    english_by_position = {str(b.get('position')): b.get('english', '') for b in blanks}
+    to_judge = [
+        {
+            'position': r['position'],
+            'answer': r['answer'],
+            'english': english_by_position.get(str(r['position']), ''),
+            'student': r['student'],
+        }
+        for r in unresolved
+    ]
+
+    try:
+        judged = await _complete_json(
+            'grade_cloze',
+            [
+                {
+                    'role': 'system',
+                    'content': (
+                        'Grade cloze (fill-in-the-blank) answers that did not exactly match the expected word. '
+                        'Mark an answer correct if it is an acceptable conjugation, form or synonym in context. '
+                        'Return JSON with: results (list of {position, correct (bool)}), '
+                        'feedback (about the whole submission). '
+                        'Provide all feedback in English. '
+                        'Return ONLY JSON, no markdown.'
+                    )
+                },
+                {
+                    'role': 'user',
+                    'content': (
+                        f'Blanks to judge: {json.dumps(to_judge, ensure_ascii=False)}'
+                    )
+                }
+            ],
+            answer=student_answers,
+        )
 
     except Exception as e:
         logger.exception(f'Error grading cloze: {e}')
         raise RuntimeError(f'Failed to grade cloze: {e}')
 
+    verdicts = {
+        str(r.get('position')): bool(r.get('correct'))
+        for r in judged.get('results', [])
+    }
+    for r in unresolved:
+        r['correct'] = verdicts.get(str(r['position']), False)
+
+    result['score'] = grading.cloze_score(result['results'])
+    result['feedback'] = ' '.join(
+        part for part in (result['feedback'], judged.get('feedback', '')) if part
+    )
+    return result
+
 
 async def generate_reading_exercise(words: list[dict]) -> dict:
     """
@@ -517,10 +778,9 @@ async def generate_reading_exercise(words: list[dict]) -> dict:
         Dict with story_korean, story_english, questions (list), answers (list), words_used
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_reading_exercise',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -538,18 +798,37 @@ async def generate_reading_exercise(words: list[dict]) -> dict:
                         f'{", ".join(w["korean"] for w in words[:5])}'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating reading exercise: {e}')
         raise RuntimeError(f'Failed to generate reading exercise: {e}')
 
 
+def _grade_reading_messages(questions: list[str], answers: list[str], student: str) -> list[dict]:
+    """Build the reading grading prompt (score first so it can be shown early when streaming)."""
+    return [
+        {
+            'role': 'system',
+            'content': (
+                'Grade reading comprehension. Parse student answers (numbered or prose). '
+                'Return JSON with: score (0-100), '
+                'results (list of {question, correct (bool), feedback}), overall_feedback. '
+                'Provide all feedback in English. '
+                'Return ONLY JSON, no markdown.'
+            )
+        },
+        {
+            'role': 'user',
+            'content': (
+                f'Questions: {json.dumps(questions)}\nCorrect answers: {json.dumps(answers)}\n'
+                f'Student response: {student}'
+            )
+        }
+    ]
+
+
 async def grade_reading(
     questions: list[str],
     answers: list[str],
@@ -569,33 +848,43 @@ async def grade_reading(
         Dict with results (list), score (0-100), overall_feedback
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
-                {
-                    'role': 'system',
-                    'content': (
-                        'Grade reading comprehension. Parse student answers (numbered or prose). '
-                        'Return JSON with: results (list of {question, correct (bool), feedback}), '
-                        'score (0-100), overall_feedback. '
-                        'Provide all feedback in English. '
-                        'Return ONLY JSON, no markdown.'
-                    )
-                },
-                {
-                    'role': 'user',
-                    'content': (
-                        f'Questions: {json.dumps(questions)}\nCorrect answers: {json.dumps(answers)}\n'
-                        f'Student response: {student}'
-                    )
-                }
-            ]
+        return await _complete_json(
+            'grade_reading',
+            _grade_reading_messages(questions, answers, student),
+            answer=student,
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
+    except Exception as e:
+        logger.exception(f'Error grading reading: {e}')
+        raise RuntimeError(f'Failed to grade reading: {e}')
+
+
+async def grade_reading_stream(
+    questions: list[str],
+    answers: list[str],
+    student: str
+) -> AsyncIterator[dict]:
+    """
+    Grade reading comprehension, yielding the grade as it is generated.
+
+    Args:
+        questions: List of comprehension questions
+        answers: List of correct answers
+        student: Student's full response
+
+    Yields:
+        Partial grade dicts (see grade_reading); the last one is complete
+
+    Raises:
+        RuntimeError: If grading fails
+    """
+    try:
+        async for partial in _stream_json(
+            'grade_reading',
+            _grade_reading_messages(questions, answers, student),
+            answer=student,
+        ):
+            yield partial
 
     except Exception as e:
         logger.exception(f'Error grading reading: {e}')
@@ -613,10 +902,9 @@ async def generate_write_prompt(words: list[dict]) -> dict:
         Dict with prompt, target_words (list), english_hint
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_write_prompt',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -636,18 +924,38 @@ async def generate_write_prompt(words: list[dict]) -> dict:
                         f'{", ".join(w["korean"] for w in words[:5])}'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating write prompt: {e}')
         raise RuntimeError(f'Failed to generate write prompt: {e}')
 
 
+def _grade_writing_messages(prompt: str, target_words: list[str], student: str) -> list[dict]:
+    """Build the writing grading prompt."""
+    return [
+        {
+            'role': 'system',
+            'content': (
+                'Grade Korean writing. Return JSON with: '
+                'score (0-100), target_words_used (list), target_words_missed (list), '
+                'corrections (list of max 5: {original, corrected, explanation}), '
+                'overall_feedback, improved_version. '
+                'Provide all explanations and feedback in English. '
+                'Return ONLY JSON, no markdown in values.'
+            )
+        },
+        {
+            'role': 'user',
+            'content': (
+                f'Prompt: {prompt}\nTarget words: {", ".join(target_words)}\n'
+                f'Student writing: {student}'
+            )
+        }
+    ]
+
+
 async def grade_writing(
     prompt: str,
     target_words: list[str],
@@ -668,34 +976,43 @@ async def grade_writing(
         overall_feedback, improved_version
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
-                {
-                    'role': 'system',
-                    'content': (
-                        'Grade Korean writing. Return JSON with: '
-                        'score (0-100), target_words_used (list), target_words_missed (list), '
-                        'corrections (list of max 5: {original, corrected, explanation}), '
-                        'overall_feedback, improved_version. '
-                        'Provide all explanations and feedback in English. '
-                        'Return ONLY JSON, no markdown in values.'
-                    )
-                },
-                {
-                    'role': 'user',
-                    'content': (
-                        f'Prompt: {prompt}\nTarget words: {", ".join(target_words)}\n'
-                        f'Student writing: {student}'
-                    )
-                }
-            ]
+        return await _complete_json(
+            'grade_writing',
+            _grade_writing_messages(prompt, target_words, student),
+            answer=student,
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
+    except Exception as e:
+        logger.exception(f'Error grading writing: {e}')
+        raise RuntimeError(f'Failed to grade writing: {e}')
+
+
+async def grade_writing_stream(
+    prompt: str,
+    target_words: list[str],
+    student: str
+) -> AsyncIterator[dict]:
+    """
+    Grade free writing, yielding the grade as it is generated.
+
+    Args:
+        prompt: Original prompt
+        target_words: Target words list
+        student: Student's written response
+
+    Yields:
+        Partial grade dicts (see grade_writing); the last one is complete
+
+    Raises:
+        RuntimeError: If grading fails
+    """
+    try:
+        async for partial in _stream_json(
+            'grade_writing',
+            _grade_writing_messages(prompt, target_words, student),
+            answer=student,
+        ):
+            yield partial
 
     except Exception as e:
         logger.exception(f'Error grading writing: {e}')
@@ -715,10 +1032,9 @@ async def generate_build_exercise(words: list[dict]) -> dict:
         Dict with given_words (list of {korean, english}), difficulty_note, example_answer
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'generate_build_exercise',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -736,18 +1052,15 @@ async def generate_build_exercise(words: list[dict]) -> dict:
                         f'{", ".join(w["korean"] for w in words[:5])}'
                     )
                 }
-            ]
+            ],
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error generating build exercise: {e}')
         raise RuntimeError(f'Failed to generate build exercise: {e}')
 
 
+@grade_cache.cached_grade('build')
 async def grade_build(
     given_words: list[dict],
     example_answer: str,
@@ -766,10 +1079,9 @@ async def grade_build(
         grammar_correct (bool), feedback, corrected (null if correct), example_answer
     """
     try:
-        response = await client.chat.completions.create(
-            model='gpt-5.4',
-            response_format={'type': 'json_object'},
-            messages=[
+        return await _complete_json(
+            'grade_build',
+            [
                 {
                     'role': 'system',
                     'content': (
@@ -788,13 +1100,10 @@ async def grade_build(
                         f'Student sentence: {student}'
                     )
                 }
-            ]
+            ],
+            answer=student,
         )
 
-        content = response.choices[0].message.content
-        content = _strip_markdown(content)
-        return json.loads(content)
-
     except Exception as e:
         logger.exception(f'Error grading build: {e}')
         raise RuntimeError(f'Failed to grade build: {e}')
@@ -0,0 +1,209 @@
+"""LRU cache of LLM grades keyed by exercise and normalized answer."""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import re
+import sqlite3
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable
+
+from korean_config import logger, GRADE_CACHE_SIZE, GRADE_CACHE_PATH
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Key -> grade dict, most recently used last
+_entries: OrderedDict[str, dict] = OrderedDict()
+_db: sqlite3.Connection | None = None
+_db_failed: bool = False
+# The database is only touched from this thread, so lookups and writes never block the event loop
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='grade-cache')
+
+stats: dict[str, int] = {'hits': 0, 'misses': 0}
+
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+
+def normalize_answer(text: str) -> str:
+    """
+    Normalize a student answer for cache lookup.
+
+    Args:
+        text: Raw answer
+
+    Returns:
+        NFC-normalized answer with whitespace collapsed
+    """
+    text = unicodedata.normalize('NFC', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def make_key(kind: str, exercise: dict[str, Any], answer: str) -> str:
+    """
+    Build a cache key from the grader, the exercise and the answer.
+
+    Args:
+        kind: Grader name (e.g. 'translation')
+        exercise: Everything the grade depends on besides the answer
+        answer: Student answer
+
+    Returns:
+        Hex digest
+    """
+    fingerprint = json.dumps(exercise, ensure_ascii=False, sort_keys=True, default=str)
+    payload = f'{kind}\0{unicodedata.normalize("NFC", fingerprint)}\0{normalize_answer(answer)}'
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+
+def _connect() -> sqlite3.Connection | None:
+    """
+    Open the persistent cache database, if one is configured.
+
+    Returns:
+        Connection, or None when persistence is disabled or unavailable
+    """
+    global _db, _db_failed
+    if _db is not None or _db_failed or not GRADE_CACHE_PATH:
+        return _db
+    try:
+        _db = sqlite3.connect(GRADE_CACHE_PATH, check_same_thread=False)
+        _db.execute('CREATE TABLE IF NOT EXISTS grades (key TEXT PRIMARY KEY, result TEXT NOT NULL)')
+        _db.commit()
+    except sqlite3.Error as e:
+        logger.warning(f'Grade cache persistence disabled: {e}')
+        _db, _db_failed = None, True
+    return _db
+
+
+def _read(key: str) -> dict | None:
+    """Read a grade from the database (cache thread)."""
+    db = _connect()
+    if db is None:
+        return None
+    try:
+        row = db.execute('SELECT result FROM grades WHERE key = ?', (key,)).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f'Grade cache read failed: {e}')
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def _write(key: str, data: str) -> None:
+    """Write a grade to the database (cache thread)."""
+    db = _connect()
+    if db is None:
+        return
+    try:
+        db.execute('INSERT OR REPLACE INTO grades (key, result) VALUES (?, ?)', (key, data))
+        db.commit()
+    except sqlite3.Error as e:
+        logger.warning(f'Grade cache write failed: {e}')
+
+
+def _remember(key: str, result: dict) -> None:
+    """Insert into the in-memory LRU, evicting the oldest entries."""
+    _entries[key] = result
+    _entries.move_to_end(key)
+    while len(_entries) > GRADE_CACHE_SIZE:
+        _entries.popitem(last=False)
+
+
+async def get(key: str) -> dict | None:
+    """
+    Look up a cached grade, in memory first and then in the database.
+
+    Args:
+        key: Key from make_key
+
+    Returns:
+        Copy of the cached grade, or None
+    """
+    result = _entries.get(key)
+    if result is not None:
+        _entries.move_to_end(key)
+    elif GRADE_CACHE_PATH:
+        result = await asyncio.get_running_loop().run_in_executor(_executor, _read, key)
+        if result is not None:
+            _remember(key, result)
+
+    if result is None:
+        stats['misses'] += 1
+        return None
+    stats['hits'] += 1
+    return copy.deepcopy(result)
+
+
+def put(key: str, result: dict) -> None:
+    """
+    Store a grade in memory and queue its database write.
+
+    Args:
+        key: Key from make_key
+        result: Grade dict (copied, so later mutation by callers is safe)
+    """
+    _remember(key, copy.deepcopy(result))
+    if GRADE_CACHE_PATH and not _db_failed:
+        _executor.submit(_write, key, json.dumps(result, ensure_ascii=False))
+
+
+def clear() -> None:
+    """Drop all in-memory entries and reset stats (the database is kept)."""
+    _entries.clear()
+    stats.update(hits=0, misses=0)
+
+
+# ============================================================================
+# DECORATOR
+# ============================================================================
+
+
+def cached_grade(kind: str, answer_arg: str = 'student') -> Callable:
+    """
+    Cache an async grader's result by its arguments.
+
+    All arguments except answer_arg form the exercise fingerprint;
+    answer_arg is normalized before keying. Failures are not cached.
+
+    Args:
+        kind: Grader name, kept distinct across graders
+        answer_arg: Name of the student-answer parameter
+
+    Returns:
+        Decorator for async grading functions returning a dict
+    """
+    def decorator(func: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> dict:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            exercise = dict(bound.arguments)
+            answer = exercise.pop(answer_arg)
+            key = make_key(kind, exercise, answer)
+
+            hit = await get(key)
+            if hit is not None:
+                logger.debug(f'Grade cache hit ({kind})')
+                return hit
+
+            result = await func(*args, **kwargs)
+            put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,261 @@
+"""Local deterministic graders for Korean bot exercises."""
+
+import re
+import unicodedata
+
+import hangul
+
+# Anything that is not a letter, digit, underscore or whitespace
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_korean(text: str) -> str:
+    """
+    Normalize Korean text for comparison.
+
+    NFC-normalizes, strips punctuation and collapses whitespace.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    text = unicodedata.normalize('NFC', text)
+    text = _PUNCTUATION.sub('', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def format_diff(ops: list[tuple[str, str, str]]) -> str:
+    """
+    Render alignment ops as a compact, Discord-friendly diff.
+
+    Mistakes are shown as [yours→correct], missing text as [+correct] and
+    extra text as [-yours]. Spacing-only differences are not shown.
+
+    Args:
+        ops: Merged ops from hangul.align
+
+    Returns:
+        Diff string
+    """
+    parts = []
+    for op, expected, actual in ops:
+        if op == 'equal':
+            parts.append(expected)
+        elif op == 'replace':
+            parts.append(f'[{actual}→{expected}]')
+        elif op == 'missing':
+            parts.append(_bracket('+', expected))
+        elif actual.strip():
+            parts.append(_bracket('-', actual))
+    return ''.join(parts)
+
+
+def _bracket(sign: str, text: str) -> str:
+    """Wrap text in a diff marker, keeping surrounding spaces outside it."""
+    core = text.strip()
+    if not core:
+        return text
+    leading = text[:len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()):]
+    return f'{leading}[{sign}{core}]{trailing}'
+
+
+def grade_dictation(correct: str, student: str) -> dict:
+    """
+    Grade a dictation by jamo-level comparison.
+
+    Punctuation is ignored. The score is the share of the correct sentence's
+    jamo the student got right, so a single wrong batchim costs one jamo
+    rather than a whole syllable. Spacing mistakes do not affect the score
+    but are reported.
+
+    Args:
+        correct: Correct Korean text
+        student: Student's transcription
+
+    Returns:
+        Dict with correct (bool), score (0-100), feedback, diff, corrected
+    """
+    expected = normalize_korean(correct)
+    actual = normalize_korean(student)
+
+    ops, distance = hangul.align(expected, actual)
+    total = hangul.jamo_length(expected) or 1
+    score = max(0, round(100 * (1 - distance / total)))
+
+    if distance == 0 and expected == actual:
+        return {
+            'correct': True,
+            'score': 100,
+            'feedback': 'Perfect!',
+            'diff': '',
+            'corrected': None,
+        }
+
+    if distance == 0:
+        return {
+            'correct': True,
+            'score': 100,
+            'feedback': 'All letters are correct. Check your spacing (띄어쓰기).',
+            'diff': '',
+            'corrected': correct,
+        }
+
+    wrong = sum(1 for op, _, _ in ops if op != 'equal')
+    return {
+        'correct': False,
+        'score': score,
+        'feedback': f'{distance} letter(s) differ in {wrong} place(s). See the diff below.',
+        'diff': format_diff(ops),
+        'corrected': correct,
+    }
+
+
+# Cloze answers are separated by newlines, semicolons, full-width or ideographic
+# commas, or ASCII commas other than digit grouping (1,000원)
+_CLOZE_SEPARATORS = re.compile(r'[\n;；，、]+|(?<!\d),|,(?!\d)')
+# Numbering in front of an answer, at the start or after a space: "1. ", "2) ",
+# "_3_ = ", "4: " (but not a decimal or a time such as 3.5 or 3:30)
+_CLOZE_NUMBERING = re.compile(r'(?:^|(?<=\s))_?\d+_?\s*[.):=](?!\d)\s*')
+
+
+def parse_cloze_answers(student_answers: str, blank_count: int) -> list[str] | None:
+    """
+    Split a cloze submission into per-blank answers, in order.
+
+    Answers are split on separators and numbering. A submission with no
+    separators is split on spaces if that gives exactly one word per blank
+    (e.g. "가다 먹다"); otherwise the answers cannot be told apart.
+
+    Args:
+        student_answers: Separated and/or numbered answers
+        blank_count: Number of blanks in the exercise
+
+    Returns:
+        List of answers with numbering removed, or None if their number does
+        not match blank_count
+    """
+    answers = []
+    for part in _CLOZE_SEPARATORS.split(student_answers):
+        for answer in _CLOZE_NUMBERING.split(part):
+            answer = answer.strip()
+            if answer:
+                answers.append(answer)
+
+    if len(answers) == 1 and len(answers[0].split()) == blank_count:
+        answers = answers[0].split()
+    if len(answers) != blank_count:
+        return None
+    return answers
+
+
+def _cloze_key(text: str) -> str:
+    """Comparison key for a cloze answer (normalized, spacing ignored)."""
+    return normalize_korean(text).replace(' ', '')
+
+
+def cloze_score(results: list[dict]) -> int:
+    """
+    Score cloze results as the percentage of correct blanks.
+
+    Args:
+        results: Per-blank result dicts with a 'correct' key
+
+    Returns:
+        Score 0-100
+    """
+    if not results:
+        return 0
+    return round(100 * sum(1 for r in results if r['correct']) / len(results))
+
+
+def grade_cloze(blanks: list[dict], student_answers: str) -> dict | None:
+    """
+    Grade cloze answers by exact match against each blank's Korean word.
+
+    Matching ignores punctuation, spacing and Unicode normalization form.
+    Answers that do not match may still be acceptable (another conjugation,
+    a synonym), so callers should only treat them as provisionally wrong.
+
+    Args:
+        blanks: List of blank dicts with position, korean, english
+        student_answers: Student's separated or numbered answers
+
+    Returns:
+        Dict with results (list of {position, correct, student, answer}),
+        score (0-100), feedback, or None if the answers could not be matched
+        to the blanks (see parse_cloze_answers)
+    """
+    answers = parse_cloze_answers(student_answers, len(blanks))
+    if answers is None:
+        return None
+
+    results = []
+    for i, blank in enumerate(blanks):
+        student = answers[i]
+        results.append({
+            'position': blank.get('position', i + 1),
+            'correct': _cloze_key(student) == _cloze_key(blank['korean']),
+            'student': student,
+            'answer': blank['korean'],
+        })
+
+    feedback = 'All blanks correct!' if all(r['correct'] for r in results) else ''
+
+    return {
+        'results': results,
+        'score': cloze_score(results),
+        'feedback': feedback,
+    }
+
+
+# Letters only: romanization is compared without spaces, hyphens or apostrophes
+_NON_LETTERS = re.compile(r'[^a-z]')
+_LATIN = re.compile(r'[A-Za-z]')
+
+
+def _romanization_key(text: str) -> str:
+    """Comparison key for a romanized answer (lowercase letters only)."""
+    return _NON_LETTERS.sub('', text.lower())
+
+
+def grade_audio_locally(korean: str, student: str) -> dict | None:
+    """
+    Grade an audio response without an LLM when it is an exact transcription.
+
+    Accepts the Hangul itself or its Revised Romanization, with or without
+    consonant assimilation (gamsahamnida and gamsahapnida both match
+    감사합니다); liaison is always required (eopseoyo, not eopeoyo, for 없어요).
+    English answers and anything that does not match are left to the LLM.
+
+    Args:
+        korean: Korean text that was played
+        student: Student's response
+
+    Returns:
+        Grade dict with correct, score, feedback, corrected, or None if the
+        answer could not be confirmed locally
+    """
+    if _cloze_key(student) and _cloze_key(student) == _cloze_key(korean):
+        return {'correct': True, 'score': 100, 'feedback': 'Perfect!', 'corrected': None}
+
+    answer = _romanization_key(student)
+    if not answer or not _LATIN.search(student) or any(map(hangul.is_syllable, student)):
+        return None
+
+    accepted = {
+        _romanization_key(hangul.romanize(korean)),
+        _romanization_key(hangul.romanize(korean, assimilate=False)),
+    }
+    if answer in accepted:
+        return {
+            'correct': True,
+            'score': 100,
+            'feedback': f'Correct romanization! ({hangul.romanize(korean)})',
+            'corrected': None,
+        }
+    return None
+
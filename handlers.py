@@ -1,30 +1,38 @@
 """Command handlers for SpencerBot."""
 
+import functools
 import random
+from typing import AsyncIterator, Optional
 import discord
 from discord.ext import commands
 from openai import AsyncOpenAI
 
 import oai
-from dapi import disconnect, speak
+import tts_cache
+from dapi import disconnect, speak, stop_playback, stream_reply
+from tts_chunks import chunk_text
+from tts_stream import AudioPipe, open_speech
+from summarizer import summarize_thread
 
 from config import (
     logger,
     SPENCER_EMOTES,
     MAX_CONTEXT_MESSAGES,
+    MAX_STORED_THREAD_MESSAGES,
     OPENAI_API_KEY,
+    TTS_FORMAT,
 )
 from state import BotState, MessageDict
 from utils import (
     read_dominos_timestamp,
     write_dominos_timestamp,
     format_timedelta,
-    find_message_by_id,
 )
 from datetime import datetime
 
 # Initialize OpenAI client for TTS
 openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+TTS_MODEL: str = "gpt-4o-mini-tts"
 
 
 # ============================================================================
@@ -105,68 +113,83 @@ async def cmd_toggle_speak(
         return "Sorry, couldn't toggle TTS."
 
 
-async def generate_tts_file(text: str, voice: str = "onyx") -> str:
+async def open_tts_stream(text: str, voice: str = "onyx") -> AudioPipe:
     """
-    Generate TTS audio using OpenAI and save to file.
+    Start TTS audio for playback, streamed from OpenAI or from the TTS cache.
 
     Args:
         text: Text to convert to speech
         voice: OpenAI voice to use (alloy, echo, fable, onyx, nova, shimmer)
 
     Returns:
-        Path to generated audio file
-
-    Raises:
-        RuntimeError: If TTS generation fails
+        Audio pipe that fills as the response body arrives
     """
-    try:
-        response = await openai_client.audio.speech.create(
-            model="gpt-4o-mini-tts",
+    async def chunks() -> AsyncIterator[bytes]:
+        async with openai_client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
             voice=voice,
             input=text,
-        )
+            response_format=TTS_FORMAT,
+        ) as response:
+            async for chunk in response.iter_bytes():
+                yield chunk
 
-        # Save to file
-        output_path = "speech.mp3"
-        with open(output_path, "wb") as f:
-            f.write(response.content)
-
-        return output_path
-
-    except Exception as e:
-        logger.exception(f"Error generating TTS: {e}")
-        raise RuntimeError(f"Failed to generate audio: {e}")
+    key = tts_cache.make_key(TTS_MODEL, voice, False, text, TTS_FORMAT)
+    return await open_speech(key, chunks, TTS_FORMAT)
 
 
 async def cmd_speak(
     message: discord.Message,
     ctx: commands.Context,
     bot: commands.Bot,
-    text: str
+    text: str,
+    state: BotState
 ) -> None:
     """
     Generate and play TTS audio for a message.
 
-    Uses OpenAI TTS with voice selection based on user preferences.
+    Uses OpenAI TTS with voice selection based on user preferences. Quick
+    successive messages from the same user are merged into one utterance
+    (see speech_debounce).
 
     Args:
         message: Discord message
         ctx: Discord command context
         bot: Discord bot instance
         text: Text to synthesize
+        state: Bot state holding the per-user speech buffers
     """
     try:
         # Map old Google Cloud voice config to OpenAI voices
         # For now, use "onyx" as default (can customize per user later)
         openai_voice = "onyx"
 
+        async def speak_merged(merged: str) -> None:
+            # Long text is spoken sentence chunk by chunk, so playback starts with the first
+            await speak(ctx, *(
+                functools.partial(open_tts_stream, chunk, openai_voice)
+                for chunk in chunk_text(merged)
+            ))
+
         if message.author != bot.user:
-            path = await generate_tts_file(text, openai_voice)
-            await speak(ctx, bot, path)
+            state.speech.add(message.author.id, text, speak_merged)
     except Exception as e:
         logger.exception(f"Error in TTS playback: {e}")
 
 
+async def cmd_stop(guild: Optional[discord.Guild]) -> None:
+    """
+    Stop TTS playback but stay connected, so the next utterance starts without a reconnect.
+
+    Args:
+        guild: Guild the command was sent in
+    """
+    try:
+        stop_playback(guild)
+    except Exception as e:
+        logger.exception(f"Error stopping playback: {e}")
+
+
 async def cmd_leave(ctx: commands.Context, bot: commands.Bot) -> None:
     """
     Leave voice channel.
@@ -190,6 +213,8 @@ async def cmd_summarize(new_message: MessageDict, state: BotState) -> str:
     """
     Summarize message thread starting from a referenced message.
 
+    Long threads are summarized in parallel chunks (see summarizer).
+
     Args:
         new_message: Current message with reference
         state: Bot state containing message history
@@ -198,24 +223,19 @@ async def cmd_summarize(new_message: MessageDict, state: BotState) -> str:
         Summarized message thread or error message
     """
     try:
-        all_messages_list = list(state.all_messages)
-        channel_messages = [
-            msg for msg in all_messages_list
-            if msg['channel_id'] == new_message['channel_id']
-        ]
-        index, referenced_message = find_message_by_id(
-            channel_messages,
-            new_message['reference_id']
-        )
-
-        if not referenced_message:
+        thread = state.history.since(new_message['reference_id'], new_message['channel_id'])
+        if not thread:
+            # Older than the in-memory history (or from before a restart)
+            thread = await state.message_store.since(
+                new_message['channel_id'],
+                new_message['reference_id'],
+                MAX_STORED_THREAD_MESSAGES
+            )
+
+        if not thread:
             return 'Message could not be found!'
 
-        all_text = 'Summarize the following exchange of messages:\n\n'
-        for message in channel_messages[index:]:
-            all_text += f'{message["name"]}: {message["text"]}\n\n'
-
-        return oai.call_gpt_single(all_text)
+        return await summarize_thread(thread)
     except Exception as e:
         logger.exception(f"Error summarizing messages: {e}")
         return "Sorry, couldn't summarize messages."
@@ -233,15 +253,27 @@ async def cmd_fact_check(new_message: MessageDict, state: BotState) -> str:
         Fact-check result or error message
     """
     try:
-        all_messages_list = list(state.all_messages)
-        channel_messages = [
-            msg for msg in all_messages_list
-            if msg['channel_id'] == new_message['channel_id']
-        ]
-        index, referenced_message = find_message_by_id(
-            channel_messages,
-            new_message['reference_id']
+        referenced_message = state.history.get(
+            new_message['reference_id'],
+            new_message['channel_id']
         )
+        if referenced_message:
+            context = state.history.before(
+                new_message['reference_id'],
+                new_message['channel_id'],
+                MAX_CONTEXT_MESSAGES
+            )
+        else:
+            # Older than the in-memory history (or from before a restart)
+            referenced_message = await state.message_store.get(
+                new_message['channel_id'],
+                new_message['reference_id']
+            )
+            context = await state.message_store.before(
+                new_message['channel_id'],
+                new_message['reference_id'],
+                MAX_CONTEXT_MESSAGES
+            ) if referenced_message else []
 
         if not referenced_message:
             return 'Message could not be found!'
@@ -252,33 +284,37 @@ async def cmd_fact_check(new_message: MessageDict, state: BotState) -> str:
             f'Here are the previous {MAX_CONTEXT_MESSAGES} messages for context:\n'
         )
 
-        start_idx = max(0, index - MAX_CONTEXT_MESSAGES)
-        for message in channel_messages[start_idx:index]:
+        for message in context:
             prompt += f'{message["name"]}: {message["text"]}\n\n'
 
-        return oai.call_gpt_single(prompt, 'gpt-4o-search-preview')
+        return await oai.call_gpt_single_async(prompt, 'gpt-4o-search-preview')
     except Exception as e:
         logger.exception(f"Error fact-checking message: {e}")
         return "Sorry, couldn't fact-check that message."
 
 
-async def cmd_gpt_chat(state: BotState, text: str) -> str:
+async def cmd_gpt_chat(state: BotState, text: str, message: discord.Message) -> Optional[str]:
     """
-    Chat with GPT using conversation history.
+    Chat with GPT using the channel's conversation history, streaming the reply.
+
+    The answer is posted while it is generated (see dapi.stream_reply).
+    History is kept within a token budget (see conversation.Conversation).
 
     Args:
-        state: Bot state containing message history
+        state: Bot state containing conversation history
         text: User message text
+        message: Discord message to reply to
 
     Returns:
-        GPT response or error message
+        None once the answer has been posted, or an error message
     """
     try:
-        oai.append_user_message(state.gpt_messages, text)
-        answer = oai.call_gpt(state.gpt_messages, text)
-        oai.append_assistant_message(state.gpt_messages, answer)
+        conversation = state.conversation(message.channel.id)
+        conversation.add('user', text)
+        answer = await stream_reply(message, oai.stream_gpt_async(conversation.messages()))
+        conversation.add('assistant', answer)
         logger.debug(f"GPT response generated for: {text[:50]}...")
-        return answer
+        return None
     except Exception as e:
         logger.exception(f"Error in GPT chat: {e}")
         return "Sorry, I couldn't process that request."
@@ -0,0 +1,400 @@
+"""Hangul syllable decomposition and jamo-level comparison for Korean bot."""
+
+from functools import lru_cache
+
+# ============================================================================
+# UNICODE TABLES
+# ============================================================================
+
+SYLLABLE_FIRST: int = 0xAC00  # 가
+SYLLABLE_LAST: int = 0xD7A3   # 힣
+
+INITIALS: tuple[str, ...] = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+MEDIALS: tuple[str, ...] = (
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ',
+    'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ',
+)
+FINALS: tuple[str, ...] = (
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+    'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+
+# Cost of a substitution that would turn a space into a letter (never allowed)
+_NO_MATCH: int = 10 ** 6
+
+
+# ============================================================================
+# DECOMPOSITION
+# ============================================================================
+
+
+def is_syllable(char: str) -> bool:
+    """
+    Check if a character is a precomposed Hangul syllable.
+
+    Args:
+        char: Single character
+
+    Returns:
+        True for characters in the 가-힣 block
+    """
+    return SYLLABLE_FIRST <= ord(char) <= SYLLABLE_LAST
+
+
+def decompose(char: str) -> tuple[int, int, int] | None:
+    """
+    Split a Hangul syllable into initial, medial and final table indices.
+
+    Args:
+        char: Single character
+
+    Returns:
+        (initial, medial, final) indices into INITIALS/MEDIALS/FINALS,
+        or None if char is not a Hangul syllable. Final index 0 means no final.
+    """
+    if not is_syllable(char):
+        return None
+    offset = ord(char) - SYLLABLE_FIRST
+    initial, rest = divmod(offset, 21 * 28)
+    medial, final = divmod(rest, 28)
+    return initial, medial, final
+
+
+@lru_cache(maxsize=4096)
+def to_jamo(char: str) -> str:
+    """
+    Convert a character to its compatibility jamo sequence.
+
+    Args:
+        char: Single character
+
+    Returns:
+        Jamo string (e.g. '각' -> 'ㄱㅏㄱ'); non-Hangul characters are returned as-is
+    """
+    parts = decompose(char)
+    if parts is None:
+        return char
+    initial, medial, final = parts
+    return INITIALS[initial] + MEDIALS[medial] + FINALS[final]
+
+
+def jamo_length(text: str) -> int:
+    """
+    Count jamo in a string, ignoring spaces.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Number of jamo (non-Hangul characters count as one each)
+    """
+    return sum(len(to_jamo(char)) for char in text if char != ' ')
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+
+def _levenshtein(a: str, b: str) -> int:
+    """Plain edit distance between two short strings."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        previous = current
+    return previous[-1]
+
+
+@lru_cache(maxsize=16384)
+def syllable_distance(a: str, b: str) -> int:
+    """
+    Jamo-level edit distance between two characters.
+
+    Args:
+        a: Expected character
+        b: Actual character
+
+    Returns:
+        Number of jamo edits to turn a into b (e.g. '갑' vs '감' -> 1)
+    """
+    if a == b:
+        return 0
+    if a == ' ' or b == ' ':
+        return _NO_MATCH
+    return _levenshtein(to_jamo(a), to_jamo(b))
+
+
+def _indel_cost(char: str) -> int:
+    """Cost of inserting or deleting a character (spaces are free)."""
+    return 0 if char == ' ' else len(to_jamo(char))
+
+
+def align(expected: str, actual: str) -> tuple[list[tuple[str, str, str]], int]:
+    """
+    Align two strings syllable by syllable using jamo-weighted edit costs.
+
+    Substituting one syllable for another costs its jamo distance, so
+    '갑니다' vs '감니다' is a single-jamo error rather than a whole syllable.
+    Spaces can be inserted or dropped for free; spacing is judged separately.
+
+    Args:
+        expected: Correct text
+        actual: Student text
+
+    Returns:
+        Tuple of (ops, distance). ops is a list of (op, expected, actual) where
+        op is 'equal', 'replace', 'missing' (in expected only) or 'extra'
+        (in actual only); consecutive ops of the same kind are merged.
+        distance is the total jamo edit distance.
+    """
+    rows, cols = len(expected), len(actual)
+    cost = [[0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        cost[i][0] = cost[i - 1][0] + _indel_cost(expected[i - 1])
+    for j in range(1, cols + 1):
+        cost[0][j] = cost[0][j - 1] + _indel_cost(actual[j - 1])
+
+    for i in range(1, rows + 1):
+        char_e = expected[i - 1]
+        row, above = cost[i], cost[i - 1]
+        for j in range(1, cols + 1):
+            char_a = actual[j - 1]
+            row[j] = min(
+                above[j - 1] + syllable_distance(char_e, char_a),
+                above[j] + _indel_cost(char_e),
+                row[j - 1] + _indel_cost(char_a),
+            )
+
+    # Backtrack from the bottom-right corner
+    ops: list[tuple[str, str, str]] = []
+    i, j = rows, cols
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            char_e, char_a = expected[i - 1], actual[j - 1]
+            if cost[i][j] == cost[i - 1][j - 1] + syllable_distance(char_e, char_a):
+                ops.append(('equal' if char_e == char_a else 'replace', char_e, char_a))
+                i, j = i - 1, j - 1
+                continue
+        if i > 0 and cost[i][j] == cost[i - 1][j] + _indel_cost(expected[i - 1]):
+            ops.append(('missing', expected[i - 1], ''))
+            i -= 1
+        else:
+            ops.append(('extra', '', actual[j - 1]))
+            j -= 1
+    ops.reverse()
+
+    merged: list[tuple[str, str, str]] = []
+    for op, char_e, char_a in ops:
+        if merged and merged[-1][0] == op:
+            _, prev_e, prev_a = merged[-1]
+            merged[-1] = (op, prev_e + char_e, prev_a + char_a)
+        else:
+            merged.append((op, char_e, char_a))
+
+    return merged, cost[rows][cols]
+
+
+# ============================================================================
+# REVISED ROMANIZATION
+# ============================================================================
+
+_RR_INITIALS: dict[str, str] = {
+    'ㄱ': 'g', 'ㄲ': 'kk', 'ㄴ': 'n', 'ㄷ': 'd', 'ㄸ': 'tt', 'ㄹ': 'r', 'ㅁ': 'm',
+    'ㅂ': 'b', 'ㅃ': 'pp', 'ㅅ': 's', 'ㅆ': 'ss', 'ㅇ': '', 'ㅈ': 'j', 'ㅉ': 'jj',
+    'ㅊ': 'ch', 'ㅋ': 'k', 'ㅌ': 't', 'ㅍ': 'p', 'ㅎ': 'h',
+}
+_RR_MEDIALS: dict[str, str] = {
+    'ㅏ': 'a', 'ㅐ': 'ae', 'ㅑ': 'ya', 'ㅒ': 'yae', 'ㅓ': 'eo', 'ㅔ': 'e', 'ㅕ': 'yeo',
+    'ㅖ': 'ye', 'ㅗ': 'o', 'ㅘ': 'wa', 'ㅙ': 'wae', 'ㅚ': 'oe', 'ㅛ': 'yo', 'ㅜ': 'u',
+    'ㅝ': 'wo', 'ㅞ': 'we', 'ㅟ': 'wi', 'ㅠ': 'yu', 'ㅡ': 'eu', 'ㅢ': 'ui', 'ㅣ': 'i',
+}
+# Finals as pronounced before a pause or consonant (7 representative sounds)
+_RR_FINALS: dict[str, str] = {
+    '': '', 'ㄱ': 'k', 'ㄲ': 'k', 'ㄳ': 'k', 'ㄴ': 'n', 'ㄵ': 'n', 'ㄶ': 'n',
+    'ㄷ': 't', 'ㄹ': 'l', 'ㄺ': 'k', 'ㄻ': 'm', 'ㄼ': 'l', 'ㄽ': 'l', 'ㄾ': 'l',
+    'ㄿ': 'p', 'ㅀ': 'l', 'ㅁ': 'm', 'ㅂ': 'p', 'ㅄ': 'p', 'ㅅ': 't', 'ㅆ': 't',
+    'ㅇ': 'ng', 'ㅈ': 't', 'ㅊ': 't', 'ㅋ': 'k', 'ㅌ': 't', 'ㅍ': 'p', 'ㅎ': 't',
+}
+# Compound finals before a vowel: (part that stays, part that moves over)
+_COMPOUND_SPLIT: dict[str, tuple[str, str]] = {
+    'ㄳ': ('ㄱ', 'ㅅ'), 'ㄵ': ('ㄴ', 'ㅈ'), 'ㄶ': ('', 'ㄴ'), 'ㄺ': ('ㄹ', 'ㄱ'),
+    'ㄻ': ('ㄹ', 'ㅁ'), 'ㄼ': ('ㄹ', 'ㅂ'), 'ㄽ': ('ㄹ', 'ㅅ'), 'ㄾ': ('ㄹ', 'ㅌ'),
+    'ㄿ': ('ㄹ', 'ㅍ'), 'ㅀ': ('', 'ㄹ'), 'ㅄ': ('ㅂ', 'ㅅ'),
+}
+# Words whose ㄼ final is pronounced ㅂ rather than the usual ㄹ when no vowel
+# follows (밟다 bapda, 밟는 bamneun, 넓죽하다 neopjukada; but 넓다 neolda)
+_RB_AS_B: tuple[str, ...] = ('밟', '넓죽', '넓둥')
+# ㅎ-final clusters: what remains once the ㅎ merges into the next consonant
+_H_FINALS: dict[str, str] = {'ㅎ': '', 'ㄶ': 'ㄴ', 'ㅀ': 'ㄹ'}
+# Lenis consonant -> aspirated counterpart
+_ASPIRATED: dict[str, str] = {'ㄱ': 'ㅋ', 'ㄷ': 'ㅌ', 'ㅂ': 'ㅍ', 'ㅈ': 'ㅊ'}
+# Obstruent finals grouped by the sound they neutralize to
+_K_FINALS = frozenset('ㄱㄲㅋㄳㄺ')
+_T_FINALS = frozenset('ㄷㅅㅆㅈㅊㅌ')
+_P_FINALS = frozenset('ㅂㅍㅄㄿ')
+
+
+def _liaison(final: str, initial: str) -> tuple[str, str]:
+    """
+    Move a final consonant into a following silent ㅇ (한국어 hangugeo).
+
+    A final ㅎ is dropped instead (좋아요 joayo) and only the second part of
+    a compound final moves (없어요 eopseoyo, 읽어요 ilgeoyo).
+
+    Args:
+        final: Final jamo of the first syllable ('' if none)
+        initial: Initial jamo of the next syllable
+
+    Returns:
+        (final, initial) jamo after liaison
+    """
+    if initial != 'ㅇ' or final in ('', 'ㅇ'):
+        return final, initial
+    if final == 'ㅎ':
+        return '', initial
+    return _COMPOUND_SPLIT.get(final, ('', final))
+
+
+def _assimilate(final: str, initial: str, medial: str) -> tuple[str, str]:
+    """
+    Apply sound-change rules across a syllable boundary.
+
+    Covers liaison, palatalization, aspiration, nasalization and
+    liquidization, which Revised Romanization transcribes.
+
+    Args:
+        final: Final jamo of the first syllable ('' if none)
+        initial: Initial jamo of the next syllable
+        medial: Medial jamo of the next syllable
+
+    Returns:
+        (final, initial) jamo after assimilation
+    """
+    if not final:
+        return final, initial
+
+    if initial == 'ㅇ':
+        final, initial = _liaison(final, initial)
+        # Palatalization: ㄷ/ㅌ before 이 -> ㅈ/ㅊ (굳이 guji, 같이 gachi)
+        if medial == 'ㅣ' and initial in ('ㄷ', 'ㅌ'):
+            initial = 'ㅈ' if initial == 'ㄷ' else 'ㅊ'
+        return final, initial
+
+    # Aspiration: obstruent + ㅎ (축하 chuka, 입학 ipak, 굳히다 guchida)
+    if initial == 'ㅎ':
+        stay, last = _COMPOUND_SPLIT.get(final, ('', final))
+        if last in _K_FINALS:
+            return stay, 'ㅋ'
+        if last in _T_FINALS:
+            return stay, 'ㅊ' if (medial == 'ㅣ' or last == 'ㅈ') else 'ㅌ'
+        if last in _P_FINALS:
+            return stay, 'ㅍ'
+        return final, initial
+
+    # ㅎ + lenis consonant (좋다 jota, 않고 anko, 좋소 josso, 놓는 nonneun)
+    if final in _H_FINALS:
+        remaining = _H_FINALS[final]
+        if initial in _ASPIRATED:
+            return remaining, _ASPIRATED[initial]
+        if initial == 'ㅅ':
+            return remaining, 'ㅆ'
+        if initial == 'ㄴ':
+            return (remaining, 'ㄹ') if remaining == 'ㄹ' else ('ㄴ', 'ㄴ')
+        final = remaining or 'ㄷ'
+
+    # ㄺ is pronounced ㄹ before ㄱ (읽고 ilgo, 맑게 malge)
+    if final == 'ㄺ' and initial == 'ㄱ':
+        return 'ㄹ', initial
+
+    sound = _RR_FINALS[final]
+
+    # Nasalization: k/t/p before ㄴ/ㅁ (국물 gungmul, 합니다 hamnida)
+    if initial in ('ㄴ', 'ㅁ'):
+        if sound == 'k':
+            return 'ㅇ', initial
+        if sound == 't':
+            return 'ㄴ', initial
+        if sound == 'p':
+            return 'ㅁ', initial
+        if sound == 'l' and initial == 'ㄴ':
+            return final, 'ㄹ'  # 설날 seollal
+        return final, initial
+
+    if initial == 'ㄹ':
+        if sound == 'n':
+            return 'ㄹ', initial  # 신라 silla
+        if sound in ('m', 'ng'):
+            return final, 'ㄴ'  # 심리 simni, 종로 jongno
+        if sound == 'k':
+            return 'ㅇ', 'ㄴ'  # 독립 dongnip
+        if sound == 'p':
+            return 'ㅁ', 'ㄴ'  # 협력 hyeomnyeok
+        if sound == 't':
+            return 'ㄴ', 'ㄴ'
+
+    return final, initial
+
+
+def romanize(text: str, assimilate: bool = True) -> str:
+    """
+    Romanize Korean text using the Revised Romanization of Korean.
+
+    Non-Hangul characters (spaces, punctuation, Latin) pass through unchanged.
+    Sound changes are applied within runs of Hangul syllables.
+
+    Args:
+        text: Korean text
+        assimilate: If False, apply liaison only and no other sound changes
+            (e.g. 합니다 -> hapnida instead of hamnida, but 없어요 -> eopseoyo)
+
+    Returns:
+        Romanized text, e.g. '감사합니다' -> 'gamsahamnida'
+    """
+    # Syllables as mutable [initial, medial, final] jamo; other chars as str
+    units: list[list[str] | str] = []
+    for i, char in enumerate(text):
+        parts = decompose(char)
+        if parts is None:
+            units.append(char)
+            continue
+        initial, medial, final = parts
+        final_jamo = FINALS[final]
+        if (
+            final_jamo == 'ㄼ'
+            and any(text.startswith(word, i) for word in _RB_AS_B)
+            and not (i + 1 < len(text) and to_jamo(text[i + 1])[0] == 'ㅇ')
+        ):
+            final_jamo = 'ㅂ'
+        units.append([INITIALS[initial], MEDIALS[medial], final_jamo])
+
+    for current, following in zip(units, units[1:]):
+        if isinstance(current, list) and isinstance(following, list):
+            if assimilate:
+                current[2], following[0] = _assimilate(current[2], following[0], following[1])
+            else:
+                current[2], following[0] = _liaison(current[2], following[0])
+
+    out = []
+    previous_final = ''
+    for unit in units:
+        if isinstance(unit, str):
+            out.append(unit)
+            previous_final = ''
+            continue
+        initial, medial, final = unit
+        # ㄹ is 'l' after an ㄹ final (ll), 'r' elsewhere
+        out.append('l' if initial == 'ㄹ' and previous_final == 'ㄹ' else _RR_INITIALS[initial])
+        out.append(_RR_MEDIALS[medial])
+        out.append(_RR_FINALS[final])
+        previous_final = final
+
+    return ''.join(out)
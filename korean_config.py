@@ -48,6 +48,73 @@ except ValueError as e:
     raise ValueError(f"Invalid channel ID configuration: {e}")
 
 
+# ============================================================================
+# CONCURRENCY
+# ============================================================================
+
+# In-flight Korean bot pipelines (independent of SpencerBot load)
+MAX_CONCURRENT_KOREAN_TASKS: int = 8
+
+# Messages a single user may have pending (including the one being processed)
+MAX_PENDING_MESSAGES_PER_USER: int = 3
+
+
+# ============================================================================
+# MODEL TIERS
+# ============================================================================
+
+MODEL_FAST: str = os.getenv('MODEL_FAST', 'gpt-5-mini')
+MODEL_LARGE: str = os.getenv('MODEL_LARGE', 'gpt-5.4')
+
+# Fast-tier grades below this self-reported confidence are re-graded on the large tier
+ESCALATION_CONFIDENCE: float = float(os.getenv('ESCALATION_CONFIDENCE', '0.7'))
+
+# Answers longer than this (characters) skip the fast tier
+LONG_ANSWER_CHARS: int = 200
+
+# Route per gpt.py function: 'fast' (escalates when unsure), 'large', or a model name.
+# Override one with MODEL_<FUNCTION>, e.g. MODEL_GRADE_WRITING=large
+_DEFAULT_MODEL_ROUTES: dict[str, str] = {
+    'generate_vocab_list': 'large',
+    'generate_translation_exercise': 'large',
+    'generate_audio_exercise': 'large',
+    'generate_dictation_exercise': 'large',
+    'generate_cloze_exercise': 'large',
+    'generate_reading_exercise': 'large',
+    'generate_write_prompt': 'large',
+    'generate_build_exercise': 'large',
+    'grade_translation': 'fast',
+    'grade_audio_response': 'fast',
+    'grade_dictation': 'fast',
+    'grade_cloze': 'fast',
+    'grade_reading': 'fast',
+    'grade_writing': 'fast',
+    'grade_build': 'fast',
+}
+MODEL_ROUTES: dict[str, str] = {
+    name: os.getenv(f'MODEL_{name.upper()}', route)
+    for name, route in _DEFAULT_MODEL_ROUTES.items()
+}
+
+# USD per million tokens (input, output), used for cost reporting only.
+# Keep in sync with OpenAI pricing; unknown models are reported without cost.
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    'gpt-5-mini': (0.25, 2.00),
+    'gpt-5.4': (2.50, 15.00),
+}
+
+
+# ============================================================================
+# GRADE CACHE
+# ============================================================================
+
+# Grades kept in memory (least recently used are evicted first)
+GRADE_CACHE_SIZE: int = 2048
+
+# Optional SQLite file so cached grades survive restarts (unset = memory only)
+GRADE_CACHE_PATH: str | None = os.getenv('GRADE_CACHE_PATH') or None
+
+
 # ============================================================================
 # ANKI CONFIGURATION
 # ============================================================================
@@ -1,5 +1,12 @@
 """Per-user session state management for Korean bot."""
 
+import asyncio
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from typing import Any
+
+from korean_config import logger, MAX_CONCURRENT_KOREAN_TASKS, MAX_PENDING_MESSAGES_PER_USER
+
 # Module-level state storage
 _state: dict[int, dict] = {}
 # Key: user_id
@@ -8,6 +15,19 @@ _state: dict[int, dict] = {}
 #     "exercise": dict | None,
 # }
 
+# Per-user turn serialization
+_turn_locks: dict[int, asyncio.Lock] = {}
+_turn_pending: dict[int, int] = {}
+
+# In-flight generation/grading task per user, and a counter bumped every time
+# that work is interrupted so queued messages can tell they were superseded
+_inflight: dict[int, asyncio.Task] = {}
+_epochs: dict[int, int] = {}
+
+# Limits Korean bot work across all users; created on first use so it binds
+# to the running event loop
+_work_slots: asyncio.Semaphore | None = None
+
 
 def get_active_deck(user_id: int) -> str | None:
     """
@@ -87,3 +107,121 @@ def clear_active_deck(user_id: int) -> None:
     if user_id not in _state:
         _state[user_id] = {'active_deck': None, 'exercise': None}
     _state[user_id]['active_deck'] = None
+
+
+def is_turn_queue_full(user_id: int) -> bool:
+    """
+    Check if a user already has the maximum number of messages pending.
+
+    Args:
+        user_id: Discord user ID
+
+    Returns:
+        True if a new message from this user should be dropped
+    """
+    return _turn_pending.get(user_id, 0) >= MAX_PENDING_MESSAGES_PER_USER
+
+
+@asynccontextmanager
+async def user_turn(user_id: int) -> AsyncIterator[None]:
+    """
+    Process one message for a user, waiting for their earlier messages first.
+
+    Messages from the same user run one at a time in arrival order; different
+    users never wait on each other.
+
+    Args:
+        user_id: Discord user ID
+    """
+    lock = _turn_locks.setdefault(user_id, asyncio.Lock())
+    _turn_pending[user_id] = _turn_pending.get(user_id, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        _turn_pending[user_id] -= 1
+        if _turn_pending[user_id] == 0:
+            del _turn_pending[user_id]
+            del _turn_locks[user_id]
+
+
+@asynccontextmanager
+async def work_slot() -> AsyncIterator[None]:
+    """
+    Hold one of the MAX_CONCURRENT_KOREAN_TASKS slots for Korean bot work.
+
+    Taken only around the actual generation, grading or sync work, never
+    while a message waits for its user's turn, so users queued behind their
+    own earlier messages do not starve everyone else.
+    """
+    global _work_slots
+    if _work_slots is None:
+        _work_slots = asyncio.Semaphore(MAX_CONCURRENT_KOREAN_TASKS)
+    async with _work_slots:
+        yield
+
+
+async def _run_in_slot(coro: Coroutine[Any, Any, None]) -> None:
+    async with work_slot():
+        await coro
+
+
+async def run_tracked(user_id: int, coro: Coroutine[Any, Any, None]) -> None:
+    """
+    Run a user's exercise work as a tracked task that can be interrupted.
+
+    Cancelling the task (see interrupt_session) aborts any awaited OpenAI or
+    TTS request, closing its HTTP connection, so nothing stale is stored or
+    posted. The work holds a work_slot while it runs.
+
+    Args:
+        user_id: Discord user ID
+        coro: Coroutine doing the generation and/or grading work
+    """
+    task = asyncio.create_task(_run_in_slot(coro), name=f'korean-user-{user_id}')
+    _inflight[user_id] = task
+    try:
+        # asyncio.wait does not raise when the inner task is cancelled
+        await asyncio.wait({task})
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        if _inflight.get(user_id) is task:
+            del _inflight[user_id]
+
+    if task.cancelled():
+        logger.info(f'Cancelled in-flight exercise work for user {user_id}')
+        return
+    task.result()
+
+
+def interrupt_session(user_id: int) -> bool:
+    """
+    Cancel a user's in-flight exercise work and supersede queued messages.
+
+    Args:
+        user_id: Discord user ID
+
+    Returns:
+        True if a generation or grading task was cancelled
+    """
+    _epochs[user_id] = _epochs.get(user_id, 0) + 1
+    task = _inflight.get(user_id)
+    if task is None or task.done():
+        return False
+    task.cancel()
+    return True
+
+
+def get_session_epoch(user_id: int) -> int:
+    """
+    Get the interrupt counter for a user.
+
+    Args:
+        user_id: Discord user ID
+
+    Returns:
+        Number of times the user's session has been interrupted
+    """
+    return _epochs.get(user_id, 0)
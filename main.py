@@ -13,6 +13,22 @@ from state import BotState
 from events import setup_events
 
 
+class SpencerBot(commands.Bot):
+    """Bot that writes out queued messages before it shuts down."""
+
+    def __init__(self, bot_state: BotState, **kwargs):
+        super().__init__(**kwargs)
+        self.bot_state = bot_state
+
+    async def close(self) -> None:
+        """Flush the message store, then disconnect."""
+        try:
+            await self.bot_state.message_store.flush()
+        except Exception as e:
+            logger.exception(f"Failed to flush message store on shutdown: {e}")
+        await super().close()
+
+
 def main() -> None:
     """Initialize and run the Discord bot."""
     try:
@@ -22,14 +38,14 @@ def main() -> None:
 
         logger.info("Configuration loaded successfully")
 
-        # Initialize Discord bot
-        intents = discord.Intents.all()
-        bot = commands.Bot(command_prefix='!', intents=intents)
-
         # Initialize bot state
         bot_state = BotState()
         logger.info("Bot state initialized")
 
+        # Initialize Discord bot
+        intents = discord.Intents.all()
+        bot = SpencerBot(bot_state, command_prefix='!', intents=intents)
+
         # Setup event handlers (includes both SpencerBot and Korean bot)
         setup_events(bot, bot_state)
         logger.info("Event handlers registered")
@@ -0,0 +1,239 @@
+"""Persistent SQLite message log for SpencerBot summarize and fact-check."""
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from config import (
+    logger,
+    MESSAGE_STORE_PATH,
+    MESSAGE_STORE_BATCH_SIZE,
+    MESSAGE_STORE_FLUSH_INTERVAL,
+    MESSAGE_RETENTION_DAYS,
+    MESSAGE_STORE_CHANNEL_LIMIT,
+    SECONDS_PER_DAY,
+    SECONDS_PER_HOUR,
+)
+
+if TYPE_CHECKING:
+    # state.py imports this module for BotState
+    from state import MessageDict
+
+# Seconds between retention passes
+RETENTION_INTERVAL: int = SECONDS_PER_HOUR
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS messages (
+    channel_id INTEGER NOT NULL,
+    message_id INTEGER NOT NULL,
+    reference_id INTEGER,
+    name TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (channel_id, message_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS messages_created_at ON messages (created_at);
+'''
+_COLUMNS = 'message_id, channel_id, reference_id, name, text'
+
+
+def _to_message(row: tuple) -> 'MessageDict':
+    return {
+        'message_id': row[0], 'channel_id': row[1], 'reference_id': row[2],
+        'name': row[3], 'text': row[4],
+    }
+
+
+class MessageStore:
+    """
+    Append-only message log in SQLite (WAL mode).
+
+    record() only queues the message; a background task writes queued
+    messages in batches. All database work runs on one worker thread, so
+    the event loop never blocks on disk and the connection is never shared
+    between threads. Messages are keyed by (channel_id, message_id); Discord
+    message IDs increase over time, so ranges are read in ID order.
+    """
+
+    def __init__(self, path: str = MESSAGE_STORE_PATH):
+        self.path = path
+        self._queue: asyncio.Queue[tuple['MessageDict', float]] | None = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flush_waiters = 0
+        self._writer: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='message-store')
+        self._conn: Optional[sqlite3.Connection] = None
+        self._touched_channels: set[int] = set()
+        self._last_retention = 0.0
+
+    # ------------------------------------------------------------------
+    # Worker-thread side
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _write_batch(self, batch: list[tuple['MessageDict', float]]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO messages '
+                '(message_id, channel_id, reference_id, name, text, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (m['message_id'], m['channel_id'], m['reference_id'], m['name'], m['text'], created_at)
+                    for m, created_at in batch
+                ],
+            )
+        self._touched_channels.update(m['channel_id'] for m, _ in batch)
+
+        if time.time() - self._last_retention >= RETENTION_INTERVAL:
+            self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        """Delete messages past MESSAGE_RETENTION_DAYS or beyond each channel's limit."""
+        conn = self._connect()
+        cutoff = time.time() - MESSAGE_RETENTION_DAYS * SECONDS_PER_DAY
+        with conn:
+            deleted = conn.execute('DELETE FROM messages WHERE created_at < ?', (cutoff,)).rowcount
+            for channel_id in self._touched_channels:
+                deleted += conn.execute(
+                    'DELETE FROM messages WHERE channel_id = ? AND message_id <= ('
+                    '  SELECT message_id FROM messages WHERE channel_id = ?'
+                    '  ORDER BY message_id DESC LIMIT 1 OFFSET ?'
+                    ')',
+                    (channel_id, channel_id, MESSAGE_STORE_CHANNEL_LIMIT),
+                ).rowcount
+        self._touched_channels.clear()
+        self._last_retention = time.time()
+        if deleted:
+            logger.info(f'Message store retention removed {deleted} messages')
+
+    def _query(self, sql: str, params: tuple) -> list['MessageDict']:
+        return [_to_message(row) for row in self._connect().execute(sql, params)]
+
+    # ------------------------------------------------------------------
+    # Event-loop side
+    # ------------------------------------------------------------------
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def record(self, message: 'MessageDict') -> None:
+        """
+        Queue a message to be written. Never blocks.
+
+        Args:
+            message: Message to store
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._flush_requested = asyncio.Event()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop(), name='message-store-writer')
+        self._queue.put_nowait((message, time.time()))
+
+    async def _write_loop(self) -> None:
+        """Write queued messages in batches of up to MESSAGE_STORE_BATCH_SIZE."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Collect more until the batch is full, the interval ends or a reader flushes
+            if queue.qsize() < MESSAGE_STORE_BATCH_SIZE - 1:
+                try:
+                    await asyncio.wait_for(self._flush_requested.wait(), MESSAGE_STORE_FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            while len(batch) < MESSAGE_STORE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self._run(self._write_batch, batch)
+            except Exception as e:
+                logger.exception(f'Failed to store {len(batch)} messages: {e}')
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been written."""
+        if self._queue is not None and self._writer is not None and not self._writer.done():
+            self._flush_waiters += 1
+            self._flush_requested.set()
+            try:
+                await self._queue.join()
+            finally:
+                self._flush_waiters -= 1
+                if not self._flush_waiters:
+                    self._flush_requested.clear()
+
+    async def get(self, channel_id: int, message_id: Optional[int]) -> Optional['MessageDict']:
+        """
+        Read one message.
+
+        Args:
+            channel_id: Channel ID
+            message_id: Message ID (None returns None)
+
+        Returns:
+            The message, or None if it is not stored
+        """
+        if message_id is None:
+            return None
+        await self.flush()
+        rows = await self._run(
+            self._query,
+            f'SELECT {_COLUMNS} FROM messages WHERE channel_id = ? AND message_id = ?',
+            (channel_id, message_id),
+        )
+        return rows[0] if rows else None
+
+    async def since(self, channel_id: int, message_id: Optional[int], limit: int) -> list['MessageDict']:
+        """
+        Read a message and up to limit - 1 messages after it.
+
+        Args:
+            channel_id: Channel ID
+            message_id: First message ID
+            limit: Maximum number of messages
+
+        Returns:
+            Messages in order, or an empty list if the first one is not stored
+        """
+        if await self.get(channel_id, message_id) is None:
+            return []
+        return await self._run(
+            self._query,
+            f'SELECT {_COLUMNS} FROM messages WHERE channel_id = ? AND message_id >= ? '
+            'ORDER BY message_id LIMIT ?',
+            (channel_id, message_id, limit),
+        )
+
+    async def before(self, channel_id: int, message_id: int, count: int) -> list['MessageDict']:
+        """
+        Read up to count messages preceding a message.
+
+        Args:
+            channel_id: Channel ID
+            message_id: Message ID
+            count: Maximum number of messages
+
+        Returns:
+            Messages in order
+        """
+        await self.flush()
+        rows = await self._run(
+            self._query,
+            f'SELECT {_COLUMNS} FROM messages WHERE channel_id = ? AND message_id < ? '
+            'ORDER BY message_id DESC LIMIT ?',
+            (channel_id, message_id, count),
+        )
+        return rows[::-1]
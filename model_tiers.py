@@ -0,0 +1,117 @@
+"""Model tier routing and per-model latency/cost accounting for Korean bot."""
+
+from korean_config import (
+    logger,
+    MODEL_FAST,
+    MODEL_LARGE,
+    MODEL_ROUTES,
+    MODEL_PRICES,
+)
+
+FAST: str = 'fast'
+LARGE: str = 'large'
+
+# Log a usage summary every this many completions
+SUMMARY_INTERVAL: int = 50
+
+# Model -> accumulated usage
+stats: dict[str, dict[str, float]] = {}
+
+
+def route(function: str) -> str:
+    """
+    Get the configured route for a gpt.py function.
+
+    Args:
+        function: Function name (e.g. 'grade_writing')
+
+    Returns:
+        'fast', 'large' or an explicit model name
+    """
+    return MODEL_ROUTES.get(function, LARGE)
+
+
+def model_for(tier: str) -> str:
+    """
+    Resolve a route to a model name.
+
+    Args:
+        tier: 'fast', 'large' or an explicit model name
+
+    Returns:
+        Model name
+    """
+    if tier == FAST:
+        return MODEL_FAST
+    if tier == LARGE:
+        return MODEL_LARGE
+    return tier
+
+
+def cost(model: str, prompt_tokens: int, completion_tokens: int) -> float | None:
+    """
+    Estimate the cost of a completion.
+
+    Args:
+        model: Model name
+        prompt_tokens: Input tokens
+        completion_tokens: Output tokens
+
+    Returns:
+        Cost in USD, or None if the model has no configured price
+    """
+    price = MODEL_PRICES.get(model)
+    if price is None:
+        return None
+    return (prompt_tokens * price[0] + completion_tokens * price[1]) / 1_000_000
+
+
+def record(function: str, model: str, elapsed: float, usage) -> None:
+    """
+    Record latency and token usage of one completion.
+
+    Args:
+        function: gpt.py function that made the call
+        model: Model used
+        elapsed: Wall-clock seconds for the request
+        usage: OpenAI usage object (may be None)
+    """
+    prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+    completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+    call_cost = cost(model, prompt_tokens, completion_tokens)
+
+    entry = stats.setdefault(model, {
+        'calls': 0, 'seconds': 0.0, 'prompt_tokens': 0, 'completion_tokens': 0, 'cost': 0.0,
+    })
+    entry['calls'] += 1
+    entry['seconds'] += elapsed
+    entry['prompt_tokens'] += prompt_tokens
+    entry['completion_tokens'] += completion_tokens
+    entry['cost'] += call_cost or 0.0
+
+    logger.debug(
+        f'{function} on {model}: {elapsed:.2f}s, '
+        f'{prompt_tokens}+{completion_tokens} tokens'
+        + (f', ${call_cost:.5f}' if call_cost is not None else '')
+    )
+
+    if sum(e['calls'] for e in stats.values()) % SUMMARY_INTERVAL == 0:
+        logger.info(f'Model usage: {summary()}')
+
+
+def summary() -> str:
+    """
+    Summarize usage per model.
+
+    Returns:
+        One line per model with calls, mean latency, tokens and cost
+    """
+    lines = []
+    for model, entry in sorted(stats.items()):
+        calls = int(entry['calls'])
+        lines.append(
+            f'{model}: {calls} calls, {entry["seconds"] / calls:.2f}s avg, '
+            f'{int(entry["prompt_tokens"])}+{int(entry["completion_tokens"])} tokens, '
+            f'${entry["cost"]:.4f}'
+        )
+    return '; '.join(lines) or 'no calls yet'
@@ -1,4 +1,4 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -8,17 +8,7 @@ from time import sleep
 load_dotenv(dotenv_path=Path(__file__).parent / '.env')
 
 client = OpenAI(api_key=os.getenv('OPENAI_API_KEY', ''))
-
-async def tts(text):
-    response = client.audio.speech.create(
-        model="tts-1",
-        voice="alloy",
-        input=text
-    )
-
-    response.stream_to_file('./speech.mp3')
-
-    return './speech.mp3'
+async_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY', ''))
 
 def vision(image):
     response = client.chat.completions.create(
@@ -73,6 +63,34 @@ def call_gpt(messages, preface = None, model='gpt-5-mini'):
 
 def call_gpt_single(text, model='gpt-5-mini'):
     return call_gpt([{'role': 'user', 'content': text}], model=model)
+
+# Async equivalents of call_gpt/call_gpt_single for use inside the event loop
+async def call_gpt_async(messages, preface = None, model='gpt-5-mini'):
+    system_preface = [{'role': 'system', 'content': preface}] if preface else []
+    completion = await async_client.chat.completions.create(
+            model=model,
+            messages= system_preface + messages
+        )
+
+    answer = completion.choices[0].message.content.strip()
+
+    return answer
+
+async def call_gpt_single_async(text, model='gpt-5-mini'):
+    return await call_gpt_async([{'role': 'user', 'content': text}], model=model)
+
+# Yields the answer text piece by piece as it is generated
+async def stream_gpt_async(messages, preface = None, model='gpt-5-mini'):
+    system_preface = [{'role': 'system', 'content': preface}] if preface else []
+    stream = await async_client.chat.completions.create(
+            model=model,
+            messages= system_preface + messages,
+            stream=True
+        )
+
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
     
 def append_user_message(message, text):
     return message.append({'role': 'user', 'content': text})
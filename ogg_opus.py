@@ -0,0 +1,96 @@
+"""Ogg Opus passthrough audio source, so Opus TTS plays without FFmpeg."""
+
+from typing import IO, Iterator
+
+import discord
+from discord.oggparse import OggStream
+
+from config import logger
+
+# Discord sends one Opus packet per 20 ms tick
+FRAME_MS: float = 20.0
+
+# Frame duration in ms by TOC config number (RFC 6716, section 3.1)
+_CONFIG_FRAME_MS: tuple[float, ...] = (
+    (10.0, 20.0, 40.0, 60.0) * 3  # SILK-only, configs 0-11
+    + (10.0, 20.0) * 2  # Hybrid, configs 12-15
+    + (2.5, 5.0, 10.0, 20.0) * 4  # CELT-only, configs 16-31
+)
+
+
+def packet_duration_ms(packet: bytes) -> float:
+    """
+    Duration of an Opus packet, from its TOC byte.
+
+    Args:
+        packet: Opus packet
+
+    Returns:
+        Duration in milliseconds (0 for an empty or malformed packet)
+    """
+    if not packet:
+        return 0.0
+    frame_ms = _CONFIG_FRAME_MS[packet[0] >> 3]
+    code = packet[0] & 0x03
+    if code == 0:
+        frames = 1
+    elif code in (1, 2):
+        frames = 2
+    elif len(packet) > 1:
+        frames = packet[1] & 0x3F
+    else:
+        return 0.0
+    return frame_ms * frames
+
+
+class _ExactReader:
+    """Read exactly n bytes (or until EOF) from a source that may return short reads."""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+
+    def read(self, size: int) -> bytes:
+        data = self.stream.read(size)
+        while data and len(data) < size:
+            more = self.stream.read(size - len(data))
+            if not more:
+                break
+            data += more
+        return data
+
+
+class OggOpusSource(discord.AudioSource):
+    """
+    Audio source that hands Ogg Opus packets to the voice client unchanged.
+
+    Unlike FFmpegPCMAudio, nothing is decoded or re-encoded, and no
+    subprocess is started. The stream must contain 20 ms packets (what
+    OpenAI TTS produces); other durations are logged, since they would
+    play at the wrong speed.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self._packets: Iterator[bytes] = OggStream(_ExactReader(stream)).iter_packets()
+        self._warned = False
+
+    def read(self) -> bytes:
+        """
+        Return the next Opus packet (called from the player thread).
+
+        Returns:
+            Opus packet, or b'' at the end of the stream
+        """
+        for packet in self._packets:
+            # Skip the identification and comment headers
+            if packet.startswith((b'OpusHead', b'OpusTags')):
+                continue
+            duration = packet_duration_ms(packet)
+            if duration != FRAME_MS and not self._warned:
+                self._warned = True
+                logger.warning(f'Opus packet is {duration} ms, not {FRAME_MS} ms; playback speed will be off')
+            return packet
+        return b''
+
+    def is_opus(self) -> bool:
+        return True
+
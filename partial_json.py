@@ -0,0 +1,161 @@
+"""Best-effort parsing of a JSON object that is still being streamed."""
+
+import json
+import re
+
+_CLOSERS: dict[str, str] = {'{': '}', '[': ']'}
+# A \uXXXX escape cut off at the end of the text (the backslash run must be odd)
+_PARTIAL_UNICODE_ESCAPE = re.compile(r'(\\+)u[0-9a-fA-F]{0,3}$')
+
+
+class PartialJsonParser:
+    """
+    Incrementally parse the usable part of a streamed JSON object.
+
+    Keeps every finished top-level field, every finished item of an array,
+    and the text so far of a top-level string value, so callers can show
+    e.g. the score as soon as it is complete and feedback as it is written.
+    Unfinished numbers, literals, keys and nested objects are dropped
+    rather than shown half-formed.
+
+    Each character is scanned once, so feeding a whole completion token by
+    token stays linear in its length.
+    """
+
+    def __init__(self):
+        self.text = ''
+        # Each open container as [opener, expecting] where expecting is
+        # 'key', 'colon', 'value' or 'comma'
+        self._stack: list[list[str]] = []
+        self._started = False
+        self._done = False
+        self._safe_end = 0
+        self._safe_closers = ''
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._scalar = False
+
+    def feed(self, chunk: str) -> dict | None:
+        """
+        Add streamed text and parse what is usable so far.
+
+        Args:
+            chunk: Next piece of the completion
+
+        Returns:
+            Parsed object, or None if nothing usable has arrived yet
+        """
+        if not self._started:
+            start = chunk.find('{')
+            if start < 0:
+                return None
+            chunk = chunk[start:]
+            self._started = True
+
+        offset = len(self.text)
+        self.text += chunk
+        if not self._done:
+            for i, char in enumerate(chunk, offset):
+                self._scan(i, char)
+                if self._done:
+                    break
+        return self.current()
+
+    def current(self) -> dict | None:
+        """
+        Parse the text received so far.
+
+        Returns:
+            Parsed object, or None if nothing usable has arrived yet
+        """
+        candidates = []
+        # A top-level string value still being written is shown as-is
+        if self._in_string and not self._string_is_key and len(self._stack) == 1:
+            partial = self.text[:-1] if self._escape else self.text
+            escape = _PARTIAL_UNICODE_ESCAPE.search(partial)
+            if escape and len(escape.group(1)) % 2:
+                partial = partial[:escape.start() + len(escape.group(1)) - 1]
+            candidates.append(partial + '"' + self._closers())
+        if self._safe_end:
+            candidates.append(self.text[:self._safe_end] + self._safe_closers)
+
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                return parsed
+        return None
+
+    def _closers(self) -> str:
+        return ''.join(_CLOSERS[opener] for opener, _ in reversed(self._stack))
+
+    def _mark_safe(self, end: int) -> None:
+        self._safe_end, self._safe_closers = end, self._closers()
+
+    def _value_done(self, end: int) -> None:
+        if not self._stack:
+            self._mark_safe(end)
+            return
+        self._stack[-1][1] = 'comma'
+        # Only finished array items and top-level fields are shown
+        if self._stack[-1][0] == '[' or len(self._stack) == 1:
+            self._mark_safe(end)
+
+    def _scan(self, i: int, char: str) -> None:
+        stack = self._stack
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == '\\':
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._string_is_key:
+                    stack[-1][1] = 'colon'
+                else:
+                    self._value_done(i + 1)
+            return
+
+        if self._scalar and (char in ',}]' or char.isspace()):
+            self._scalar = False
+            self._value_done(i)
+
+        if char.isspace():
+            return
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = bool(stack) and stack[-1][0] == '{' and stack[-1][1] == 'key'
+        elif char in '{[':
+            top_level = not stack
+            stack.append([char, 'key' if char == '{' else 'value'])
+            if top_level or char == '[':
+                self._mark_safe(i + 1)
+        elif char in '}]':
+            if stack:
+                stack.pop()
+                self._value_done(i + 1)
+            self._done = not stack
+        elif char == ':':
+            if stack:
+                stack[-1][1] = 'value'
+        elif char == ',':
+            if stack:
+                stack[-1][1] = 'key' if stack[-1][0] == '{' else 'value'
+        else:
+            self._scalar = True
+
+
+def parse_partial_json(text: str) -> dict | None:
+    """
+    Parse the usable part of an incomplete JSON object.
+
+    Args:
+        text: JSON text received so far
+
+    Returns:
+        Parsed object, or None if nothing usable has arrived yet
+    """
+    return PartialJsonParser().feed(text)
@@ -0,0 +1,140 @@
+"""Per-user debouncing of TTS so bursts of short messages become one utterance."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from config import (
+    logger,
+    TTS_DEBOUNCE_WINDOW,
+    TTS_DEBOUNCE_MAX_CHARS,
+    TTS_DEBOUNCE_MAX_DELAY,
+)
+
+# Speaks merged text
+SpeakFn = Callable[[str], Awaitable[None]]
+
+_SENTENCE_ENDINGS: tuple[str, ...] = ('.', '!', '?', '…', '。')
+
+# Log a summary every this many utterances
+SUMMARY_INTERVAL: int = 100
+
+
+def join_messages(texts: list[str]) -> str:
+    """
+    Join consecutive messages into one utterance, ending each with a pause.
+
+    Args:
+        texts: Message texts in order
+
+    Returns:
+        Merged text
+    """
+    parts = []
+    for text in texts:
+        text = text.strip()
+        if text:
+            parts.append(text if text.endswith(_SENTENCE_ENDINGS) else f'{text}.')
+    return ' '.join(parts)
+
+
+class _Burst:
+    """Messages from one user waiting to be spoken together."""
+
+    __slots__ = ('texts', 'chars', 'first_at', 'last_at', 'speak', 'timer')
+
+    def __init__(self, now: float):
+        self.texts: list[str] = []
+        self.chars = 0
+        self.first_at = now
+        self.last_at = now
+        self.speak: Optional[SpeakFn] = None
+        self.timer: Optional[asyncio.Task] = None
+
+
+class SpeechDebouncer:
+    """
+    Merge each user's consecutive messages into one TTS request.
+
+    A burst is spoken once the user has been quiet for TTS_DEBOUNCE_WINDOW
+    seconds, once its first message has waited TTS_DEBOUNCE_MAX_DELAY, or
+    before it would grow past TTS_DEBOUNCE_MAX_CHARS, whichever comes first.
+    """
+
+    def __init__(self):
+        self._bursts: dict[int, _Burst] = {}
+        self._speaking: set[asyncio.Task] = set()
+        self.stats: dict[str, int] = {'messages': 0, 'utterances': 0}
+
+    def add(self, user_id: int, text: str, speak: SpeakFn) -> None:
+        """
+        Add a message to the user's burst.
+
+        Args:
+            user_id: Discord user ID
+            text: Message text
+            speak: Coroutine function speaking merged text; the latest one
+                is used, so the burst plays where the user is now
+        """
+        self.stats['messages'] += 1
+        now = time.monotonic()
+
+        burst = self._bursts.get(user_id)
+        if burst is not None and burst.chars + len(text) > TTS_DEBOUNCE_MAX_CHARS:
+            self._flush(user_id)
+            burst = None
+        if burst is None:
+            burst = self._bursts[user_id] = _Burst(now)
+            burst.timer = asyncio.create_task(self._wait(user_id, burst), name=f'tts-debounce-{user_id}')
+
+        burst.texts.append(text)
+        burst.chars += len(text)
+        burst.last_at = now
+        burst.speak = speak
+
+    async def _wait(self, user_id: int, burst: _Burst) -> None:
+        """Sleep until the burst is due, extending while messages keep coming."""
+        while True:
+            due = min(burst.last_at + TTS_DEBOUNCE_WINDOW, burst.first_at + TTS_DEBOUNCE_MAX_DELAY)
+            delay = due - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        if self._bursts.get(user_id) is burst:
+            burst.timer = None
+            self._flush(user_id)
+
+    def _flush(self, user_id: int) -> None:
+        """Speak a user's burst now."""
+        burst = self._bursts.pop(user_id)
+        if burst.timer is not None:
+            burst.timer.cancel()
+        text = join_messages(burst.texts)
+        if not text:
+            return
+
+        self.stats['utterances'] += 1
+        logger.debug(f'Speaking {len(burst.texts)} messages from user {user_id} as one utterance')
+        if self.stats['utterances'] % SUMMARY_INTERVAL == 0:
+            logger.info(f'TTS debounce: {self.summary()}')
+        task = asyncio.create_task(self._speak(burst.speak, text))
+        self._speaking.add(task)
+        task.add_done_callback(self._speaking.discard)
+
+    def summary(self) -> str:
+        """
+        Summarize how much debouncing saved.
+
+        Returns:
+            Messages received, utterances spoken and messages per utterance
+        """
+        messages, utterances = self.stats['messages'], self.stats['utterances']
+        per_utterance = messages / utterances if utterances else 0.0
+        return f'{messages} messages in {utterances} utterances ({per_utterance:.2f} per utterance)'
+
+    @staticmethod
+    async def _speak(speak: SpeakFn, text: str) -> None:
+        try:
+            await speak(text)
+        except Exception as e:
+            logger.exception(f'Error speaking debounced TTS: {e}')
@@ -0,0 +1,73 @@
+"""Per-stage timing of on_message work, including how often a stage was skipped."""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from config import logger
+
+# Log a timing summary every this many messages through the pre-filter
+SUMMARY_INTERVAL: int = 500
+
+# Stage -> accumulated timing
+stats: dict[str, dict[str, float]] = {}
+
+
+def _entry(stage: str) -> dict[str, float]:
+    return stats.setdefault(stage, {'runs': 0, 'skipped': 0, 'seconds': 0.0})
+
+
+def record(stage: str, elapsed: float) -> None:
+    """
+    Record one run of a stage.
+
+    Args:
+        stage: Stage name (e.g. 'context')
+        elapsed: Wall-clock seconds the stage took
+    """
+    entry = _entry(stage)
+    entry['runs'] += 1
+    entry['seconds'] += elapsed
+
+    if stage == 'prefilter' and entry['runs'] % SUMMARY_INTERVAL == 0:
+        logger.info(f'Message stages: {summary()}')
+
+
+def skip(stage: str) -> None:
+    """
+    Record that a stage was not needed for a message.
+
+    Args:
+        stage: Stage name
+    """
+    _entry(stage)['skipped'] += 1
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """
+    Time the enclosed block as one run of a stage.
+
+    Args:
+        stage: Stage name
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+
+def summary() -> str:
+    """
+    Summarize timing per stage.
+
+    Returns:
+        One line per stage with runs, skips and mean latency
+    """
+    lines = []
+    for stage, entry in sorted(stats.items()):
+        runs = int(entry['runs'])
+        mean_ms = entry['seconds'] / runs * 1000 if runs else 0.0
+        lines.append(f'{stage}: {runs} runs, {int(entry["skipped"])} skipped, {mean_ms:.2f}ms avg')
+    return '; '.join(lines) or 'no messages yet'
@@ -2,9 +2,11 @@
 
 from typing import Optional, TypedDict
 from dataclasses import dataclass, field
-from collections import deque
 
-from config import MAX_MESSAGE_HISTORY
+from config import MAX_MESSAGE_HISTORY, CHANNEL_HISTORY_LIMITS
+from conversation import Conversation
+from message_store import MessageStore
+from speech_debounce import SpeechDebouncer
 
 
 class MessageDict(TypedDict):
@@ -16,21 +18,188 @@ class MessageDict(TypedDict):
     text: str
 
 
+class _ChannelBuffer:
+    """
+    Fixed-capacity ring buffer addressed by absolute position.
+
+    The n-th message ever appended to a channel has position n; it stays
+    addressable until limit newer messages have pushed it out.
+    """
+
+    __slots__ = ('limit', 'count', 'slots')
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.count = 0
+        self.slots: list[MessageDict] = []
+
+    @property
+    def first(self) -> int:
+        """Position of the oldest message still held."""
+        return max(0, self.count - self.limit)
+
+    def append(self, message: MessageDict) -> Optional[MessageDict]:
+        """
+        Append a message.
+
+        Returns:
+            The evicted message, if the buffer was full
+        """
+        evicted = None
+        if len(self.slots) < self.limit:
+            self.slots.append(message)
+        else:
+            slot = self.count % self.limit
+            evicted = self.slots[slot]
+            self.slots[slot] = message
+        self.count += 1
+        return evicted
+
+    def get(self, position: int) -> MessageDict:
+        return self.slots[position % self.limit]
+
+    def range(self, start: int, stop: int) -> list[MessageDict]:
+        """Messages at positions [start, stop), clamped to what is held."""
+        start, stop = max(start, self.first), min(stop, self.count)
+        return [self.get(position) for position in range(start, stop)]
+
+
+class MessageHistory:
+    """
+    Recent messages per channel with O(1) lookup by message ID.
+
+    Each channel keeps its own ring buffer (MAX_MESSAGE_HISTORY messages, or
+    its CHANNEL_HISTORY_LIMITS override). An index maps message ID to
+    (channel ID, position) and is updated on append and eviction, so finding
+    a message is O(1) and reading k messages around it is O(k).
+    """
+
+    def __init__(
+        self,
+        default_limit: int = MAX_MESSAGE_HISTORY,
+        channel_limits: Optional[dict[int, int]] = None
+    ):
+        self.default_limit = default_limit
+        self.channel_limits = CHANNEL_HISTORY_LIMITS if channel_limits is None else channel_limits
+        self._channels: dict[int, _ChannelBuffer] = {}
+        self._index: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append(self, message: MessageDict) -> None:
+        """
+        Record a message, evicting the channel's oldest if it is full.
+
+        Args:
+            message: Message to record
+        """
+        channel_id = message['channel_id']
+        buffer = self._channels.get(channel_id)
+        if buffer is None:
+            limit = self.channel_limits.get(channel_id, self.default_limit)
+            buffer = self._channels[channel_id] = _ChannelBuffer(limit)
+
+        position = buffer.count
+        evicted = buffer.append(message)
+        if evicted is not None:
+            self._index.pop(evicted['message_id'], None)
+        self._index[message['message_id']] = (channel_id, position)
+
+    def _locate(
+        self,
+        message_id: Optional[int],
+        channel_id: int
+    ) -> Optional[tuple[_ChannelBuffer, int]]:
+        """Find a message's buffer and position, if it is held for that channel."""
+        location = self._index.get(message_id) if message_id is not None else None
+        if location is None or location[0] != channel_id:
+            return None
+        return self._channels[channel_id], location[1]
+
+    def get(self, message_id: Optional[int], channel_id: int) -> Optional[MessageDict]:
+        """
+        Look up a message in a channel.
+
+        Args:
+            message_id: Message ID (None returns None)
+            channel_id: Channel the message must belong to
+
+        Returns:
+            The message, or None if it is not held
+        """
+        found = self._locate(message_id, channel_id)
+        return found[0].get(found[1]) if found else None
+
+    def since(self, message_id: Optional[int], channel_id: int) -> list[MessageDict]:
+        """
+        Get a message and everything after it in its channel.
+
+        Args:
+            message_id: First message ID
+            channel_id: Channel the message must belong to
+
+        Returns:
+            Messages in order, or an empty list if the message is not held
+        """
+        found = self._locate(message_id, channel_id)
+        if not found:
+            return []
+        buffer, position = found
+        return buffer.range(position, buffer.count)
+
+    def before(self, message_id: Optional[int], channel_id: int, count: int) -> list[MessageDict]:
+        """
+        Get up to count messages preceding a message in its channel.
+
+        Args:
+            message_id: Message ID
+            channel_id: Channel the message must belong to
+            count: Maximum number of messages
+
+        Returns:
+            Messages in order, or an empty list if the message is not held
+        """
+        found = self._locate(message_id, channel_id)
+        if not found:
+            return []
+        buffer, position = found
+        return buffer.range(position - count, position)
+
+
 @dataclass
 class BotState:
     """
     Manages bot state including message history and TTS users.
 
     Attributes:
-        gpt_messages: Conversation history for GPT chat
-        all_messages: All messages for summarization/fact-checking
+        conversations: GPT chat history per channel ID
+        history: Recent messages per channel for summarization/fact-checking
+        message_store: Persistent message log, read when history no longer has a message
+        member_names: Username per user ID, kept current from member events
         tts_users: Set of user IDs with TTS enabled
+        speech: Merges bursts of messages from TTS users into single utterances
     """
-    gpt_messages: list[dict[str, str]] = field(default_factory=list)
-    all_messages: deque[MessageDict] = field(
-        default_factory=lambda: deque(maxlen=MAX_MESSAGE_HISTORY)
-    )
+    conversations: dict[int, Conversation] = field(default_factory=dict)
+    history: MessageHistory = field(default_factory=MessageHistory)
+    message_store: MessageStore = field(default_factory=MessageStore)
+    member_names: dict[int, str] = field(default_factory=dict)
     tts_users: set[int] = field(default_factory=set)
+    speech: SpeechDebouncer = field(default_factory=SpeechDebouncer)
+
+    def conversation(self, channel_id: int) -> Conversation:
+        """
+        Get the GPT chat history for a channel, creating it if needed.
+
+        Args:
+            channel_id: Discord channel ID
+
+        Returns:
+            The channel's conversation
+        """
+        if channel_id not in self.conversations:
+            self.conversations[channel_id] = Conversation()
+        return self.conversations[channel_id]
 
     def toggle_tts(self, user_id: int) -> bool:
         """
@@ -0,0 +1,142 @@
+"""Map-reduce summarization of long message threads for SpencerBot."""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+
+import oai
+from config import (
+    logger,
+    SUMMARY_CHUNK_TOKENS,
+    MAX_CONCURRENT_SUMMARY_CHUNKS,
+    SUMMARY_CACHE_SIZE,
+)
+from conversation import estimate_tokens
+from state import MessageDict
+
+SUMMARY_PROMPT: str = 'Summarize the following exchange of messages:'
+CHUNK_PROMPT: str = (
+    'Summarize this part of a longer exchange of messages. '
+    'Keep who said what, decisions and open questions:'
+)
+REDUCE_PROMPT: str = (
+    'These are summaries of consecutive parts of one exchange of messages, in order. '
+    'Combine them into a single summary of the whole exchange:'
+)
+
+# Chunk key -> summary, most recently used last
+_chunk_summaries: OrderedDict[str, str] = OrderedDict()
+
+
+def format_message(message: MessageDict) -> str:
+    """Render one message as it appears in summarization prompts."""
+    return f'{message["name"]}: {message["text"]}'
+
+
+def chunk_messages(messages: list[MessageDict], max_tokens: int) -> list[list[MessageDict]]:
+    """
+    Split a thread into consecutive chunks of at most max_tokens.
+
+    Chunks are cut greedily from the start of the thread, so when the thread
+    grows every chunk but the last keeps the same boundaries.
+
+    Args:
+        messages: Messages in order
+        max_tokens: Token budget per chunk (a single longer message gets its own chunk)
+
+    Returns:
+        List of chunks
+    """
+    chunks: list[list[MessageDict]] = []
+    current: list[MessageDict] = []
+    current_tokens = 0
+    for message in messages:
+        tokens = estimate_tokens(format_message(message))
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(message)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _chunk_key(chunk: list[MessageDict]) -> str:
+    """Cache key for a chunk's content."""
+    digest = hashlib.sha256()
+    for message in chunk:
+        digest.update(f'{message["message_id"]}\0{format_message(message)}\0'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+async def _summarize_text(prompt: str, text: str, slots: asyncio.Semaphore) -> str:
+    """Summarize text with the given instruction, within the concurrency cap."""
+    async with slots:
+        return await oai.call_gpt_single_async(f'{prompt}\n\n{text}')
+
+
+async def _summarize_chunk(chunk: list[MessageDict], slots: asyncio.Semaphore) -> str:
+    """Summarize one chunk, reusing the cached summary if it was seen before."""
+    key = _chunk_key(chunk)
+    if key in _chunk_summaries:
+        _chunk_summaries.move_to_end(key)
+        return _chunk_summaries[key]
+
+    text = '\n\n'.join(format_message(message) for message in chunk)
+    summary = await _summarize_text(CHUNK_PROMPT, text, slots)
+
+    _chunk_summaries[key] = summary
+    while len(_chunk_summaries) > SUMMARY_CACHE_SIZE:
+        _chunk_summaries.popitem(last=False)
+    return summary
+
+
+async def _reduce(summaries: list[str], slots: asyncio.Semaphore) -> str:
+    """Combine partial summaries, in groups if they do not fit in one request."""
+    while True:
+        groups: list[list[str]] = [[]]
+        group_tokens = 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            # At least two per group, so every round shrinks the list
+            if len(groups[-1]) >= 2 and group_tokens + tokens > SUMMARY_CHUNK_TOKENS:
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append(summary)
+            group_tokens += tokens
+
+        summaries = await asyncio.gather(*(
+            _summarize_text(REDUCE_PROMPT, '\n\n'.join(group), slots) for group in groups
+        ))
+        if len(summaries) == 1:
+            return summaries[0]
+
+
+async def summarize_thread(messages: list[MessageDict]) -> str:
+    """
+    Summarize a thread of messages.
+
+    Short threads are summarized in one request. Longer threads are split
+    into token-bounded chunks that are summarized concurrently (at most
+    MAX_CONCURRENT_SUMMARY_CHUNKS at a time), then combined. Chunk summaries
+    are cached, so summarizing a thread again after it grows only sends the
+    new messages (and the last, partial chunk).
+
+    Args:
+        messages: Messages in order
+
+    Returns:
+        Summary text
+    """
+    slots = asyncio.Semaphore(MAX_CONCURRENT_SUMMARY_CHUNKS)
+    chunks = chunk_messages(messages, SUMMARY_CHUNK_TOKENS)
+    if len(chunks) <= 1:
+        text = '\n\n'.join(format_message(message) for message in messages)
+        return await _summarize_text(SUMMARY_PROMPT, text, slots)
+
+    cached = sum(1 for chunk in chunks if _chunk_key(chunk) in _chunk_summaries)
+    logger.debug(f'Summarizing {len(messages)} messages in {len(chunks)} chunks ({cached} cached)')
+
+    summaries = await asyncio.gather(*(_summarize_chunk(chunk, slots) for chunk in chunks))
+    return await _reduce(list(summaries), slots)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Regression test: SpencerBot GPT handlers must not block the event loop."""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+# Clients are constructed at import time and refuse an empty key
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+import oai
+import dapi
+import conversation
+import handlers
+from state import BotState, MessageDict
+
+# Simulated OpenAI round-trip and the maximum loop lag we tolerate during it
+FAKE_COMPLETION_DELAY: float = 0.5
+HEARTBEAT_INTERVAL: float = 0.01
+MAX_LOOP_LAG: float = 0.1
+
+
+# Streamed answers arrive in this many pieces over FAKE_COMPLETION_DELAY
+FAKE_STREAM_PIECES: int = 10
+
+
+async def _fake_stream(text: str):
+    for i in range(FAKE_STREAM_PIECES):
+        await asyncio.sleep(FAKE_COMPLETION_DELAY / FAKE_STREAM_PIECES)
+        piece = text[i * len(text) // FAKE_STREAM_PIECES:(i + 1) * len(text) // FAKE_STREAM_PIECES]
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+
+async def _fake_create(stream: bool = False, **kwargs):
+    """Stand-in for AsyncOpenAI chat.completions.create with network latency."""
+    if stream:
+        return _fake_stream('Fake answer. ' * 20)
+    await asyncio.sleep(FAKE_COMPLETION_DELAY)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=' fake answer '))]
+    )
+
+
+def _install_fake_client() -> None:
+    oai.async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=_fake_create))
+    )
+
+
+async def _max_loop_lag(coro) -> tuple[float, object]:
+    """Run coro while a heartbeat measures the worst scheduling delay."""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal max_lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            max_lag = max(max_lag, time.perf_counter() - start - HEARTBEAT_INTERVAL)
+
+    beat = asyncio.create_task(heartbeat())
+    try:
+        result = await coro
+    finally:
+        done.set()
+        await beat
+    return max_lag, result
+
+
+class _FakeMessage:
+    """Discord message/channel stand-in recording sends and edits."""
+
+    def __init__(self, log: list, content: str = ''):
+        self.channel = self
+        self.id = 1
+        self.log = log
+        self.content = content
+
+    async def send(self, content: str) -> '_FakeMessage':
+        self.log.append(('send', time.perf_counter(), content))
+        return _FakeMessage(self.log, content)
+
+    async def edit(self, content: str) -> None:
+        self.log.append(('edit', time.perf_counter(), content))
+        self.content = content
+
+
+def _state_with_thread() -> tuple[BotState, MessageDict]:
+    state = BotState()
+    for i in range(1, 4):
+        state.history.append(MessageDict(
+            message_id=i, channel_id=1, reference_id=None, name='user', text=f'message {i}'
+        ))
+    request = MessageDict(message_id=4, channel_id=1, reference_id=2, name='user', text='')
+    return state, request
+
+
+def test_gpt_chat_does_not_block_loop() -> None:
+    _install_fake_client()
+    state = BotState()
+    log: list = []
+    start = time.perf_counter()
+    lag, answer = asyncio.run(_max_loop_lag(
+        handlers.cmd_gpt_chat(state, 'hello', _FakeMessage(log))
+    ))
+    assert answer is None
+    assert lag < MAX_LOOP_LAG, f'event loop stalled for {lag:.3f}s'
+    # First sentence is posted long before the completion finishes
+    assert log[0][0] == 'send' and log[0][1] - start < FAKE_COMPLETION_DELAY / 2
+    assert state.conversation(1).turns[-1] == {'role': 'assistant', 'content': ('Fake answer. ' * 20).strip()}
+
+
+def test_conversation_stays_within_budget() -> None:
+    _install_fake_client()
+    budget = 500
+    default_budget = conversation.CONVERSATION_TOKEN_BUDGET
+    conversation.CONVERSATION_TOKEN_BUDGET = budget
+
+    async def chat() -> conversation.Conversation:
+        convo = conversation.Conversation()
+        for i in range(20):
+            convo.add('user' if i % 2 == 0 else 'assistant', f'turn {i} ' + 'x' * 400)
+            sent = convo.messages()
+            assert sum(conversation.estimate_tokens(m['content']) for m in sent) <= budget
+            assert sent[-1]['content'].startswith(f'turn {i} ')
+        await asyncio.sleep(FAKE_COMPLETION_DELAY * 3)
+        return convo
+
+    try:
+        convo = asyncio.run(chat())
+    finally:
+        conversation.CONVERSATION_TOKEN_BUDGET = default_budget
+    assert convo.summary == 'fake answer'
+    assert convo.token_count() <= budget
+    assert convo.messages()[0]['role'] == 'system'
+
+
+def test_stream_reply_rolls_over_long_answers() -> None:
+    async def pieces():
+        for _ in range(50):
+            yield 'word ' * 20
+
+    log: list = []
+    answer = asyncio.run(dapi.stream_reply(_FakeMessage(log), pieces()))
+    sends = [content for kind, _, content in log if kind == 'send']
+    assert all(len(content) <= dapi.MAX_MESSAGE_LENGTH for _, _, content in log)
+    assert len(sends) == 3
+    assert answer == ('word ' * 1000).strip()
+
+
+def test_summarize_does_not_block_loop() -> None:
+    _install_fake_client()
+    state, request = _state_with_thread()
+    lag, answer = asyncio.run(_max_loop_lag(handlers.cmd_summarize(request, state)))
+    assert answer == 'fake answer'
+    assert lag < MAX_LOOP_LAG, f'event loop stalled for {lag:.3f}s'
+
+
+def test_fact_check_does_not_block_loop() -> None:
+    _install_fake_client()
+    state, request = _state_with_thread()
+    lag, answer = asyncio.run(_max_loop_lag(handlers.cmd_fact_check(request, state)))
+    assert answer == 'fake answer'
+    assert lag < MAX_LOOP_LAG, f'event loop stalled for {lag:.3f}s'
+
+
+if __name__ == '__main__':
+    test_gpt_chat_does_not_block_loop()
+    test_conversation_stays_within_budget()
+    test_stream_reply_rolls_over_long_answers()
+    test_summarize_does_not_block_loop()
+    test_fact_check_does_not_block_loop()
+    print('All async chat tests passed')
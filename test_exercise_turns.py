@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Test: ExerciseHandler serializes each user's messages and honours stop, skip and deck changes."""
+
+import asyncio
+import contextlib
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, '.')
+# The OpenAI client is constructed at import time and refuses an empty key
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+import discord
+
+import anki_db
+import korean_state
+from cogs.korean.base_handler import ExerciseHandler
+
+anki_db.resolve_deck_name = lambda text: 'Korean::Deck' if text == 'Deck' else None
+anki_db.get_words_in_deck = lambda deck: [{'korean': '가다', 'english': 'to go'}]
+
+# Simulated GPT latency for generation and grading
+GENERATE_DELAY: float = 0.05
+GRADE_DELAY: float = 0.05
+
+events: list[str] = []
+_message_ids = itertools.count(1)
+_user_ids = itertools.count(1000)
+
+
+class _FakeChannel:
+    async def send(self, embed: discord.Embed | None = None, **kwargs) -> None:
+        events.append(f'send {embed.title}')
+
+    @contextlib.asynccontextmanager
+    async def typing(self):
+        yield
+
+
+class _FakeAuthor:
+    def __init__(self, user_id: int):
+        self.id = user_id
+
+
+class _FakeMessage:
+    def __init__(self, user_id: int, content: str):
+        self.id = next(_message_ids)
+        self.author = _FakeAuthor(user_id)
+        self.content = content
+        self.attachments = []
+        self.channel = _FakeChannel()
+
+    async def reply(self, embed: discord.Embed, mention_author: bool = True) -> None:
+        events.append(f'reply {self.content}')
+
+
+class _FakeHandler(ExerciseHandler):
+    """Records generation, grading and posting; GPT calls are simulated with sleeps."""
+
+    def __init__(self):
+        super().__init__('fake')
+        self.generated = 0
+
+    async def generate_exercise(self, words: list[dict]) -> dict:
+        self.generated += 1
+        number = self.generated
+        events.append(f'generate {number}')
+        await asyncio.sleep(GENERATE_DELAY)
+        return {'number': number}
+
+    async def post_exercise(self, channel, exercise: dict, attachment) -> None:
+        events.append(f'exercise {exercise["number"]}')
+
+    async def grade_response(self, exercise: dict, student_answer: str) -> dict:
+        events.append(f'grading {student_answer}')
+        await asyncio.sleep(GRADE_DELAY)
+        events.append(f'graded {student_answer}')
+        return {'score': 100}
+
+    def build_grade_embed(self, exercise: dict, student_answer: str, result: dict) -> discord.Embed:
+        return discord.Embed(title=f'grade {student_answer}')
+
+    async def post_skip_reveal(self, channel, exercise: dict) -> None:
+        events.append(f'reveal {exercise["number"]}')
+
+
+class _FailingHandler(_FakeHandler):
+    async def grade_response(self, exercise: dict, student_answer: str) -> dict:
+        events.append(f'grading {student_answer}')
+        await asyncio.sleep(GRADE_DELAY / 5)
+        raise RuntimeError('grader down')
+
+
+def _start_session(user_id: int) -> None:
+    """Give the user an active deck and a pending exercise."""
+    korean_state.set_active_deck(user_id, 'Korean::Deck')
+    korean_state.set_exercise(user_id, {'type': 'fake', 'deck': 'Korean::Deck', 'number': 0})
+
+
+async def _send_all(handler: ExerciseHandler, user_id: int, *texts: str) -> None:
+    """Handle messages that arrive in quick succession, as on_message dispatch would."""
+    tasks = []
+    for text in texts:
+        tasks.append(asyncio.create_task(handler.handle(_FakeMessage(user_id, text))))
+        await asyncio.sleep(0.001)
+    await asyncio.gather(*tasks)
+
+
+def test_next_exercise_is_generated_while_grading() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+
+    async def run() -> float:
+        start = time.perf_counter()
+        await _FakeHandler().handle(_FakeMessage(user_id, 'a1'))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    # Both start at once, and the grade is posted before the next exercise
+    assert events == ['grading a1', 'generate 1', 'graded a1', 'send grade a1', 'exercise 1']
+    assert elapsed < GRADE_DELAY + GENERATE_DELAY
+
+
+def test_failed_grade_cancels_the_next_exercise() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+
+    async def run() -> None:
+        await _FailingHandler().handle(_FakeMessage(user_id, 'a1'))
+        await asyncio.sleep(GENERATE_DELAY * 2)
+
+    asyncio.run(run())
+    assert events == ['grading a1', 'generate 1', 'send ❌ Grading Failed']
+    assert korean_state.get_exercise(user_id)['number'] == 0
+
+
+def test_follow_up_is_coalesced_into_the_first_answer() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+    handler = _FakeHandler()
+
+    async def run() -> None:
+        await _send_all(handler, user_id, 'a1', 'a2')
+
+    asyncio.run(run())
+    # The second answer is not graded against the new exercise, and only one is generated
+    assert events == ['grading a1', 'generate 1', 'graded a1', 'send grade a1', 'exercise 1', 'reply a2']
+    assert handler.generated == 1
+    assert korean_state.get_exercise(user_id)['number'] == 1
+
+
+def test_messages_beyond_the_depth_limit_are_refused() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+    depth = korean_state.MAX_PENDING_MESSAGES_PER_USER
+
+    async def run() -> None:
+        handler = _FakeHandler()
+        tasks = [
+            asyncio.create_task(handler.handle(_FakeMessage(user_id, f'a{i}')))
+            for i in range(1, depth + 2)
+        ]
+        await asyncio.sleep(0.01)
+        # The extra message is refused at once, while the first is still grading
+        assert f'reply a{depth + 1}' in events
+        assert 'graded a1' not in events
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert korean_state._turn_pending.get(user_id) is None
+
+
+def test_queued_turn_is_dropped_after_an_interrupt() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+
+    async def run() -> None:
+        await _send_all(_FakeHandler(), user_id, 'a1', 'a2', 'skip')
+
+    asyncio.run(run())
+    # skip cancels the grade of a1, drops the queued a2, then reveals and moves on
+    assert events == [
+        'grading a1', 'generate 1', 'reply a2', 'reveal 0', 'generate 2', 'exercise 2',
+    ]
+    assert korean_state.get_session_epoch(user_id) == 1
+
+
+def test_work_slots_limit_grading_across_users() -> None:
+    events.clear()
+    first, second = next(_user_ids), next(_user_ids)
+    _start_session(first)
+    _start_session(second)
+
+    async def run() -> None:
+        korean_state._work_slots = asyncio.Semaphore(1)
+        handler = _FakeHandler()
+        await asyncio.gather(
+            _send_all(handler, first, 'a1'),
+            _send_all(handler, second, 'b1'),
+        )
+
+    try:
+        asyncio.run(run())
+    finally:
+        korean_state._work_slots = None
+    assert events.index('grading b1') > events.index('exercise 1')
+
+
+def test_waiting_for_a_turn_does_not_hold_a_work_slot() -> None:
+    events.clear()
+    first, second = next(_user_ids), next(_user_ids)
+    _start_session(first)
+    _start_session(second)
+
+    async def run() -> None:
+        korean_state._work_slots = asyncio.Semaphore(2)
+        handler = _FakeHandler()
+        queued = asyncio.create_task(_send_all(handler, first, 'a1', 'a2'))
+        await asyncio.sleep(0.005)
+        other = asyncio.create_task(handler.handle(_FakeMessage(second, 'b1')))
+        await asyncio.sleep(0.005)
+        # a2 waits for its turn without a slot, so the other user is graded at once
+        assert 'grading b1' in events
+        assert 'graded a1' not in events
+        await asyncio.gather(queued, other)
+
+    try:
+        asyncio.run(run())
+    finally:
+        korean_state._work_slots = None
+
+
+def test_stop_is_handled_when_the_queue_is_full() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+
+    async def run() -> None:
+        await _send_all(_FakeHandler(), user_id, 'a1', 'a2', 'a3', 'stop')
+
+    asyncio.run(run())
+    # The in-flight grade is cancelled and the queued answers are dropped
+    assert 'graded a1' not in events
+    assert events == ['grading a1', 'generate 1', 'reply a2', 'reply a3', 'send Session Ended']
+    assert korean_state.get_active_deck(user_id) is None
+
+
+def test_deck_change_is_handled_when_the_queue_is_full() -> None:
+    events.clear()
+    user_id = next(_user_ids)
+    _start_session(user_id)
+
+    async def run() -> None:
+        await _send_all(_FakeHandler(), user_id, 'a1', 'a2', 'a3', 'Deck')
+
+    asyncio.run(run())
+    assert 'graded a1' not in events
+    assert events[-1] == 'send ✅ Deck Selected'
+
+
+if __name__ == '__main__':
+    test_next_exercise_is_generated_while_grading()
+    test_failed_grade_cancels_the_next_exercise()
+    test_follow_up_is_coalesced_into_the_first_answer()
+    test_messages_beyond_the_depth_limit_are_refused()
+    test_queued_turn_is_dropped_after_an_interrupt()
+    test_work_slots_limit_grading_across_users()
+    test_waiting_for_a_turn_does_not_hold_a_work_slot()
+    test_stop_is_handled_when_the_queue_is_full()
+    test_deck_change_is_handled_when_the_queue_is_full()
+    print('All exercise turn tests passed')
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test: grade_cache returns repeated grades without regrading and persists them."""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, '.')
+
+import grade_cache
+
+
+def _use_db(path: str, size: int = 100) -> None:
+    """Point the cache at a database file with an empty memory cache."""
+    grade_cache.GRADE_CACHE_PATH = path
+    grade_cache.GRADE_CACHE_SIZE = size
+    grade_cache._db = None
+    grade_cache._db_failed = False
+    grade_cache.clear()
+
+
+def _close_db() -> None:
+    """Close the database once queued writes are done."""
+    if grade_cache._db is not None:
+        grade_cache._executor.submit(grade_cache._db.close).result()
+        grade_cache._db = None
+
+
+def test_answers_are_keyed_by_exercise_and_normalized_answer() -> None:
+    key = grade_cache.make_key('translation', {'korean': '안녕'}, ' 안녕 하세요 ')
+    assert key == grade_cache.make_key('translation', {'korean': '안녕'}, '안녕\n하세요')
+    assert key != grade_cache.make_key('translation', {'korean': '안녕'}, '안녕하세요')
+    assert key != grade_cache.make_key('build', {'korean': '안녕'}, '안녕 하세요')
+    assert key != grade_cache.make_key('translation', {'korean': '잘가'}, '안녕 하세요')
+
+
+def test_repeated_answers_are_graded_once() -> None:
+    calls = []
+
+    @grade_cache.cached_grade('test')
+    async def grade(exercise: str, student: str) -> dict:
+        calls.append(student)
+        return {'score': len(calls), 'corrections': []}
+
+    async def run() -> list[dict]:
+        first = await grade('ex', '가다')
+        first['corrections'].append('mutated by the caller')
+        return [first, await grade('ex', '  가다 '), await grade('ex', '오다'), await grade('other', '가다')]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_db(os.path.join(tmp, 'grades.db'))
+        results = asyncio.run(run())
+        _close_db()
+    assert [r['score'] for r in results] == [1, 1, 2, 3]
+    assert results[1]['corrections'] == []
+    assert calls == ['가다', '오다', '가다']
+    assert grade_cache.stats == {'hits': 1, 'misses': 3}
+
+
+def test_memory_evicts_least_recently_used() -> None:
+    async def run() -> None:
+        grade_cache.put('a', {'score': 1})
+        grade_cache.put('b', {'score': 2})
+        assert await grade_cache.get('a') is not None  # now most recent
+        grade_cache.put('c', {'score': 3})  # evicts 'b'
+
+    _use_db('', size=2)
+    asyncio.run(run())
+    assert list(grade_cache._entries) == ['a', 'c']
+    assert asyncio.run(grade_cache.get('b')) is None
+
+
+def test_grades_persist_across_restarts() -> None:
+    async def run() -> dict | None:
+        grade_cache.put('key', {'score': 90, 'feedback': '좋아요'})
+        # A restart forgets memory but reads the database
+        grade_cache.clear()
+        return await grade_cache.get('key')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_db(os.path.join(tmp, 'grades.db'))
+        assert asyncio.run(run()) == {'score': 90, 'feedback': '좋아요'}
+        assert grade_cache.stats == {'hits': 1, 'misses': 0}
+        _close_db()
+
+
+if __name__ == '__main__':
+    test_answers_are_keyed_by_exercise_and_normalized_answer()
+    test_repeated_answers_are_graded_once()
+    test_memory_evicts_least_recently_used()
+    test_grades_persist_across_restarts()
+    print('All grade cache tests passed')
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test: grading grades dictation and cloze answers locally."""
+
+import sys
+
+sys.path.insert(0, '.')
+
+import grading
+
+BLANKS = [
+    {'position': 1, 'korean': '학교', 'english': 'school'},
+    {'position': 2, 'korean': '먹고 싶어요', 'english': 'want to eat'},
+]
+
+
+def test_dictation_ignores_punctuation_and_reports_spacing() -> None:
+    assert grading.grade_dictation('저는 학생입니다.', '저는 학생입니다') == {
+        'correct': True, 'score': 100, 'feedback': 'Perfect!', 'diff': '', 'corrected': None,
+    }
+    result = grading.grade_dictation('저는 학생입니다', '저는학생입니다')
+    assert result['correct'] and result['score'] == 100
+    assert '띄어쓰기' in result['feedback']
+
+
+def test_dictation_diff_marks_each_mistake() -> None:
+    result = grading.grade_dictation('저는 학생입니다', '저는 학생임니다')
+    assert not result['correct']
+    assert result['diff'] == '저는 학생[임→입]니다'
+    # One jamo wrong out of 17
+    assert result['score'] == 94
+
+    result = grading.grade_dictation('오늘 날씨가 좋아요', '오늘 날씨 좋아요 정말')
+    assert result['diff'] == '오늘 날씨[+가] 좋아요 [-정말]'
+    assert result['corrected'] == '오늘 날씨가 좋아요'
+    assert grading.grade_dictation('안녕', '')['score'] == 0
+
+
+def test_cloze_answers_split_on_separators_and_numbering() -> None:
+    assert grading.parse_cloze_answers('학교, 먹고 싶어요', 2) == ['학교', '먹고 싶어요']
+    assert grading.parse_cloze_answers('학교\n먹고 싶어요', 2) == ['학교', '먹고 싶어요']
+    assert grading.parse_cloze_answers('1. 학교 2. 먹고 싶어요', 2) == ['학교', '먹고 싶어요']
+    assert grading.parse_cloze_answers('_1_ = 학교; _2_ = 먹고 싶어요', 2) == ['학교', '먹고 싶어요']
+    # Digit grouping and times are not separators or numbering
+    assert grading.parse_cloze_answers('1,000원, 3:30에', 2) == ['1,000원', '3:30에']
+    # Space-separated answers are accepted only when there is one word per blank
+    assert grading.parse_cloze_answers('학교 가요', 2) == ['학교', '가요']
+    assert grading.parse_cloze_answers('학교 먹고 싶어요', 2) is None
+    assert grading.parse_cloze_answers('학교', 2) is None
+
+
+def test_cloze_exact_matches_are_graded_locally() -> None:
+    result = grading.grade_cloze(BLANKS, '1. 학교\n2. 먹고싶어요!')
+    assert [r['correct'] for r in result['results']] == [True, True]
+    assert result['score'] == 100
+    assert result['feedback'] == 'All blanks correct!'
+
+    result = grading.grade_cloze(BLANKS, '학교, 먹었어요')
+    assert [r['correct'] for r in result['results']] == [True, False]
+    assert result['results'][1] == {
+        'position': 2, 'correct': False, 'student': '먹었어요', 'answer': '먹고 싶어요',
+    }
+    assert result['score'] == 50
+
+
+def test_cloze_answers_that_do_not_fit_the_blanks_are_not_graded() -> None:
+    assert grading.grade_cloze(BLANKS, '학교 먹고 싶어요') is None
+
+
+if __name__ == '__main__':
+    test_dictation_ignores_punctuation_and_reports_spacing()
+    test_dictation_diff_marks_each_mistake()
+    test_cloze_answers_split_on_separators_and_numbering()
+    test_cloze_exact_matches_are_graded_locally()
+    test_cloze_answers_that_do_not_fit_the_blanks_are_not_graded()
+    print('All grading tests passed')
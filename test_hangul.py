@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Test: hangul aligns text by jamo and romanizes with Revised Romanization sound changes."""
+
+import sys
+
+sys.path.insert(0, '.')
+
+import grading
+import hangul
+from hangul import romanize
+
+
+def test_syllables_decompose_into_jamo() -> None:
+    assert hangul.to_jamo('각') == 'ㄱㅏㄱ'
+    assert hangul.to_jamo('a') == 'a'
+    assert hangul.jamo_length('각 나') == 5
+    assert hangul.syllable_distance('갑', '감') == 1
+    assert hangul.syllable_distance('가', '각') == 1
+    assert hangul.syllable_distance('가', ' ') > 100
+
+
+def test_alignment_counts_jamo_edits() -> None:
+    # A wrong batchim is one jamo, not a whole syllable
+    assert hangul.align('갑니다', '감니다') == ([('replace', '갑', '감'), ('equal', '니다', '니다')], 1)
+    # Missing syllables cost their jamo; spaces are free
+    assert hangul.align('학교에 가요', '학교가요') == (
+        [('equal', '학교', '학교'), ('missing', '에 ', ''), ('equal', '가요', '가요')], 2
+    )
+    assert hangul.align('가요', '가 요') == ([('equal', '가', '가'), ('extra', '', ' '), ('equal', '요', '요')], 0)
+
+
+def test_syllables_romanize_by_table() -> None:
+    assert romanize('안녕하세요') == 'annyeonghaseyo'
+    assert romanize('여덟') == 'yeodeol'
+    assert romanize('닭') == 'dak'
+    # Non-Hangul passes through
+    assert romanize('서울 2024!') == 'seoul 2024!'
+
+
+def test_sound_changes_across_syllables() -> None:
+    cases = {
+        '한국어': 'hangugeo',      # liaison
+        '앉아': 'anja',            # compound final liaison
+        '같이': 'gachi',           # palatalization
+        '굳이': 'guji',
+        '축하': 'chuka',           # aspiration
+        '좋다': 'jota',
+        '놓는': 'nonneun',
+        '국물': 'gungmul',         # nasalization
+        '합니다': 'hamnida',
+        '독립': 'dongnip',
+        '종로': 'jongno',
+        '신라': 'silla',           # liquidization
+        '설날': 'seollal',
+        '읽고': 'ilgo',            # ㄺ before ㄱ
+        '싫어': 'sireo',
+    }
+    for korean, expected in cases.items():
+        assert romanize(korean) == expected, (korean, romanize(korean))
+
+
+def test_rb_final_is_pronounced_b_in_some_words() -> None:
+    assert romanize('밟다') == 'bapda'
+    assert romanize('밟고') == 'bapgo'
+    assert romanize('밟는') == 'bamneun'
+    assert romanize('밟아') == 'balba'
+    assert romanize('넓죽하다') == 'neopjukada'
+    # Elsewhere ㄼ is pronounced ㄹ
+    assert romanize('넓다') == 'neolda'
+    assert romanize('짧다') == 'jjalda'
+
+
+def test_without_assimilation_only_liaison_applies() -> None:
+    assert romanize('합니다', assimilate=False) == 'hapnida'
+    assert romanize('국물', assimilate=False) == 'gukmul'
+    # Finals still carry over into a following vowel as they are pronounced
+    assert romanize('없어요', assimilate=False) == 'eopseoyo'
+    assert romanize('좋아요', assimilate=False) == 'joayo'
+    assert romanize('읽어요', assimilate=False) == 'ilgeoyo'
+
+
+def test_audio_answers_match_hangul_or_romanization() -> None:
+    for answer in ('감사합니다', 'gamsahamnida', 'Gamsahapnida', 'gam-sa-ham-ni-da'):
+        assert grading.grade_audio_locally('감사합니다', answer)['correct'], answer
+    assert grading.grade_audio_locally('감사합니다', 'thank you') is None
+    assert grading.grade_audio_locally('감사합니다', 'gamsahamnide') is None
+    # Syllable-by-syllable spellings that drop liaison are not correct
+    wrong = {'없어요': 'eopeoyo', '맛있어요': 'matiteoyo', '좋아요': 'jotayo', '읽어요': 'ikeoyo'}
+    for korean, answer in wrong.items():
+        assert grading.grade_audio_locally(korean, answer) is None, (korean, answer)
+        assert grading.grade_audio_locally(korean, romanize(korean))['correct'], korean
+
+
+if __name__ == '__main__':
+    test_syllables_decompose_into_jamo()
+    test_alignment_counts_jamo_edits()
+    test_syllables_romanize_by_table()
+    test_sound_changes_across_syllables()
+    test_rb_final_is_pronounced_b_in_some_words()
+    test_without_assimilation_only_liaison_applies()
+    test_audio_answers_match_hangul_or_romanization()
+    print('All hangul tests passed')
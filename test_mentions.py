@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Test: build_message resolves mentions from the cached member map."""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+# The OpenAI client is constructed at import time and refuses an empty key
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+from utils import build_message
+
+
+def _message(mentions: list | None = None, reference_id: int | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=5,
+        channel=SimpleNamespace(id=9),
+        author=SimpleNamespace(name='author'),
+        reference=SimpleNamespace(message_id=reference_id) if reference_id else None,
+        mentions=mentions or [],
+    )
+
+
+def test_mentions_are_resolved_from_the_cache() -> None:
+    names = {1: 'alice', 2: 'bob'}
+    built = build_message(_message(reference_id=4), 'hi <@1> and <@!2>', names)
+    assert built == {
+        'message_id': 5, 'channel_id': 9, 'reference_id': 4,
+        'name': 'author', 'text': 'hi <@alice> and <@!bob>',
+    }
+
+
+def test_uncached_mentions_fall_back_to_the_message() -> None:
+    names = {1: 'alice'}
+    message = _message(mentions=[SimpleNamespace(id=3, name='carol')])
+    assert build_message(message, '<@3> <@1> <@8>', names)['text'] == '<@carol> <@alice> <@8>'
+    # The name is cached for later messages
+    assert names == {1: 'alice', 3: 'carol'}
+
+
+def test_text_without_mentions_is_unchanged() -> None:
+    assert build_message(_message(), 'no mentions <@x>', {})['text'] == 'no mentions <@x>'
+
+
+if __name__ == '__main__':
+    test_mentions_are_resolved_from_the_cache()
+    test_uncached_mentions_fall_back_to_the_message()
+    test_text_without_mentions_is_unchanged()
+    print('All mention tests passed')
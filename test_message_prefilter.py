@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Test: on_message records every message and skips pipelines the message does not need."""
+
+import asyncio
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+# The OpenAI client is constructed at import time and refuses an empty key
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+import discord
+from discord.ext import commands
+
+import events
+import stage_timings
+from cogs.korean import vocab
+from message_store import MessageStore
+from state import BotState
+
+GUILD_ID: int = 1
+KOREAN_CHANNEL: int = 10
+OTHER_CHANNEL: int = 20
+TTS_USER: int = 7
+
+calls: list[str] = []
+
+
+def _message(message_id: int, channel_id: int, author_id: int, content: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=message_id,
+        content=content,
+        author=SimpleNamespace(id=author_id, name=f'user{author_id}'),
+        guild=SimpleNamespace(id=GUILD_ID),
+        channel=SimpleNamespace(id=channel_id),
+        reference=None,
+        mentions=[],
+    )
+
+
+async def _fake_korean_handler(message) -> None:
+    calls.append(f'korean {message.id}')
+
+
+async def _fake_speak(message, ctx, bot, text, bot_state) -> None:
+    calls.append(f'speak {message.id}')
+
+
+def _setup(path: str) -> tuple[commands.Bot, BotState]:
+    events.ALLOWED_GUILD_ID = GUILD_ID
+    events.CHANNEL_VOCAB = KOREAN_CHANNEL
+    vocab.handle = _fake_korean_handler
+    events.cmd_speak = _fake_speak
+
+    bot = commands.Bot(command_prefix='!', intents=discord.Intents.none())
+
+    async def get_context(message):
+        calls.append(f'context {message.id}')
+        return SimpleNamespace()
+
+    bot.get_context = get_context
+    bot_state = BotState(message_store=MessageStore(path))
+    bot_state.tts_users.add(TTS_USER)
+    events.setup_events(bot, bot_state)
+    return bot, bot_state
+
+
+def test_prefilter_skips_pipelines_without_losing_messages() -> None:
+    calls.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'messages.db')
+
+        async def run() -> list:
+            bot, bot_state = _setup(path)
+            skipped = stage_timings._entry('context')['skipped']
+            for message in (
+                _message(1, KOREAN_CHANNEL, 2, '사과'),
+                _message(2, OTHER_CHANNEL, 2, 'hello'),
+                _message(3, KOREAN_CHANNEL, TTS_USER, '배'),
+            ):
+                await bot.on_message(message)
+            await asyncio.sleep(0.01)
+            # Only the spoken message needed the SpencerBot pipeline
+            assert stage_timings._entry('context')['skipped'] == skipped + 2
+            await bot_state.message_store.flush()
+            return [
+                bot_state.history.get(1, KOREAN_CHANNEL),
+                bot_state.history.get(2, OTHER_CHANNEL),
+                await bot_state.message_store.get(KOREAN_CHANNEL, 3),
+            ]
+
+        recorded = asyncio.run(run())
+    assert [message['text'] for message in recorded] == ['사과', 'hello', '배']
+    assert sorted(calls) == ['context 3', 'korean 1', 'korean 3', 'speak 3']
+
+
+if __name__ == '__main__':
+    test_prefilter_skips_pipelines_without_losing_messages()
+    print('All message prefilter tests passed')
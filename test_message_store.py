@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Test: messages written through MessageStore survive a restart."""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, '.')
+
+import discord
+
+import message_store
+from main import SpencerBot
+from message_store import MessageStore
+from state import BotState, MessageDict
+
+
+def _message(message_id: int, channel_id: int) -> MessageDict:
+    return MessageDict(
+        message_id=message_id, channel_id=channel_id, reference_id=None,
+        name='user', text=f'message {message_id}'
+    )
+
+
+def _fill(path: str, count: int) -> None:
+    """Record count messages alternating between channels 1 and 2, then flush."""
+    async def run() -> None:
+        store = MessageStore(path)
+        for i in range(count):
+            store.record(_message(i, 1 + i % 2))
+        await store.flush()
+    asyncio.run(run())
+
+
+def test_store_survives_restart() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'messages.db')
+        _fill(path, 250)
+
+        async def read() -> tuple:
+            store = MessageStore(path)
+            return (
+                await store.get(2, 101),
+                await store.get(1, 101),
+                await store.since(2, 241, 100),
+                await store.before(1, 10, 3),
+                await store.since(2, 999, 100),
+            )
+
+        found, wrong_channel, thread, context, missing = asyncio.run(read())
+        assert found['text'] == 'message 101'
+        assert wrong_channel is None
+        assert [m['message_id'] for m in thread] == [241, 243, 245, 247, 249]
+        assert [m['message_id'] for m in context] == [4, 6, 8]
+        assert missing == []
+
+
+def test_retention_keeps_newest_per_channel() -> None:
+    default_limit = message_store.MESSAGE_STORE_CHANNEL_LIMIT
+    message_store.MESSAGE_STORE_CHANNEL_LIMIT = 10
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'messages.db')
+            _fill(path, 100)
+
+            async def read() -> list:
+                return await MessageStore(path).since(2, 81, 100)
+
+            assert [m['message_id'] for m in asyncio.run(read())] == list(range(81, 100, 2))
+    finally:
+        message_store.MESSAGE_STORE_CHANNEL_LIMIT = default_limit
+
+
+def test_bot_close_writes_queued_messages() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'messages.db')
+
+        async def run() -> MessageDict | None:
+            bot = SpencerBot(
+                BotState(message_store=MessageStore(path)),
+                command_prefix='!', intents=discord.Intents.none(),
+            )
+            bot.bot_state.message_store.record(_message(1, 1))
+            await bot.close()
+            return await MessageStore(path).get(1, 1)
+
+        assert asyncio.run(run())['text'] == 'message 1'
+
+
+if __name__ == '__main__':
+    test_store_survives_restart()
+    test_retention_keeps_newest_per_channel()
+    test_bot_close_writes_queued_messages()
+    print('All message store tests passed')
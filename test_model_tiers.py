@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Test: gpt grades on the fast tier first and escalates to the large model when unsure."""
+
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+# The client is constructed at import time and refuses an empty key
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+import gpt
+import model_tiers
+
+FAST_MODEL = model_tiers.model_for(model_tiers.FAST)
+LARGE_MODEL = model_tiers.model_for(model_tiers.LARGE)
+
+# Model -> calls made to it
+calls: dict[str, int] = {}
+# Streams closed by the consumer
+closed: list[str] = []
+
+
+class _FakeStream:
+    """Stand-in for an AsyncStream yielding content a few characters at a time."""
+
+    def __init__(self, model: str, content: str):
+        self.model = model
+        self.content = content
+
+    async def __aiter__(self):
+        for i in range(0, len(self.content), 4):
+            await asyncio.sleep(0.001)
+            delta = SimpleNamespace(content=self.content[i:i + 4])
+            yield SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=delta)])
+
+    async def close(self) -> None:
+        closed.append(self.model)
+
+
+def _install_fake_client(answers: dict[str, dict]) -> None:
+    """Answer each model with a fixed JSON object."""
+    calls.clear()
+    closed.clear()
+
+    async def create(model: str, messages: list[dict], stream: bool = False, **kwargs):
+        calls[model] = calls.get(model, 0) + 1
+        content = json.dumps(answers[model])
+        if stream:
+            return _FakeStream(model, content)
+        return SimpleNamespace(
+            usage=None,
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        )
+
+    gpt.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_routes_resolve_to_models() -> None:
+    assert model_tiers.route('grade_translation') == model_tiers.FAST
+    assert model_tiers.route('generate_vocab_list') == model_tiers.LARGE
+    assert model_tiers.route('not_configured') == model_tiers.LARGE
+    assert model_tiers.model_for(model_tiers.FAST) == model_tiers.MODEL_FAST
+    assert model_tiers.model_for('some-model') == 'some-model'
+
+
+def test_usage_is_recorded_per_model() -> None:
+    model_tiers.stats.clear()
+    usage = SimpleNamespace(prompt_tokens=1_000_000, completion_tokens=500_000)
+    model_tiers.record('grade_build', 'gpt-5-mini', 0.5, usage)
+    model_tiers.record('grade_build', 'gpt-5-mini', 1.5, None)
+    model_tiers.record('grade_build', 'unpriced', 1.0, usage)
+    assert model_tiers.cost('gpt-5-mini', 1_000_000, 500_000) == 0.25 + 1.00
+    assert model_tiers.cost('unpriced', 1, 1) is None
+    assert model_tiers.stats['gpt-5-mini']['calls'] == 2
+    assert model_tiers.stats['gpt-5-mini']['cost'] == 1.25
+    assert model_tiers.summary() == (
+        'gpt-5-mini: 2 calls, 1.00s avg, 1000000+500000 tokens, $1.2500; '
+        'unpriced: 1 calls, 1.00s avg, 1000000+500000 tokens, $0.0000'
+    )
+
+
+def _grade(function: str, student: str | None) -> dict:
+    messages = [{'role': 'system', 'content': 'Grade.'}, {'role': 'user', 'content': 'answer'}]
+    return asyncio.run(gpt._complete_json(function, messages, answer=student))
+
+
+def test_confident_fast_grades_are_kept() -> None:
+    threshold = gpt.ESCALATION_CONFIDENCE
+    _install_fake_client({FAST_MODEL: {'score': 90, 'confidence': threshold}, LARGE_MODEL: {'score': 70}})
+    assert _grade('grade_translation', '답') == {'score': 90}
+    assert calls == {FAST_MODEL: 1}
+
+
+def test_unsure_fast_grades_escalate() -> None:
+    threshold = gpt.ESCALATION_CONFIDENCE
+    for confidence in (threshold - 0.01, None, 'high'):
+        fast = {'score': 90} if confidence is None else {'score': 90, 'confidence': confidence}
+        _install_fake_client({FAST_MODEL: fast, LARGE_MODEL: {'score': 70}})
+        assert _grade('grade_translation', '답') == {'score': 70}
+        assert calls == {FAST_MODEL: 1, LARGE_MODEL: 1}
+
+
+def test_long_answers_and_generation_skip_the_fast_tier() -> None:
+    _install_fake_client({LARGE_MODEL: {'score': 70}})
+    assert _grade('grade_translation', '가' * (gpt.LONG_ANSWER_CHARS + 1)) == {'score': 70}
+    assert _grade('generate_vocab_list', None) == {'score': 70}
+    assert calls == {LARGE_MODEL: 2}
+    # At the limit the fast tier is still tried
+    _install_fake_client({FAST_MODEL: {'score': 90, 'confidence': 1}})
+    assert _grade('grade_translation', '가' * gpt.LONG_ANSWER_CHARS) == {'score': 90}
+
+
+def _stream_grade(student: str) -> list[dict]:
+    async def run() -> list[dict]:
+        return [partial async for partial in gpt.grade_writing_stream('prompt', ['단어'], student)]
+    return asyncio.run(run())
+
+
+def test_short_answers_stream_from_the_fast_tier() -> None:
+    _install_fake_client({FAST_MODEL: {'confidence': 0.95, 'score': 90, 'overall_feedback': 'Good'}})
+    updates = _stream_grade('짧은 답')
+    assert len(updates) > 1
+    # The score is shown before the feedback has been written
+    assert [update for update in updates if update][0] == {'score': 90}
+    assert updates[-1] == {'score': 90, 'overall_feedback': 'Good'}
+    assert all('confidence' not in update for update in updates)
+    assert calls == {FAST_MODEL: 1}
+
+
+def test_unsure_stream_is_followed_by_the_large_tier() -> None:
+    _install_fake_client({
+        FAST_MODEL: {'confidence': 0.2, 'score': 40, 'overall_feedback': 'Hmm'},
+        LARGE_MODEL: {'score': 75, 'overall_feedback': 'Mostly right'},
+    })
+    updates = _stream_grade('짧은 답')
+    # The unsure grade is never shown
+    assert all(update.get('score') != 40 for update in updates)
+    assert updates[-1] == {'score': 75, 'overall_feedback': 'Mostly right'}
+    assert calls == {FAST_MODEL: 1, LARGE_MODEL: 1}
+
+
+def test_fast_stream_waits_for_a_late_confidence() -> None:
+    _install_fake_client({FAST_MODEL: {'score': 90, 'overall_feedback': 'Good', 'confidence': 0.95}})
+    assert _stream_grade('짧은 답') == [{'score': 90, 'overall_feedback': 'Good'}]
+    _install_fake_client({
+        FAST_MODEL: {'score': 40, 'overall_feedback': 'Hmm', 'confidence': 0.2},
+        LARGE_MODEL: {'score': 75, 'overall_feedback': 'Mostly right'},
+    })
+    assert all(update.get('score') != 40 for update in _stream_grade('짧은 답'))
+
+
+def test_long_answers_stream_from_the_large_tier() -> None:
+    _install_fake_client({LARGE_MODEL: {'score': 80, 'overall_feedback': 'Fine'}})
+    updates = _stream_grade('가' * (gpt.LONG_ANSWER_CHARS + 1))
+    assert updates[-1] == {'score': 80, 'overall_feedback': 'Fine'}
+    assert calls == {LARGE_MODEL: 1}
+
+
+def test_cancelled_stream_is_closed() -> None:
+    _install_fake_client({FAST_MODEL: {'confidence': 1, 'score': 90, 'overall_feedback': 'x' * 200}})
+
+    async def run() -> None:
+        async def consume() -> None:
+            async for _ in gpt.grade_writing_stream('prompt', ['단어'], '짧은 답'):
+                pass
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert closed == [FAST_MODEL]
+
+
+if __name__ == '__main__':
+    test_routes_resolve_to_models()
+    test_usage_is_recorded_per_model()
+    test_confident_fast_grades_are_kept()
+    test_unsure_fast_grades_escalate()
+    test_long_answers_and_generation_skip_the_fast_tier()
+    test_short_answers_stream_from_the_fast_tier()
+    test_unsure_stream_is_followed_by_the_large_tier()
+    test_fast_stream_waits_for_a_late_confidence()
+    test_long_answers_stream_from_the_large_tier()
+    test_cancelled_stream_is_closed()
+    print('All model tier tests passed')
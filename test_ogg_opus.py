@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test: OggOpusSource passes Opus packets through from a streamed Ogg file."""
+
+import struct
+import sys
+
+sys.path.insert(0, '.')
+
+from ogg_opus import OggOpusSource, packet_duration_ms
+from tts_stream import AudioPipe
+
+# TOC bytes: CELT fullband 20 ms (config 31), one frame / two frames; SILK 60 ms (config 3)
+CELT_20MS = bytes([31 << 3])
+CELT_2X20MS = bytes([31 << 3 | 1])
+SILK_60MS = bytes([3 << 3])
+
+
+def _ogg_page(packets: list[bytes], pagenum: int) -> bytes:
+    """Build one Ogg page (CRC is not checked by the parser)."""
+    segments = []
+    for packet in packets:
+        segments += [255] * (len(packet) // 255) + [len(packet) % 255]
+    header = struct.pack('<4sBBQIIIB', b'OggS', 0, 0, 0, 1, pagenum, 0, len(segments))
+    return header + bytes(segments) + b''.join(packets)
+
+
+def test_packet_duration() -> None:
+    assert packet_duration_ms(CELT_20MS + b'x') == 20.0
+    assert packet_duration_ms(CELT_2X20MS + b'xx') == 40.0
+    assert packet_duration_ms(SILK_60MS + b'x') == 60.0
+    assert packet_duration_ms(bytes([31 << 3 | 3, 3]) + b'xyz') == 60.0
+
+
+def test_packets_pass_through_from_pipe() -> None:
+    audio = [CELT_20MS + bytes([i]) * (300 if i == 1 else 10) for i in range(3)]
+    data = (
+        _ogg_page([b'OpusHead' + b'\0' * 11], 0)
+        + _ogg_page([b'OpusTags' + b'\0' * 8], 1)
+        + _ogg_page(audio, 2)
+    )
+
+    # Arrives in small chunks, as from a streamed HTTP response
+    pipe = AudioPipe('opus')
+    for i in range(0, len(data), 7):
+        pipe.feed(data[i:i + 7])
+    pipe.finish()
+
+    source = OggOpusSource(pipe)
+    assert source.is_opus()
+    assert [source.read() for _ in range(4)] == audio + [b'']
+
+
+if __name__ == '__main__':
+    test_packet_duration()
+    test_packets_pass_through_from_pipe()
+    print('All Ogg Opus tests passed')
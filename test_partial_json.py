@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test: partial_json shows finished fields of a streamed grade as they arrive."""
+
+import json
+import sys
+
+sys.path.insert(0, '.')
+
+from partial_json import PartialJsonParser, parse_partial_json
+
+GRADE = {
+    'score': 85,
+    'corrections': [
+        {'original': '나는 학교 갔어요', 'corrected': '나는 학교에 갔어요', 'explanation': 'Needs "에"'},
+        {'original': '먹었다요', 'corrected': '먹었어요', 'explanation': 'Polite ending'},
+    ],
+    'overall_feedback': 'Good work \\ keep going é',
+    'passed': True,
+}
+
+
+def _prefixes(text: str) -> list[dict | None]:
+    return [parse_partial_json(text[:i]) for i in range(len(text) + 1)]
+
+
+def test_prefixes_only_show_finished_values() -> None:
+    assert parse_partial_json('') is None
+    assert parse_partial_json('{') == {}
+    assert parse_partial_json('{"score": 8') == {}
+    assert parse_partial_json('{"score": 85') == {}
+    assert parse_partial_json('{"score": 85,') == {'score': 85}
+    assert parse_partial_json('{"score": 85, "passed": tr') == {'score': 85}
+    # Finished array items appear, unfinished nested objects do not
+    assert parse_partial_json('{"corrections": [{"a": 1}, {"a": 2') == {'corrections': [{'a': 1}]}
+    # A top-level string is shown as it is written
+    assert parse_partial_json('{"overall_feedback": "Goo') == {'overall_feedback': 'Goo'}
+    assert parse_partial_json('{"overall_feedback": "say \\"hi') == {'overall_feedback': 'say "hi'}
+
+
+def test_fields_never_disappear_while_streaming() -> None:
+    for text in (json.dumps(GRADE), json.dumps(GRADE, ensure_ascii=False, indent=2)):
+        previous: dict = {}
+        for partial in _prefixes(text):
+            if partial is None:
+                continue
+            assert set(previous) <= set(partial), (previous, partial)
+            previous = partial
+        assert previous == GRADE
+
+
+def test_parser_matches_whole_prefix_parsing() -> None:
+    text = json.dumps(GRADE)
+    parser = PartialJsonParser()
+    for i in range(0, len(text), 3):
+        assert parser.feed(text[i:i + 3]) == parse_partial_json(text[:i + 3])
+    assert parser.text == text
+
+
+def test_text_around_the_object_is_ignored() -> None:
+    assert parse_partial_json('```json\n{"score": 1}\n```') == {'score': 1}
+
+
+if __name__ == '__main__':
+    test_prefixes_only_show_finished_values()
+    test_fields_never_disappear_while_streaming()
+    test_parser_matches_whole_prefix_parsing()
+    test_text_around_the_object_is_ignored()
+    print('All partial JSON tests passed')
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test: SpeechDebouncer merges bursts per user within its window, delay and length caps."""
+
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+import speech_debounce
+from speech_debounce import SpeechDebouncer, join_messages
+
+
+def _configure(window: float, max_delay: float, max_chars: int) -> None:
+    speech_debounce.TTS_DEBOUNCE_WINDOW = window
+    speech_debounce.TTS_DEBOUNCE_MAX_DELAY = max_delay
+    speech_debounce.TTS_DEBOUNCE_MAX_CHARS = max_chars
+
+
+def _run(steps) -> tuple[list[str], dict]:
+    """Feed (delay, user, text) steps and collect what is spoken."""
+    spoken: list[str] = []
+
+    async def speak(text: str) -> None:
+        spoken.append(text)
+
+    async def run() -> dict:
+        debouncer = SpeechDebouncer()
+        for delay, user_id, text in steps:
+            await asyncio.sleep(delay)
+            debouncer.add(user_id, text, speak)
+        await asyncio.sleep(0.3)
+        return debouncer.stats
+
+    return spoken, asyncio.run(run())
+
+
+def test_join_adds_pauses() -> None:
+    assert join_messages(['hey', 'what?', ' ', 'ok!']) == 'hey. what? ok!'
+
+
+def test_burst_is_spoken_once_after_quiet_window() -> None:
+    _configure(window=0.05, max_delay=1.0, max_chars=400)
+    spoken, stats = _run([(0, 1, 'one'), (0.01, 1, 'two'), (0.01, 2, 'other'), (0.01, 1, 'three')])
+    assert sorted(spoken) == ['one. two. three.', 'other.']
+    assert stats == {'messages': 4, 'utterances': 2}
+
+
+def test_summary_reports_messages_per_utterance() -> None:
+    debouncer = SpeechDebouncer()
+    assert debouncer.summary() == '0 messages in 0 utterances (0.00 per utterance)'
+    debouncer.stats.update(messages=5, utterances=2)
+    assert debouncer.summary() == '5 messages in 2 utterances (2.50 per utterance)'
+
+
+def test_max_delay_and_length_bound_a_burst() -> None:
+    # Messages every 30 ms never leave a quiet window, so max_delay cuts the burst
+    _configure(window=0.05, max_delay=0.1, max_chars=400)
+    spoken, _ = _run([(0.03 if i else 0, 1, str(i)) for i in range(6)])
+    assert 1 < len(spoken) < 6 and ' '.join(spoken) == '0. 1. 2. 3. 4. 5.'
+
+    _configure(window=0.05, max_delay=1.0, max_chars=10)
+    spoken, _ = _run([(0, 1, 'aaaa'), (0, 1, 'bbbb'), (0, 1, 'cccc')])
+    assert spoken == ['aaaa. bbbb.', 'cccc.']
+
+
+if __name__ == '__main__':
+    test_join_adds_pauses()
+    test_burst_is_spoken_once_after_quiet_window()
+    test_summary_reports_messages_per_utterance()
+    test_max_delay_and_length_bound_a_burst()
+    print('All speech debounce tests passed')
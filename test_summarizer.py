@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Test: summarizer splits long threads into cached chunk summaries and combines them."""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, '.')
+# The OpenAI client is constructed at import time and refuses an empty key
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+import oai
+import summarizer
+from state import MessageDict
+
+# Prompt instruction -> texts sent with it
+requests: dict[str, list[str]] = {}
+peak: list[int] = []
+_active: list[int] = [0]
+
+
+async def _fake_gpt(text: str) -> str:
+    prompt, body = text.split('\n\n', 1)
+    requests.setdefault(prompt, []).append(body)
+    _active[0] += 1
+    peak.append(_active[0])
+    await asyncio.sleep(0.01)
+    _active[0] -= 1
+    if prompt == summarizer.REDUCE_PROMPT:
+        return f'[{" + ".join(body.split(chr(10) * 2))}]'
+    ids = [line.split(': ', 1)[1] for line in body.split('\n\n')]
+    return f'{ids[0]}-{ids[-1]}'
+
+
+oai.call_gpt_single_async = _fake_gpt
+
+
+def _thread(count: int) -> list[MessageDict]:
+    return [
+        MessageDict(message_id=i, channel_id=1, reference_id=None, name='u', text=f'{i:02d}')
+        for i in range(count)
+    ]
+
+
+def _summarize(messages: list[MessageDict]) -> str:
+    requests.clear()
+    peak.clear()
+    return asyncio.run(summarizer.summarize_thread(messages))
+
+
+def test_chunks_keep_their_boundaries_as_the_thread_grows() -> None:
+    # 'u: NN' is 2 tokens, so three messages fit in 6
+    before = summarizer.chunk_messages(_thread(7), 6)
+    after = summarizer.chunk_messages(_thread(11), 6)
+    assert [len(chunk) for chunk in before] == [3, 3, 1]
+    assert [len(chunk) for chunk in after] == [3, 3, 3, 2]
+    assert after[:2] == before[:2]
+    # A message over budget gets a chunk of its own
+    assert len(summarizer.chunk_messages(_thread(2), 1)) == 2
+
+
+def test_short_threads_are_summarized_in_one_request() -> None:
+    summarizer._chunk_summaries.clear()
+    assert _summarize(_thread(3)) == '00-02'
+    assert list(requests) == [summarizer.SUMMARY_PROMPT]
+
+
+def test_long_threads_are_chunked_then_combined_in_order() -> None:
+    default_tokens, default_slots = summarizer.SUMMARY_CHUNK_TOKENS, summarizer.MAX_CONCURRENT_SUMMARY_CHUNKS
+    summarizer.SUMMARY_CHUNK_TOKENS = 6
+    summarizer.MAX_CONCURRENT_SUMMARY_CHUNKS = 2
+    summarizer._chunk_summaries.clear()
+    try:
+        # Chunk summaries are combined in thread order (in two groups, as they exceed the budget)
+        assert _summarize(_thread(11)) == '[[00-02 + 03-05 + 06-08] + [09-10]]'
+        assert len(requests[summarizer.CHUNK_PROMPT]) == 4
+        assert max(peak) == 2
+
+        # After the thread grows only the changed last chunk and the new one are sent
+        assert _summarize(_thread(14)) == '[[00-02 + 03-05 + 06-08] + [09-11 + 12-13]]'
+        assert requests[summarizer.CHUNK_PROMPT] == ['u: 09\n\nu: 10\n\nu: 11', 'u: 12\n\nu: 13']
+    finally:
+        summarizer.SUMMARY_CHUNK_TOKENS = default_tokens
+        summarizer.MAX_CONCURRENT_SUMMARY_CHUNKS = default_slots
+
+
+def test_reduce_combines_in_rounds_when_summaries_do_not_fit() -> None:
+    default_tokens = summarizer.SUMMARY_CHUNK_TOKENS
+    summarizer.SUMMARY_CHUNK_TOKENS = 2
+    try:
+        requests.clear()
+        slots = asyncio.Semaphore(4)
+        combined = asyncio.run(summarizer._reduce(['a', 'b', 'c', 'd', 'e'], slots))
+    finally:
+        summarizer.SUMMARY_CHUNK_TOKENS = default_tokens
+    # At least two summaries per group, so each round shrinks the list
+    assert combined == '[[[a + b] + [c + d]] + [[e]]]'
+    assert len(requests[summarizer.REDUCE_PROMPT]) == 6
+
+
+if __name__ == '__main__':
+    test_chunks_keep_their_boundaries_as_the_thread_grows()
+    test_short_threads_are_summarized_in_one_request()
+    test_long_threads_are_chunked_then_combined_in_order()
+    test_reduce_combines_in_rounds_when_summaries_do_not_fit()
+    print('All summarizer tests passed')
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Test: tts_cache serves repeated audio without resynthesizing and bounds disk use."""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, '.')
+
+import tts_cache
+import tts_stream
+
+
+def _use_dir(path: str, max_bytes: int = 1024 * 1024) -> None:
+    """Point the cache at an empty directory with a fresh index."""
+    tts_cache.TTS_CACHE_DIR = path
+    tts_cache.TTS_CACHE_MAX_BYTES = max_bytes
+    tts_cache._disk = None
+    tts_cache._disk_bytes = 0
+    tts_cache.clear_memory()
+
+
+def test_repeated_text_is_synthesized_once() -> None:
+    calls = []
+
+    async def synthesize() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b'audio'
+
+    async def run() -> list:
+        key = tts_cache.make_key('model', 'onyx', False, 'Hello   there')
+        same = tts_cache.make_key('model', 'onyx', False, 'Hello there')
+        assert key == same
+        assert key != tts_cache.make_key('model', 'nova', False, 'Hello there')
+
+        first = await asyncio.gather(*(tts_cache.cached(key, synthesize) for _ in range(3)))
+        second = await tts_cache.cached(key, synthesize)
+        return first + [second]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_dir(tmp)
+        assert asyncio.run(run()) == [b'audio'] * 4
+        assert len(calls) == 1
+
+        # A restart keeps the disk copy
+        tts_cache.clear_memory()
+        tts_cache._disk = None
+        key = tts_cache.make_key('model', 'onyx', False, 'Hello there')
+        assert asyncio.run(tts_cache.get(key)) == b'audio'
+        assert tts_cache.stats['disk_hits'] == 1
+        assert len(calls) == 1
+
+
+def test_waiters_survive_a_cancelled_synthesis() -> None:
+    calls = []
+
+    async def synthesize() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return b'audio'
+
+    async def run() -> list:
+        key = tts_cache.make_key('model', 'onyx', False, 'cancelled')
+        owner = asyncio.create_task(tts_cache.cached(key, synthesize))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(tts_cache.cached(key, synthesize)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        return await asyncio.gather(*waiters)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_dir(tmp)
+        # One waiter takes over the synthesis, the other waits for it
+        assert asyncio.run(run()) == [b'audio', b'audio']
+        assert len(calls) == 2
+
+
+def test_disk_evicts_least_recently_used() -> None:
+    async def run() -> None:
+        await tts_cache.put('a', b'x' * 40)
+        await tts_cache.put('b', b'x' * 40)
+        tts_cache.clear_memory()
+        assert await tts_cache.get('a') is not None  # read from disk, now most recent
+        await tts_cache.put('c', b'x' * 40)  # evicts 'b'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_dir(tmp, max_bytes=100)
+        asyncio.run(run())
+        assert sorted(os.listdir(tmp)) == ['a.audio', 'c.audio']
+        assert tts_cache._disk_bytes == 80
+
+
+def test_stream_plays_while_downloading_then_caches() -> None:
+    async def chunks():
+        for part in (b'ab', b'cde', b'f'):
+            await asyncio.sleep(0.01)
+            yield part
+
+    async def run() -> tuple:
+        pipe = await tts_stream.open_speech('streamed', chunks)
+        # The player reads from a worker thread, a few bytes at a time
+        read = await asyncio.to_thread(lambda: b''.join(iter(lambda: pipe.read(2), b'')))
+        await asyncio.gather(*tts_stream._downloads)
+        cached = await tts_cache.get('streamed')
+        replay = await tts_stream.open_speech('streamed', chunks)
+        return read, cached, replay.read()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_dir(tmp)
+        assert asyncio.run(run()) == (b'abcdef', b'abcdef', b'abcdef')
+
+
+def test_aborting_before_the_download_starts_ends_the_stream() -> None:
+    async def chunks():
+        yield b'never'
+
+    async def run() -> tuple:
+        pipe = await tts_stream.open_speech('aborted', chunks)
+        # Cancelled before its first step, so the download never finishes the pipe itself
+        pipe.abort()
+        read = await asyncio.wait_for(asyncio.to_thread(pipe.read), 1)
+        await asyncio.gather(*tts_stream._downloads, return_exceptions=True)
+        await asyncio.wait_for(pipe.wait_ready(), 1)
+        return read, pipe.read(), await tts_cache.get('aborted')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_dir(tmp)
+        assert asyncio.run(run()) == (b'', b'', None)
+
+
+def test_stream_downloads_are_capped() -> None:
+    active = []
+    peak = []
+
+    def stream(part: bytes):
+        async def chunks():
+            active.append(part)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(part)
+            yield part
+        return chunks
+
+    async def run() -> list[bytes]:
+        pipes = [await tts_stream.open_speech(f'part-{i}', stream(bytes([i]))) for i in range(5)]
+        await asyncio.gather(*tts_stream._downloads)
+        return [pipe.read() for pipe in pipes]
+
+    default_cap = tts_stream.TTS_MAX_CONCURRENT_SYNTHESES
+    tts_stream.TTS_MAX_CONCURRENT_SYNTHESES = 2
+    tts_stream._slots = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _use_dir(tmp)
+            assert asyncio.run(run()) == [bytes([i]) for i in range(5)]
+    finally:
+        tts_stream.TTS_MAX_CONCURRENT_SYNTHESES = default_cap
+        tts_stream._slots = None
+    assert max(peak) == 2
+
+
+if __name__ == '__main__':
+    test_repeated_text_is_synthesized_once()
+    test_waiters_survive_a_cancelled_synthesis()
+    test_disk_evicts_least_recently_used()
+    test_stream_plays_while_downloading_then_caches()
+    test_aborting_before_the_download_starts_ends_the_stream()
+    test_stream_downloads_are_capped()
+    print('All TTS cache tests passed')
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test: tts_chunks splits long text on sentence boundaries, including Korean endings."""
+
+import sys
+
+sys.path.insert(0, '.')
+
+from tts_chunks import chunk_text, split_sentences
+
+
+def test_split_sentences() -> None:
+    assert split_sentences('Hi there! How are you? "Fine."\nBye') == [
+        'Hi there!', 'How are you?', '"Fine."', 'Bye'
+    ]
+    assert split_sentences('3.5 is a number. Yes') == ['3.5 is a number.', 'Yes']
+    # Korean sentences often end without punctuation in chat
+    assert split_sentences('오늘 날씨가 좋네요 산책 갈까요 저는 집에 있었다') == [
+        '오늘 날씨가 좋네요', '산책 갈까요', '저는 집에 있었다'
+    ]
+    assert split_sentences('안녕하세요. 반갑습니다!') == ['안녕하세요.', '반갑습니다!']
+    assert split_sentences('내일 가겠습니다 괜찮죠 어제 했다 그럼') == [
+        '내일 가겠습니다', '괜찮죠', '어제 했다', '그럼'
+    ]
+    # Nouns, particles and interjections ending in 다, 네 or 까 are not sentence ends
+    assert split_sentences('바다 정말 넓네요 네 맞아요') == ['바다 정말 넓네요', '네 맞아요']
+    assert split_sentences('어디까 갈 거예요') == ['어디까 갈 거예요']
+    assert split_sentences('그네 타기가 바다 보다 좋아') == ['그네 타기가 바다 보다 좋아']
+
+
+def test_short_text_is_one_chunk() -> None:
+    assert chunk_text('  Hello there.  ', max_chars=50, first_chars=20) == ['Hello there.']
+    assert chunk_text('   ') == []
+
+
+def test_chunks_pack_sentences_with_a_short_first_chunk() -> None:
+    text = ' '.join(f'Sentence number {i}.' for i in range(10))
+    chunks = chunk_text(text, max_chars=60, first_chars=25)
+    assert chunks[0] == 'Sentence number 0.'
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert ' '.join(chunks) == text
+
+
+def test_long_sentence_is_cut_at_clause_or_space() -> None:
+    text = 'first part of it, second part of it, third part without any break at all here'
+    chunks = chunk_text(text, max_chars=40, first_chars=20)
+    assert chunks[0] == 'first part of it,'
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert ' '.join(chunks) == text
+
+
+if __name__ == '__main__':
+    test_split_sentences()
+    test_short_text_is_one_chunk()
+    test_chunks_pack_sentences_with_a_short_first_chunk()
+    test_long_sentence_is_cut_at_clause_or_space()
+    print('All TTS chunk tests passed')
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Test: voice.GuildPlayer plays clips in order, prepares ahead and drops when full."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from types import SimpleNamespace
+
+sys.path.insert(0, '.')
+
+import discord
+
+import tts_cache
+import tts_stream
+import voice
+
+events: list[str] = []
+
+
+class _FakeSource:
+    def __init__(self, source, **kwargs):
+        self.source = source
+
+
+class _FakeVoiceClient:
+    def __init__(self, channel):
+        self.channel = channel
+        self.playing = False
+
+    def is_connected(self) -> bool:
+        return True
+
+    def is_playing(self) -> bool:
+        return self.playing
+
+    async def move_to(self, channel) -> None:
+        self.channel = channel
+
+    def play(self, source, after) -> None:
+        events.append(f'play {source.source}')
+        self.playing = True
+
+        def finish() -> None:
+            self.playing = False
+            after(None)
+
+        # The real player calls after() from its own thread
+        threading.Timer(0.05, finish).start()
+
+    def stop(self) -> None:
+        self.playing = False
+
+    async def disconnect(self, force: bool = False) -> None:
+        events.append('disconnect')
+        self.guild.voice_client = None
+
+
+class _FakeGuild:
+    id = 1
+
+    def __init__(self):
+        self.voice_client = _FakeVoiceClient('general')
+        self.voice_client.guild = self
+
+
+def _run_player(run) -> object:
+    """Run a coroutine with FFmpeg replaced by a source that records its input."""
+    ffmpeg = discord.FFmpegPCMAudio
+    discord.FFmpegPCMAudio = _FakeSource
+    try:
+        return asyncio.run(run())
+    finally:
+        discord.FFmpegPCMAudio = ffmpeg
+
+
+def _prepare(name: str):
+    async def prepare() -> str:
+        events.append(f'prepare {name}')
+        await asyncio.sleep(0.01)
+        return name
+    return prepare
+
+
+def test_clips_play_in_order_and_prepare_ahead() -> None:
+    events.clear()
+
+    async def run() -> None:
+        player = voice.GuildPlayer(_FakeGuild())
+        for name in ('a', 'b', 'c'):
+            assert player.enqueue('general', _prepare(name))
+        await player._task
+
+    _run_player(run)
+    # Every clip is prepared before the first one finishes playing
+    assert events == ['prepare a', 'prepare b', 'prepare c', 'play a', 'play b', 'play c']
+
+
+def test_clip_parts_play_in_order_as_each_is_ready() -> None:
+    events.clear()
+
+    def part(name: str, delay: float):
+        async def prepare() -> str:
+            await asyncio.sleep(delay)
+            events.append(f'ready {name}')
+            return name
+        return prepare
+
+    async def run() -> None:
+        player = voice.GuildPlayer(_FakeGuild())
+        # The second part is ready first but still plays second
+        assert player.enqueue('general', part('1', 0.03), part('2', 0.01), part('3', 0.2))
+        await player._task
+
+    _run_player(run)
+    assert events == ['ready 2', 'ready 1', 'play 1', 'play 2', 'ready 3', 'play 3']
+
+
+def test_full_queue_drops_oldest_waiting_clip() -> None:
+    events.clear()
+
+    async def run() -> int:
+        player = voice.GuildPlayer(_FakeGuild())
+        for name in ('a', 'b', 'c', 'd', 'e', 'f', 'g'):
+            player.enqueue('general', _prepare(name))
+            await asyncio.sleep(0)
+        await player._task
+        return player.dropped
+
+    default_depth = voice.VOICE_QUEUE_DEPTH
+    voice.VOICE_QUEUE_DEPTH = 3
+    try:
+        dropped = _run_player(run)
+    finally:
+        voice.VOICE_QUEUE_DEPTH = default_depth
+    played = [event for event in events if event.startswith('play')]
+    assert played == ['play a', 'play e', 'play f', 'play g']
+    assert dropped == 3
+
+
+def test_connection_is_kept_until_idle() -> None:
+    events.clear()
+
+    async def run() -> None:
+        guild = _FakeGuild()
+        player = voice.GuildPlayer(guild)
+        player.enqueue('general', _prepare('a'))
+        await player._task
+        player.enqueue('general', _prepare('b'))
+        await player._task
+        await player._idle
+
+    default_timeout = voice.VOICE_IDLE_TIMEOUT
+    voice.VOICE_IDLE_TIMEOUT = 0.05
+    reuses = voice.connection_stats['reuses']
+    try:
+        _run_player(run)
+    finally:
+        voice.VOICE_IDLE_TIMEOUT = default_timeout
+    assert events == ['prepare a', 'play a', 'prepare b', 'play b', 'disconnect']
+    assert voice.connection_stats['reuses'] == reuses + 2
+
+
+def test_connection_summary_is_logged_periodically() -> None:
+    logged = []
+    default_logger, default_stats = voice.logger, dict(voice.connection_stats)
+    voice.logger = SimpleNamespace(info=logged.append)
+    voice.connection_stats.update(reuses=0, moves=1, move_seconds=0.5, connects=2, connect_seconds=3.0)
+    try:
+        for _ in range(voice.SUMMARY_INTERVAL - 3):
+            voice.connection_stats['reuses'] += 1
+            voice._log_summary()
+    finally:
+        voice.logger = default_logger
+        summary = voice.connection_summary()
+        voice.connection_stats.update(default_stats)
+    assert summary == f'2 connects, 1.50s avg; 1 moves, 0.50s avg; {voice.SUMMARY_INTERVAL - 3} reused'
+    assert logged == [f'Voice connections: {summary}']
+
+
+def test_streamed_audio_is_prebuffered_before_playing() -> None:
+    events.clear()
+    half = tts_stream.TTS_PREBUFFER_BYTES // 2
+
+    async def run() -> None:
+        player = voice.GuildPlayer(_FakeGuild())
+        pipe = tts_stream.AudioPipe()
+
+        async def prepare() -> tts_stream.AudioPipe:
+            return pipe
+
+        player.enqueue('general', prepare)
+        for _ in range(3):
+            await asyncio.sleep(0.02)
+            events.append('feed')
+            pipe.feed(b'x' * half)
+        pipe.finish()
+        await player._task
+
+    _run_player(run)
+    # Playback starts once the second chunk fills the prebuffer, not on the first
+    assert [event.split()[0] for event in events] == ['feed', 'feed', 'play', 'feed']
+
+
+def test_clearing_aborts_streaming_downloads() -> None:
+    events.clear()
+
+    async def endless():
+        while True:
+            yield b'x' * tts_stream.TTS_PREBUFFER_BYTES
+            await asyncio.sleep(0.01)
+
+    async def run() -> list[bool]:
+        player = voice.GuildPlayer(_FakeGuild())
+        pipes = []
+
+        async def prepare(key: str) -> tts_stream.AudioPipe:
+            pipes.append(await tts_stream.open_speech(key, endless))
+            return pipes[-1]
+
+        player.enqueue('general', lambda: prepare('playing'))
+        player.enqueue('general', lambda: prepare('waiting'))
+        await asyncio.sleep(0.03)
+        player.clear()
+        # Let the cancellations land and the stopped clip's player thread finish
+        await asyncio.sleep(0.1)
+        player._cancel_idle()
+        return [pipe.download.cancelled() for pipe in pipes]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tts_cache.TTS_CACHE_DIR = tmp
+        tts_cache._disk = None
+        # Both the playing clip's and the waiting clip's downloads stop
+        assert _run_player(run) == [True, True]
+        assert os.listdir(tmp) == []
+
+
+if __name__ == '__main__':
+    test_clips_play_in_order_and_prepare_ahead()
+    test_clip_parts_play_in_order_as_each_is_ready()
+    test_full_queue_drops_oldest_waiting_clip()
+    test_connection_is_kept_until_idle()
+    test_connection_summary_is_logged_periodically()
+    test_streamed_audio_is_prebuffered_before_playing()
+    test_clearing_aborts_streaming_downloads()
+    print('All voice tests passed')
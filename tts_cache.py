@@ -0,0 +1,308 @@
+"""Content-addressed cache of synthesized speech, in memory and on disk."""
+
+import asyncio
+import hashlib
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable
+
+from config import (
+    logger,
+    TTS_CACHE_DIR,
+    TTS_CACHE_MAX_BYTES,
+    TTS_CACHE_MEMORY_BYTES,
+)
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Cached files hold any format (the format is part of the key)
+_SUFFIX: str = '.audio'
+
+# Log a summary every this many lookups
+SUMMARY_INTERVAL: int = 100
+
+# Key -> audio bytes, most recently used last
+_memory: OrderedDict[str, bytes] = OrderedDict()
+_memory_bytes: int = 0
+
+# Key -> file size of audio on disk, most recently used last (loaded on first use)
+_disk: OrderedDict[str, int] | None = None
+_disk_bytes: int = 0
+
+# Key -> synthesis in progress, so concurrent requests for the same audio share one call
+_pending: dict[str, asyncio.Future] = {}
+
+# Disk work runs on one thread so the index is never mutated concurrently
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts-cache')
+
+stats: dict[str, int] = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for cache lookup.
+
+    Args:
+        text: Text to be spoken
+
+    Returns:
+        NFC-normalized text with whitespace collapsed
+    """
+    text = unicodedata.normalize('NFC', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def make_key(
+    model: str,
+    voice: str,
+    korean_accent: bool,
+    text: str,
+    response_format: str = 'mp3'
+) -> str:
+    """
+    Build a cache key from everything the audio depends on.
+
+    Args:
+        model: TTS model
+        voice: Voice name
+        korean_accent: Whether the Korean accent instruction is used
+        text: Text to be spoken
+        response_format: Audio format ('mp3', 'opus', ...)
+
+    Returns:
+        Hex digest
+    """
+    payload = f'{model}\0{voice}\0{int(korean_accent)}\0{response_format}\0{normalize_text(text)}'
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def path_for(key: str) -> str:
+    """
+    Path of the cached audio file for a key.
+
+    Args:
+        key: Key from make_key
+
+    Returns:
+        File path (the file exists only once the audio is cached)
+    """
+    return os.path.join(TTS_CACHE_DIR, f'{key}{_SUFFIX}')
+
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+
+def _remember(key: str, audio: bytes) -> None:
+    """Insert into the in-memory LRU, evicting the oldest entries past its byte limit."""
+    global _memory_bytes
+    if len(audio) > TTS_CACHE_MEMORY_BYTES:
+        return
+    if key in _memory:
+        _memory.move_to_end(key)
+        return
+    _memory[key] = audio
+    _memory_bytes += len(audio)
+    while _memory_bytes > TTS_CACHE_MEMORY_BYTES:
+        _, evicted = _memory.popitem(last=False)
+        _memory_bytes -= len(evicted)
+
+
+def _load_disk_index() -> OrderedDict[str, int]:
+    """Scan the cache directory once, ordering files by last use (mtime)."""
+    global _disk, _disk_bytes
+    if _disk is None:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        entries = []
+        for entry in os.scandir(TTS_CACHE_DIR):
+            if entry.is_file() and entry.name.endswith(_SUFFIX):
+                info = entry.stat()
+                entries.append((info.st_mtime, entry.name[:-len(_SUFFIX)], info.st_size))
+        entries.sort()
+        _disk = OrderedDict((key, size) for _, key, size in entries)
+        _disk_bytes = sum(_disk.values())
+    return _disk
+
+
+def _read_disk(key: str) -> bytes | None:
+    """Read cached audio from disk and mark it recently used."""
+    disk = _load_disk_index()
+    if key not in disk:
+        return None
+    path = path_for(key)
+    try:
+        with open(path, 'rb') as f:
+            audio = f.read()
+        os.utime(path)
+    except OSError as e:
+        logger.warning(f'TTS cache read failed: {e}')
+        _forget_disk(key)
+        return None
+    disk.move_to_end(key)
+    return audio
+
+
+def _forget_disk(key: str) -> None:
+    """Drop a key from the disk index."""
+    global _disk_bytes
+    size = _disk.pop(key, None) if _disk is not None else None
+    if size is not None:
+        _disk_bytes -= size
+
+
+def _write_disk(key: str, audio: bytes) -> None:
+    """Write audio to disk, then evict least recently used files past the byte limit."""
+    global _disk_bytes
+    disk = _load_disk_index()
+    if key not in disk:
+        path = path_for(key)
+        tmp_path = f'{path}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f'TTS cache write failed: {e}')
+            return
+        disk[key] = len(audio)
+        _disk_bytes += len(audio)
+    else:
+        disk.move_to_end(key)
+
+    while _disk_bytes > TTS_CACHE_MAX_BYTES and len(disk) > 1:
+        evicted, _ = next(iter(disk.items()))
+        try:
+            os.remove(path_for(evicted))
+        except OSError:
+            pass
+        _forget_disk(evicted)
+
+
+async def _run(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
+
+def _count(outcome: str) -> None:
+    stats[outcome] += 1
+    if sum(stats.values()) % SUMMARY_INTERVAL == 0:
+        logger.info(f'TTS cache: {summary()}')
+
+
+async def get(key: str) -> bytes | None:
+    """
+    Look up cached audio.
+
+    Args:
+        key: Key from make_key
+
+    Returns:
+        Audio bytes, or None
+    """
+    audio = _memory.get(key)
+    if audio is not None:
+        _memory.move_to_end(key)
+        _count('memory_hits')
+        return audio
+
+    audio = await _run(_read_disk, key)
+    if audio is not None:
+        _remember(key, audio)
+        _count('disk_hits')
+        return audio
+
+    _count('misses')
+    return None
+
+
+async def put(key: str, audio: bytes) -> None:
+    """
+    Store audio in memory and on disk.
+
+    Args:
+        key: Key from make_key
+        audio: Audio bytes
+    """
+    _remember(key, audio)
+    await _run(_write_disk, key, audio)
+
+
+async def cached(key: str, synthesize: Callable[[], Awaitable[bytes]]) -> bytes:
+    """
+    Return cached audio, synthesizing and storing it on a miss.
+
+    Concurrent misses for the same key wait for a single synthesis. If
+    the caller running it is cancelled, a waiting caller takes over.
+    Failures are not cached.
+
+    Args:
+        key: Key from make_key
+        synthesize: Coroutine function producing the audio
+
+    Returns:
+        Audio bytes
+    """
+    while True:
+        audio = await get(key)
+        if audio is not None:
+            return audio
+
+        pending = _pending.get(key)
+        if pending is None:
+            break
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The synthesizing caller was cancelled, not this one: retry
+
+    future = asyncio.get_running_loop().create_future()
+    _pending[key] = future
+    try:
+        audio = await synthesize()
+        future.set_result(audio)
+        await put(key, audio)
+        return audio
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so a failure nobody else awaited is not logged as unhandled
+        future.exception()
+        raise
+    finally:
+        del _pending[key]
+
+
+def summary() -> str:
+    """
+    Summarize cache effectiveness.
+
+    Returns:
+        Hit rate, lookups and bytes held in memory and on disk
+    """
+    hits = stats['memory_hits'] + stats['disk_hits']
+    lookups = hits + stats['misses']
+    rate = hits / lookups if lookups else 0.0
+    return (
+        f'{rate:.0%} hit rate ({stats["memory_hits"]} memory, {stats["disk_hits"]} disk, '
+        f'{stats["misses"]} misses); {_memory_bytes} bytes in memory, {_disk_bytes} bytes on disk'
+    )
+
+
+def clear_memory() -> None:
+    """Drop all in-memory entries and reset stats (files on disk are kept)."""
+    global _memory_bytes
+    _memory.clear()
+    _memory_bytes = 0
+    stats.update(memory_hits=0, disk_hits=0, misses=0)
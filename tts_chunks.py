@@ -0,0 +1,104 @@
+"""Split long text into sentence-aligned chunks for incremental TTS playback."""
+
+import re
+
+from config import TTS_CHUNK_CHARS, TTS_FIRST_CHUNK_CHARS
+
+# Hangul syllables with a ㅆ final (했, 있, 었, ...), as in past-tense endings
+_SSANG_SIOT_FINAL = ''.join(chr(0xAC00 + block * 28 + 20) for block in range(19 * 21))
+# Korean verb endings that close a sentence in unpunctuated chat: formal -니다/-니까,
+# plain -는다, past -었다/-었네, polite -아요/-네요/-까요/-예요/... and -죠. A bare
+# 다, 네 or 까 is not enough: 바다 and 보다 are nouns/particles and 네 means yes.
+_KOREAN_ENDING = (
+    rf'(?:니다|니까|는다|[{_SSANG_SIOT_FINAL}][다네]'
+    r'|[아어여가나와워봐해돼줘세네까게데래지예에]요|[가-힣]죠)'
+)
+# Sentence end: punctuation (Latin, CJK, ellipsis) with trailing quotes/brackets, a
+# Korean sentence-final verb ending before whitespace, or a line break
+_SENTENCE_END = re.compile(
+    r'[.!?…。！？]+["\'”’)\]]*(?=\s|$)'
+    rf'|{_KOREAN_ENDING}(?=\s)'
+    r'|\n'
+)
+# Places to cut a sentence that is too long on its own, best first
+_CLAUSE_BREAK = re.compile(r'[,;:，、]\s')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def split_sentences(text: str) -> list[str]:
+    """
+    Split text into sentences.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty, stripped sentences in order
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    sentences.append(text[start:])
+    return [s for s in (_WHITESPACE.sub(' ', s).strip() for s in sentences) if s]
+
+
+def _cut(sentence: str, limit: int) -> tuple[str, str]:
+    """Cut an over-long sentence at the last clause break, else space, before limit."""
+    head = sentence[:limit]
+    breaks = list(_CLAUSE_BREAK.finditer(head))
+    if breaks:
+        cut = breaks[-1].end()
+    else:
+        cut = head.rfind(' ') + 1 or limit
+    return sentence[:cut].strip(), sentence[cut:].strip()
+
+
+def chunk_text(
+    text: str,
+    max_chars: int = TTS_CHUNK_CHARS,
+    first_chars: int = TTS_FIRST_CHUNK_CHARS
+) -> list[str]:
+    """
+    Pack sentences into chunks to synthesize separately.
+
+    The first chunk is kept short so its audio is ready quickly; the rest
+    hold as many whole sentences as fit in max_chars. Text that fits in
+    the first chunk is returned unchanged as a single chunk.
+
+    Args:
+        text: Text to speak
+        max_chars: Longest later chunk
+        first_chars: Longest first chunk
+
+    Returns:
+        Chunks in speaking order
+    """
+    text = text.strip()
+    if len(text) <= first_chars:
+        return [text] if text else []
+
+    chunks: list[str] = []
+    current = ''
+    pending = split_sentences(text)
+    while pending:
+        limit = max_chars if chunks else first_chars
+        sentence = pending.pop(0)
+        candidate = f'{current} {sentence}' if current else sentence
+        if len(candidate) <= limit:
+            current = candidate
+            continue
+        if current:
+            chunks.append(current)
+            current = ''
+            pending.insert(0, sentence)
+            continue
+        # A single sentence longer than the limit
+        head, rest = _cut(sentence, limit)
+        chunks.append(head)
+        if rest:
+            pending.insert(0, rest)
+    if current:
+        chunks.append(current)
+    return chunks
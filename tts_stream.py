@@ -0,0 +1,153 @@
+"""Stream synthesized speech into the voice player as it downloads."""
+
+import asyncio
+import queue
+from typing import AsyncIterator, Callable, Optional
+
+from config import logger, TTS_MAX_CONCURRENT_SYNTHESES, TTS_PREBUFFER_BYTES
+import tts_cache
+
+# Background downloads, referenced until they finish so they are not garbage collected
+_downloads: set[asyncio.Task] = set()
+# Created on first use, inside the running event loop
+_slots: Optional[asyncio.Semaphore] = None
+
+
+class AudioPipe:
+    """
+    File-like audio source fed from the event loop and read by the player.
+
+    discord.py's FFmpeg sources (and OggOpusSource) read from a worker
+    thread, so read() blocks until the next chunk arrives and returns b''
+    once the download has finished (or failed).
+
+    The player paces frames from the moment it starts, and a read that
+    blocks is made up for by sending the backlog at once, so playback
+    should wait for wait_ready(): TTS_PREBUFFER_BYTES have arrived, or the
+    stream has ended.
+
+    Attributes:
+        format: Audio format of the stream ('mp3', 'opus', ...)
+        download: Task feeding the pipe, or None when served from the cache
+    """
+
+    def __init__(self, format: str = 'mp3'):
+        self.format = format
+        self.download: Optional[asyncio.Task] = None
+        self._chunks: queue.SimpleQueue[Optional[bytes]] = queue.SimpleQueue()
+        self._buffer = b''
+        self._finished = False
+        # Set on the event loop side once the end marker is queued
+        self._ended = False
+        self._fed = 0
+        self._ready = asyncio.Event()
+
+    def feed(self, data: bytes) -> None:
+        """Append a chunk (event loop side)."""
+        if data and not self._ended:
+            self._chunks.put(data)
+            self._fed += len(data)
+            if self._fed >= TTS_PREBUFFER_BYTES:
+                self._ready.set()
+
+    def finish(self) -> None:
+        """Mark the end of the audio (event loop side); later calls do nothing."""
+        if self._ended:
+            return
+        self._ended = True
+        self._chunks.put(None)
+        self._ready.set()
+
+    async def wait_ready(self) -> None:
+        """Wait until enough audio is buffered to start playback (event loop side)."""
+        await self._ready.wait()
+
+    def abort(self) -> None:
+        """
+        Stop the download feeding the pipe; the audio so far is not cached.
+
+        The pipe is finished at once, so a reader is released even if the
+        download was cancelled before it started.
+        """
+        if self.download is not None:
+            self.download.cancel()
+        self.finish()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to size bytes, blocking until some are available (player thread side).
+
+        Args:
+            size: Maximum bytes to return (-1 for the next chunk)
+
+        Returns:
+            Audio bytes, or b'' at the end of the stream
+        """
+        if not self._buffer and not self._finished:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._finished = True
+            else:
+                self._buffer = chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def _download(key: str, stream: Callable[[], AsyncIterator[bytes]], pipe: AudioPipe) -> None:
+    """
+    Feed a speech stream into a pipe, caching the audio if it completes.
+
+    At most TTS_MAX_CONCURRENT_SYNTHESES downloads run at once; waiting
+    ones start in the order they were opened.
+    """
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(TTS_MAX_CONCURRENT_SYNTHESES)
+
+    parts = []
+    try:
+        async with _slots:
+            async for chunk in stream():
+                parts.append(chunk)
+                pipe.feed(chunk)
+    except Exception as e:
+        logger.exception(f'TTS stream failed after {sum(map(len, parts))} bytes: {e}')
+        return
+    finally:
+        pipe.finish()
+    await tts_cache.put(key, b''.join(parts))
+
+
+async def open_speech(
+    key: str,
+    stream: Callable[[], AsyncIterator[bytes]],
+    format: str = 'mp3'
+) -> AudioPipe:
+    """
+    Open speech audio for playback, from the TTS cache or as it streams in.
+
+    On a cache miss the download runs in the background and playback can
+    start on the first chunk; the complete audio is then cached. The
+    pipe's abort() stops the download.
+
+    Args:
+        key: Key from tts_cache.make_key
+        stream: Async generator function yielding the audio from the API
+        format: Audio format the stream yields
+
+    Returns:
+        Pipe to play with voice.GuildPlayer
+    """
+    pipe = AudioPipe(format)
+    audio = await tts_cache.get(key)
+    if audio is not None:
+        pipe.feed(audio)
+        pipe.finish()
+        return pipe
+
+    pipe.download = asyncio.create_task(_download(key, stream, pipe), name=f'tts-{key[:12]}')
+    _downloads.add(pipe.download)
+    pipe.download.add_done_callback(_downloads.discard)
+    return pipe
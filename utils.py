@@ -1,9 +1,8 @@
 """Utility functions for SpencerBot."""
 
-from typing import Optional
+import re
 from datetime import datetime, timedelta
 import discord
-from discord.ext import commands
 
 from config import (
     logger,
@@ -16,6 +15,9 @@ from config import (
 )
 from state import MessageDict
 
+# User mention token; group 1 is the legacy nickname marker
+_MENTION = re.compile(r'<@(!?)(\d+)>')
+
 
 # ============================================================================
 # FILE I/O UTILITIES
@@ -128,47 +130,38 @@ def format_timedelta(td: timedelta) -> str:
 # ============================================================================
 
 
-def get_users(ctx: commands.Context) -> dict[int, str]:
-    """
-    Get mapping of user IDs to usernames for a guild.
-
-    Args:
-        ctx: Discord command context
-
-    Returns:
-        Dict mapping user ID to username
+def resolve_mentions(text: str, message: discord.Message, member_names: dict[int, str]) -> str:
     """
-    member_list = list(ctx.guild.members)
-    return {member.id: member.name for member in member_list}
+    Replace the user IDs in mention tokens (<@id>, <@!id>) with usernames.
 
-
-def find_message_by_id(
-    all_messages: list[MessageDict],
-    message_id: Optional[int]
-) -> tuple[Optional[int], Optional[MessageDict]]:
-    """
-    Find a message by ID in message history.
+    Names come from the cached member map; a mention missing from it is
+    resolved from the message's own mention list and cached. Cost scales
+    with the number of mentions, not the size of the guild.
 
     Args:
-        all_messages: List of message dictionaries
-        message_id: Message ID to find
+        text: Message text
+        message: Original Discord message
+        member_names: Cached user ID to username map
 
     Returns:
-        Tuple of (index, message) or (None, None) if not found
+        Text with mentioned IDs replaced by names
     """
-    if message_id is None:
-        return None, None
+    def replace(match: re.Match) -> str:
+        user_id = int(match[2])
+        name = member_names.get(user_id)
+        if name is None:
+            for user in message.mentions:
+                member_names[user.id] = user.name
+            name = member_names.get(user_id)
+        return f'<@{match[1]}{name}>' if name is not None else match[0]
 
-    for index, message in enumerate(all_messages):
-        if message['message_id'] == message_id:
-            return index, message
-    return None, None
+    return _MENTION.sub(replace, text)
 
 
 def build_message(
-    ctx: commands.Context,
     message: discord.Message,
-    text: str
+    text: str,
+    member_names: dict[int, str]
 ) -> MessageDict:
     """
     Build a structured message dictionary for storage.
@@ -176,17 +169,15 @@ def build_message(
     Replaces user ID mentions with human-readable names.
 
     Args:
-        ctx: Discord command context
         message: Original Discord message
         text: Processed message text
+        member_names: Cached user ID to username map
 
     Returns:
         Structured message dictionary with metadata
     """
     try:
-        member_map = get_users(ctx)
-        for uid, name in member_map.items():
-            text = text.replace(str(uid), name)
+        text = resolve_mentions(text, message, member_names)
     except Exception as e:
         logger.warning(f"Error replacing user IDs in message: {e}")
 
@@ -197,5 +188,3 @@ def build_message(
         name=message.author.name,
         text=text
     )
-
-
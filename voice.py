@@ -0,0 +1,286 @@
+"""Per-guild voice playback queue for SpencerBot TTS."""
+
+import asyncio
+import io
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, Union
+
+import discord
+
+from ogg_opus import OggOpusSource
+from config import (
+    logger,
+    FFMPEG_PATH,
+    VOICE_QUEUE_DEPTH,
+    VOICE_QUEUE_DROP_POLICY,
+    VOICE_IDLE_TIMEOUT,
+)
+
+# A file path, or a file-like object streamed into FFmpeg
+AudioInput = Union[str, io.BufferedIOBase]
+
+# Reused connections, moves and new connections, with total setup seconds per kind
+connection_stats: dict[str, float] = {
+    'reuses': 0, 'moves': 0, 'move_seconds': 0.0, 'connects': 0, 'connect_seconds': 0.0,
+}
+
+# Log a summary every this many connection requests
+SUMMARY_INTERVAL: int = 50
+
+
+class _Clip:
+    """A queued utterance whose parts are being prepared in the background."""
+
+    __slots__ = ('channel', 'parts')
+
+    def __init__(self, channel: discord.VoiceChannel, parts: list[asyncio.Task]):
+        self.channel = channel
+        self.parts = parts
+
+    def cancel(self) -> None:
+        """Stop preparing the parts, aborting downloads still streaming in."""
+        for part in self.parts:
+            if not part.done():
+                part.cancel()
+            elif not part.cancelled() and part.exception() is None:
+                abort = getattr(part.result(), 'abort', None)
+                if abort is not None:
+                    abort()
+
+
+async def connect(guild: discord.Guild, channel: discord.VoiceChannel) -> discord.VoiceClient:
+    """
+    Get a voice client in channel, reusing the guild's connection when possible.
+
+    An open connection is reused as is, or moved if the channel differs;
+    only a missing or stale connection pays for a new handshake. Setup
+    latency is logged and accumulated in connection_stats.
+
+    Args:
+        guild: Guild to play in
+        channel: Voice channel to be in
+
+    Returns:
+        Connected voice client
+    """
+    voice_client = guild.voice_client
+    if voice_client is not None and voice_client.is_connected():
+        if voice_client.channel == channel:
+            connection_stats['reuses'] += 1
+            _log_summary()
+            return voice_client
+        start = time.perf_counter()
+        await voice_client.move_to(channel)
+        _record_setup('move', time.perf_counter() - start, channel)
+        return voice_client
+
+    # Clean up a stale connection
+    if voice_client is not None:
+        await voice_client.disconnect(force=True)
+
+    start = time.perf_counter()
+    voice_client = await channel.connect(self_deaf=True, timeout=30.0)
+    _record_setup('connect', time.perf_counter() - start, channel)
+    return voice_client
+
+
+def _record_setup(kind: str, elapsed: float, channel: discord.VoiceChannel) -> None:
+    """Record the latency of a connect or move."""
+    connection_stats[f'{kind}s'] += 1
+    connection_stats[f'{kind}_seconds'] += elapsed
+    logger.info(f'Voice {kind} to {channel} took {elapsed:.2f}s')
+    _log_summary()
+
+
+def _log_summary() -> None:
+    requests = sum(connection_stats[key] for key in ('reuses', 'moves', 'connects'))
+    if requests % SUMMARY_INTERVAL == 0:
+        logger.info(f'Voice connections: {connection_summary()}')
+
+
+def connection_summary() -> str:
+    """
+    Summarize voice connection setup.
+
+    Returns:
+        Counts and mean latency of connects and moves, and reused connections
+    """
+    parts = []
+    for kind in ('connect', 'move'):
+        count = int(connection_stats[f'{kind}s'])
+        if count:
+            parts.append(f'{count} {kind}s, {connection_stats[f"{kind}_seconds"] / count:.2f}s avg')
+    parts.append(f'{int(connection_stats["reuses"])} reused')
+    return '; '.join(parts)
+
+
+class GuildPlayer:
+    """
+    Plays clips in one guild in order, one at a time.
+
+    Each clip's audio starts preparing as soon as it is queued, so later
+    clips are synthesized while earlier ones play. A clip may have several
+    parts (e.g. the sentences of a long text); they play back to back, and
+    the first starts as soon as its own audio is ready. At most
+    VOICE_QUEUE_DEPTH clips wait behind the one playing; when the queue is
+    full, VOICE_QUEUE_DROP_POLICY decides whether the oldest waiting clip
+    ('oldest') or the new one ('newest') is dropped.
+
+    The voice connection stays open between clips and is closed after
+    VOICE_IDLE_TIMEOUT seconds without playback.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        self.queue: deque[_Clip] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._idle: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def enqueue(
+        self,
+        channel: discord.VoiceChannel,
+        *parts: Callable[[], Awaitable[AudioInput]]
+    ) -> bool:
+        """
+        Queue a clip and start preparing its audio.
+
+        Args:
+            channel: Voice channel to play it in
+            *parts: Coroutine functions returning the audio of each part, in order
+
+        Returns:
+            False if the clip was dropped because the queue is full (or has no parts)
+        """
+        if not parts:
+            return False
+        if len(self.queue) >= VOICE_QUEUE_DEPTH:
+            self.dropped += 1
+            if VOICE_QUEUE_DROP_POLICY == 'newest':
+                logger.info(
+                    f'Voice queue full in guild {self.guild.id}, dropping new clip '
+                    f'({self.dropped} dropped so far)'
+                )
+                return False
+            logger.info(
+                f'Voice queue full in guild {self.guild.id}, dropping oldest clip '
+                f'({self.dropped} dropped so far)'
+            )
+            self.queue.popleft().cancel()
+
+        self.queue.append(_Clip(channel, [asyncio.create_task(prepare()) for prepare in parts]))
+        self._cancel_idle()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._play_all(), name=f'voice-{self.guild.id}')
+        return True
+
+    def clear(self) -> None:
+        """Drop waiting clips and stop the current one, keeping the connection."""
+        while self.queue:
+            self.queue.popleft().cancel()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        voice_client = self.guild.voice_client
+        if voice_client is not None and voice_client.is_playing():
+            voice_client.stop()
+        self._start_idle()
+
+    def close(self) -> None:
+        """Clear the queue and forget the idle timer (the caller disconnects)."""
+        self.clear()
+        self._cancel_idle()
+
+    def _cancel_idle(self) -> None:
+        if self._idle is not None:
+            self._idle.cancel()
+            self._idle = None
+
+    def _start_idle(self) -> None:
+        self._cancel_idle()
+        self._idle = asyncio.create_task(self._disconnect_when_idle(), name=f'voice-idle-{self.guild.id}')
+
+    async def _disconnect_when_idle(self) -> None:
+        """Disconnect once the guild has had no playback for VOICE_IDLE_TIMEOUT."""
+        await asyncio.sleep(VOICE_IDLE_TIMEOUT)
+        self._idle = None
+        voice_client = self.guild.voice_client
+        if voice_client is not None and not self.queue and not voice_client.is_playing():
+            logger.info(f'Voice idle for {VOICE_IDLE_TIMEOUT}s in guild {self.guild.id}, disconnecting')
+            await voice_client.disconnect()
+
+    async def _play_all(self) -> None:
+        """Play queued clips until the queue is empty."""
+        while self.queue:
+            clip = self.queue.popleft()
+            try:
+                # Connecting overlaps with the clip's synthesis
+                voice_client = await connect(self.guild, clip.channel)
+                for part in clip.parts:
+                    await self._play(voice_client, await part)
+            except asyncio.CancelledError:
+                clip.cancel()
+                raise
+            except Exception as e:
+                clip.cancel()
+                logger.exception(f'Voice playback failed in guild {self.guild.id}: {e}')
+        self._start_idle()
+
+    async def _play(self, voice_client: discord.VoiceClient, audio: AudioInput) -> None:
+        """Play one clip and wait for it to finish."""
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+
+        def after(error: Optional[Exception]) -> None:
+            if error is not None:
+                logger.error(f'Voice player error in guild {self.guild.id}: {error}')
+            loop.call_soon_threadsafe(finished.set)
+
+        # Streamed audio is prebuffered so the player's pacing starts with data in hand
+        wait_ready = getattr(audio, 'wait_ready', None)
+        if wait_ready is not None:
+            await wait_ready()
+        source = _audio_source(audio)
+        voice_client.play(source, after=after)
+        await finished.wait()
+
+
+def _audio_source(audio: AudioInput) -> discord.AudioSource:
+    """
+    Build the player source for audio: Opus streams pass straight through,
+    anything else is decoded by FFmpeg (and re-encoded by discord.py).
+
+    Args:
+        audio: File path or file-like stream (with a format attribute)
+
+    Returns:
+        Audio source for VoiceClient.play
+    """
+    if getattr(audio, 'format', None) == 'opus':
+        return OggOpusSource(audio)
+    return discord.FFmpegPCMAudio(
+        source=audio,
+        executable=FFMPEG_PATH or 'ffmpeg',
+        pipe=not isinstance(audio, str)
+    )
+
+
+# Guild ID -> player
+_players: dict[int, GuildPlayer] = {}
+
+
+def player_for(guild: discord.Guild) -> GuildPlayer:
+    """
+    Get the playback queue for a guild, creating it if needed.
+
+    Args:
+        guild: Discord guild
+
+    Returns:
+        The guild's player
+    """
+    player = _players.get(guild.id)
+    if player is None:
+        player = _players[guild.id] = GuildPlayer(guild)
+    return player